@@ -1,8 +1,24 @@
 __version__ = "0.4.3"
 
+from .cache import *
 from .client import *
+from .codec import *
+from .columnar import *
+from .decoder import *
+from .evaluate import *
 from .exceptions import *
+from .exporter import *
+from .lazy import *
+from .loader import *
+from .metrics import *
+from .mirror import *
 from .models import *
+from .optimize import *
 from .paginator import *
+from .planner import *
+from .pool import *
 from .query import *
+from .ratelimit import *
+from .retry import *
+from .stream import *
 from .utils import *
@@ -0,0 +1,293 @@
+import sqlite3
+import time
+import typing as t
+from collections import OrderedDict
+
+from azaka.query import Query
+
+__all__ = ("CacheBackend", "MemoryBackend", "SQLiteBackend", "ResponseCache")
+
+
+class CacheBackend(t.Protocol):
+    """
+    Protocol of the storage used by [ResponseCache](./cache.md#azaka.cache.ResponseCache).
+
+    Backends store the raw JSON body of a response along with its expiry time as a
+    unix timestamp and count the entries they evict to stay within their bounds.
+    """
+
+    evictions: int
+
+    def get(self, key: str) -> t.Optional[tuple[bytes, float]]: ...
+
+    def set(self, key: str, value: bytes, expires: float) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    """
+    In-process LRU backend bounded by number of entries and total size of the stored bodies.
+    """
+
+    __slots__ = ("maxsize", "max_bytes", "evictions", "_entries", "_size")
+
+    def __init__(self, maxsize: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        MemoryBackend constructor.
+
+        Args:
+            maxsize: Maximum number of entries.
+            max_bytes: Maximum total size of the stored bodies in bytes.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Optional[tuple[bytes, float]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: bytes, expires: float) -> None:
+        self.delete(key)
+        self._entries[key] = (value, expires)
+        self._size += len(value)
+        while self._entries and (
+            len(self._entries) > self.maxsize or self._size > self.max_bytes
+        ):
+            _, (old, _) = self._entries.popitem(last=False)
+            self._size -= len(old)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+class SQLiteBackend:
+    """
+    LRU backend persisted in a local SQLite database, shared across processes and restarts.
+
+    Note:
+        The queries run on the calling thread, they are small enough to not stall the
+        event loop noticeably on a local disk.
+
+    Note:
+        The number of entries is counted when the database is opened and tracked from then on,
+        entries written by other processes are only counted on the next open.
+    """
+
+    __slots__ = ("path", "maxsize", "evictions", "_conn", "_count")
+
+    def __init__(self, path: str, maxsize: int = 100_000) -> None:
+        """
+        SQLiteBackend constructor.
+
+        Args:
+            path: Path of the database file.
+            maxsize: Maximum number of entries.
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS azaka_cache ("
+                "key TEXT PRIMARY KEY, value BLOB, expires REAL, accessed REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS azaka_cache_accessed ON azaka_cache(accessed)"
+            )
+        self._count: int = len(self)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM azaka_cache").fetchone()[0]
+
+    def get(self, key: str) -> t.Optional[tuple[bytes, float]]:
+        row = self._conn.execute(
+            "SELECT value, expires FROM azaka_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE azaka_cache SET accessed = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return row
+
+    def set(self, key: str, value: bytes, expires: float) -> None:
+        with self._conn:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO azaka_cache VALUES (?, ?, ?, ?)",
+                (key, value, expires, time.time()),
+            ).rowcount
+            if inserted:
+                self._count += 1
+            else:
+                self._conn.execute(
+                    "UPDATE azaka_cache SET value = ?, expires = ?, accessed = ? WHERE key = ?",
+                    (value, expires, time.time(), key),
+                )
+            excess = self._count - self.maxsize
+            if excess > 0:
+                deleted = self._conn.execute(
+                    "DELETE FROM azaka_cache WHERE key IN "
+                    "(SELECT key FROM azaka_cache ORDER BY accessed LIMIT ?)",
+                    (excess,),
+                ).rowcount
+                self._count -= deleted
+                self.evictions += deleted
+
+    def delete(self, key: str) -> None:
+        with self._conn:
+            self._count -= self._conn.execute(
+                "DELETE FROM azaka_cache WHERE key = ?", (key,)
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM azaka_cache")
+        self._count = 0
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
+
+
+class ResponseCache:
+    """
+    Cache of raw query responses used by [Client.execute](./client.md#azaka.client.Client.execute).
+
+    Entries are keyed by the route and the JSON body of the [Query](./query.md#azaka.query.Query)
+    and store the raw JSON of the response, so a hit skips the network entirely.
+
+    Warning:
+        Responses of some routes (such as `ulist`) depend on the token of the client,
+        don't share a cache between clients with different tokens for those routes.
+
+    Example:
+        ```python
+        cache = ResponseCache(ttl=600, route_ttls={"vn": 60}, backend=SQLiteBackend("azaka.db"))
+        async with Client(cache=cache) as client:
+            ...
+        ```
+
+    Attributes:
+        backend CacheBackend: The storage backend.
+        ttl Optional[float]: Default time to live of the entries in seconds, [None][] never expires them.
+        route_ttls dict[str, Optional[float]]: Time to live overrides per route.
+        hits int: Number of lookups served from the cache.
+        misses int: Number of lookups not found in the cache.
+        expired int: Number of entries dropped because they outlived their time to live.
+    """
+
+    __slots__ = ("backend", "ttl", "route_ttls", "hits", "misses", "expired")
+
+    def __init__(
+        self,
+        backend: t.Optional[CacheBackend] = None,
+        ttl: t.Optional[float] = 300.0,
+        route_ttls: t.Optional[dict[str, t.Optional[float]]] = None,
+    ) -> None:
+        """
+        ResponseCache constructor.
+
+        Args:
+            backend: The storage backend, an in-process [MemoryBackend](./cache.md#azaka.cache.MemoryBackend) by default.
+            ttl: Default time to live of the entries in seconds, [None][] never expires them.
+            route_ttls: Time to live overrides per route.
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.route_ttls = route_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @property
+    def evictions(self) -> int:
+        """
+        Number of entries evicted by the backend to stay within its bounds.
+        """
+        return self.backend.evictions
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Returns a [dict][] of the hit, miss, eviction and expiry counters and the size of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "size": len(self.backend),
+        }
+
+    def key(self, query: Query) -> str:
+        """
+        Returns the cache key of the query.
+        """
+        return f"{query._route}:{query.parse_body}"
+
+    def get(self, query: Query) -> t.Optional[bytes]:
+        """
+        Looks the response of a query up.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            The raw JSON of the response or [None][] on a miss.
+        """
+        key = self.key(query)
+        entry = self.backend.get(key)
+        if entry is not None and entry[1] <= time.time():
+            self.backend.delete(key)
+            self.expired += 1
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, query: Query, raw: bytes) -> None:
+        """
+        Stores the response of a query.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+            raw: The raw JSON of the response.
+        """
+        ttl = self.route_ttls.get(query._route, self.ttl)
+        if ttl is not None and ttl <= 0:
+            return
+        expires = float("inf") if ttl is None else time.time() + ttl
+        self.backend.set(self.key(query), raw, expires)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        self.backend.clear()
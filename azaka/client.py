@@ -1,16 +1,89 @@
+import asyncio
+import contextlib
 import functools
+import time
 import typing as t
+from dataclasses import dataclass
 from types import TracebackType
+from urllib.parse import quote
 
 import aiohttp
 from yarl import URL
 
 from azaka import query
+from azaka.cache import ResponseCache
+from azaka.codec import JSONCodec, get_codec
+from azaka.columnar import ColumnarResponse, ColumnBuilder
+from azaka.decoder import Decoder
 from azaka.exceptions import EXMAP, AzakaException
+from azaka.lazy import build_lazy_objects
+from azaka.metrics import Metrics, Span, route_of
 from azaka.models import AuthInfo, Response, Stats, User
-from azaka.utils import RespT, build_objects
+from azaka.optimize import FilterOptimizer
+from azaka.ratelimit import RETRY_STATUSES, RateLimiter
+from azaka.retry import RetryPolicy
+from azaka.stream import RowStream
+from azaka.utils import build_object, build_objects
 
-__all__ = ("Client",)
+__all__ = ("Client", "PoolConfig")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass
+class PoolConfig:
+    """
+    PoolConfig [dataclasses.dataclass][] containing the connection pool and timeout settings of a [Client](./client.md).
+
+    Attributes:
+        limit int: Maximum number of simultaneous connections, `0` for no limit.
+        limit_per_host int: Maximum number of simultaneous connections to one host, `0` for no limit.
+        keepalive_timeout float: Time in seconds for which an idle connection is kept alive.
+        ttl_dns_cache Optional[int]: Time in seconds for which resolved DNS entries are cached, [None][] caches them forever.
+        total_timeout Optional[float]: Timeout of a whole request in seconds.
+        connect_timeout Optional[float]: Timeout for acquiring a connection from the pool and connecting, in seconds.
+        sock_connect_timeout Optional[float]: Timeout for connecting a socket to the server, in seconds.
+        read_timeout Optional[float]: Timeout for reading a portion of the response body, in seconds.
+
+    Tip:
+        Clients of a multi-tenant process can reuse one pool of sockets by sharing a connector:
+
+        ```python
+        connector = PoolConfig(limit=200).connector()
+        clients = [Client(token, connector=connector) for token in tokens]
+        ```
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: t.Optional[int] = 10
+    total_timeout: t.Optional[float] = 300.0
+    connect_timeout: t.Optional[float] = None
+    sock_connect_timeout: t.Optional[float] = 30.0
+    read_timeout: t.Optional[float] = None
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """
+        Creates an [aiohttp.TCPConnector](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.TCPConnector) with the pool settings.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """
+        Creates an [aiohttp.ClientTimeout](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientTimeout) with the timeout settings.
+        """
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.sock_connect_timeout,
+            sock_read=self.read_timeout,
+        )
 
 
 class Client:
@@ -18,20 +91,97 @@ class Client:
     Client class for interacting with the VNDB API.
     """
 
-    __slots__ = ("cs", "token")
-
-    def __init__(self, token: t.Optional[str] = None) -> None:
+    __slots__ = (
+        "cs",
+        "token",
+        "use_decoders",
+        "lazy_results",
+        "rate_limiter",
+        "cache",
+        "coalesce",
+        "codec",
+        "pool",
+        "connector",
+        "optimizer",
+        "base_url",
+        "metrics",
+        "retry",
+        "_owns_cs",
+        "_schema",
+        "_decoders",
+        "_flights",
+        "_unknown_users",
+    )
+
+    def __init__(
+        self,
+        token: t.Optional[str] = None,
+        *,
+        use_decoders: bool = False,
+        lazy_results: bool = False,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        cache: t.Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        codec: str | JSONCodec = "json",
+        pool: t.Optional[PoolConfig] = None,
+        session: t.Optional[aiohttp.ClientSession] = None,
+        connector: t.Optional[aiohttp.BaseConnector] = None,
+        optimizer: t.Optional[FilterOptimizer] = None,
+        base_url: str = query.BASE,
+        metrics: t.Optional[Metrics] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> None:
         """
         Client constructor.
 
         Args:
             token: VNDB API access token.
+            use_decoders: Decode query results with schema generated [Decoder](./decoder.md)s.
+            lazy_results: Return the query results as a [LazyResults](./lazy.md#azaka.lazy.LazyResults) view instead of namedtuples. Ignored with `use_decoders`.
+            rate_limiter: A [RateLimiter](./ratelimit.md) applied to every request.
+            cache: A [ResponseCache](./cache.md#azaka.cache.ResponseCache) for the responses of [execute](./client.md#azaka.client.Client.execute).
+            coalesce: Share one request between all callers sending an identical request while it's in flight.
+            codec: The [JSONCodec](./codec.md#azaka.codec.JSONCodec) used to encode requests and decode responses, or the name of one for [get_codec](./codec.md#azaka.codec.get_codec). The standard library [json][] module by default.
+            pool: A [PoolConfig](./client.md#azaka.client.PoolConfig) for the session created by the client.
+            session: An [aiohttp.ClientSession](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession) shared with other clients. It's not closed by [close_cs](./client.md#azaka.client.Client.close_cs).
+            connector: An [aiohttp.BaseConnector](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.BaseConnector) shared with other clients. It's not closed with the session of the client.
+            optimizer: A [FilterOptimizer](./optimize.md#azaka.optimize.FilterOptimizer) applied to the filters of every query.
+            base_url: The base URL of the API, such as a local stand-in server.
+            metrics: A [Metrics](./metrics.md#azaka.metrics.Metrics) object recording the phases of every request.
+            retry: A [RetryPolicy](./retry.md) for failed and slow requests, applied on top of the `rate_limiter`. Statuses the `rate_limiter` retries are left to it.
 
         Attributes:
             cs (Optional[aiohttp.ClientSession]): An [aiohttp.ClientSession](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession) object.
         """
         self.token = token
-        self.cs: t.Optional[aiohttp.ClientSession] = None
+        self.cs: t.Optional[aiohttp.ClientSession] = session
+        self.use_decoders = use_decoders
+        self.lazy_results = lazy_results
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.coalesce = coalesce
+        self.codec = get_codec(codec) if isinstance(codec, str) else codec
+        self.pool = pool
+        self.connector = connector
+        self.optimizer = optimizer
+        self.base_url = base_url.rstrip("/")
+        self.metrics = metrics
+        self.retry = retry
+        self._owns_cs = session is None
+        self._schema: t.Optional[dict[str, t.Any]] = None
+        self._decoders: dict[tuple[str, str], Decoder] = {}
+        self._flights: dict[t.Hashable, asyncio.Future[bytes]] = {}
+        self._unknown_users: dict[str, float] = {}
+
+    def _span(
+        self, name: str, **attributes: t.Any
+    ) -> t.ContextManager[t.Optional[Span]]:
+        if self.metrics is None:
+            return contextlib.nullcontext()
+        return self.metrics.span(name, **attributes)
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}/{path}"
 
     @property
     def base_header(self) -> t.Optional[dict[str, str]]:
@@ -62,8 +212,7 @@ class Client:
         Returns:
             A [dict][] containing the schema of the API Database.
         """
-        resp = await self._request(query.SCHEMA_URL)
-        data = await self._get_data(resp)
+        data = self.codec.loads(await self._fetch(self._url("schema")))
         return t.cast(dict[str, str], data)
 
     async def get_stats(self) -> Stats:
@@ -73,8 +222,7 @@ class Client:
         Returns:
             A [Stats](./models.md#azaka.models.Stats) object.
         """
-        resp = await self._request(query.STATS_URL)
-        data = await self._get_data(resp)
+        data = self.codec.loads(await self._fetch(self._url("stats")))
         return Stats(**data)
 
     async def get_auth_info(self) -> AuthInfo:
@@ -91,11 +239,11 @@ class Client:
         """
         if not self.base_header:
             raise TypeError("Missing required argument 'token'")
-        resp = await self._request(query.AUTHINFO_URL, headers=self.base_header)
-        data = await self._get_data(resp)
+        raw = await self._fetch(self._url("authinfo"), headers=self.base_header)
+        data = self.codec.loads(raw)
         return AuthInfo(**data)
 
-    async def get_user(self, *users: str, fields: list[str] = ()) -> list[User]:
+    async def get_user(self, *users: str, fields: t.Sequence[str] = ()) -> list[User]:
         """
         Looks up user(s) by id or username and returns information about them.
 
@@ -126,9 +274,8 @@ class Client:
 
             `await client.get_user("u1", "u2", .....)`
         """
-        url = URL(query.USER_URL).update_query({"q": users, "fields": fields})
-        resp = await self._request(url)
-        data = await self._get_data(resp)
+        url = URL(self._url("user")).update_query({"q": users, "fields": fields})
+        data = self.codec.loads(await self._fetch(url))
         user_list = []
 
         for user in data:
@@ -140,6 +287,74 @@ class Client:
             user_list.append(u)
         return user_list
 
+    async def resolve_users(
+        self,
+        users: t.Iterable[str],
+        fields: t.Sequence[str] = (),
+        chunk_size: int = 100,
+        max_url_length: int = 2000,
+        concurrency: int = 4,
+        negative_ttl: float = 600.0,
+    ) -> dict[str, User]:
+        """
+        Looks up any number of users by id or username.
+
+        The users are split into chunks which keep the request URL within `max_url_length`,
+        the chunks are then looked up concurrently with [get_user](./client.md#azaka.client.Client.get_user).
+        Users which weren't found are remembered for `negative_ttl` seconds and not looked up again.
+
+        Args:
+            users: An iterable of user ids or usernames as [str][]s.
+            fields: A [list][] of fields to select, same as for [get_user](./client.md#azaka.client.Client.get_user).
+            chunk_size: Maximum number of users per request.
+            max_url_length: Maximum length of the request URL.
+            concurrency: Maximum number of requests in flight.
+            negative_ttl: Time in seconds for which users that weren't found are remembered.
+
+        Returns:
+            A [dict][] of [User](./models.md#azaka.models.User) objects keyed by their search term.
+
+        Example:
+            ```python
+            users = await client.resolve_users(names, fields=["lengthvotes"])
+            found = [u for u in users.values() if u.FOUND]
+            ```
+        """
+        now = time.monotonic()
+        self._unknown_users = {k: v for k, v in self._unknown_users.items() if v > now}
+        terms = list(dict.fromkeys(users))
+        result: dict[str, User] = {}
+        chunks: list[list[str]] = [[]]
+        base = len(self._url("user")) + sum(len(f"&fields={quote(i)}") for i in fields)
+        length = base
+
+        for user in terms:
+            if user.lower() in self._unknown_users:
+                result[user] = User(search_term=user, FOUND=False)
+                continue
+
+            size = len(f"&q={quote(user, safe='')}")
+            if chunks[-1] and (
+                len(chunks[-1]) >= chunk_size or length + size > max_url_length
+            ):
+                chunks.append([])
+                length = base
+            chunks[-1].append(user)
+            length += size
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(chunk: list[str]) -> list[User]:
+            async with semaphore:
+                return await self.get_user(*chunk, fields=fields)
+
+        pages = await asyncio.gather(*(lookup(i) for i in chunks if i))
+        for u in (u for page in pages for u in page):
+            result[u.search_term] = u
+            if not u.FOUND:
+                self._unknown_users[u.search_term.lower()] = now + negative_ttl
+        return {i: result[i] for i in terms if i in result}
+
     async def execute(self, query: query.Query) -> Response:
         """
         Sends the query to the VNDB API.
@@ -157,6 +372,13 @@ class Client:
 
             `VN(id="v2", image={"url": ...})`
 
+            If the client was created with `use_decoders=True`, nested fields are decoded into
+            records instead, see [Decoder](./decoder.md).
+
+            If the client was created with `lazy_results=True`, the results are a
+            [LazyResults](./lazy.md#azaka.lazy.LazyResults) view which wraps a row in a
+            [Record](./lazy.md#azaka.lazy.Record) only when it's accessed.
+
         See Also:
             [Response](./models.md#azaka.models.Response), [Query](./query.md#azaka.query.Query)
 
@@ -166,22 +388,156 @@ class Client:
         Returns:
             A [Response](./models.md#azaka.models.Response) object containing the results of the query and associated metadata.
         """
+        with self._span("execute", route=query._route):
+            data = await self._execute_raw(query)
+            decoder = await self._get_decoder(query) if self.use_decoders else None
+            with self._span("build", route=query._route) as span:
+                if span:
+                    span.attributes["rows"] = len(data["results"])
+                if decoder:
+                    return decoder.decode(data)
+                if self.lazy_results:
+                    return build_lazy_objects(query._route, data)
+                return build_objects(query._route, data)
+
+    async def execute_columnar(
+        self, query: query.Query, dictionary_encode: bool = True
+    ) -> ColumnarResponse:
+        """
+        Sends the query to the VNDB API and returns its results as columns.
+
+        Nested fields are flattened into dotted column names, such as `image.url`.
+
+        See Also:
+            [ColumnarResponse](./columnar.md#azaka.columnar.ColumnarResponse), [Paginator.columns](./paginator.md#azaka.paginator.Paginator.columns)
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+            dictionary_encode: Dictionary encode string columns.
+
+        Returns:
+            A [ColumnarResponse](./columnar.md#azaka.columnar.ColumnarResponse) object.
+        """
+        data = await self._execute_raw(query)
+        builder = ColumnBuilder(dictionary_encode)
+        builder.extend(data.pop("results"))
+        return builder.build(**data)
+
+    async def _execute_raw(self, query: query.Query) -> dict[str, t.Any]:
         if not query._route:
             raise TypeError("'route' cannot be empty")
+        if self.optimizer is not None:
+            query = self.optimizer.prepare(query)
+
+        raw = self.cache.get(query) if self.cache else None
+        if raw is None:
+            raw = await self._fetch(
+                self._url(query._route),
+                post=True,
+                data=query.dump(self.codec.dumps),
+                headers=self.base_header,
+            )
+            if self.cache:
+                self.cache.set(query, raw)
+        with self._span("decode", route=query._route) as span:
+            data = self.codec.loads(raw)
+            if span:
+                span.attributes["rows"] = len(data.get("results", ()))
+        if self.optimizer is not None:
+            self.optimizer.learn(query, data)
+        return data
+
+    def iter_rows(self, query: query.Query) -> RowStream:
+        """
+        Sends the query to the VNDB API and streams its results.
 
-        fn = functools.partial(
-            self._request, url=query.url, post=True, data=query.parse_body
-        )
-        resp = await (fn(headers=self.base_header) if self.base_header else fn())
+        The results are parsed incrementally from the response body and decoded one at a
+        time, so memory stays flat no matter how many results the page has.
 
-        data = await self._get_data(resp)
-        return build_objects(query._route, data)
+        Note:
+            Streamed queries bypass the [ResponseCache](./cache.md#azaka.cache.ResponseCache)
+            and aren't coalesced.
 
-    async def _get_data(self, resp: aiohttp.ClientResponse) -> dict[str, RespT]:
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A [RowStream](./stream.md#azaka.stream.RowStream) object.
+
+        Example:
+            ```python
+            stream = client.iter_rows(query)
+            async for vn in stream:
+                print(vn.title)
+            print(stream.more)
+            ```
+        """
+        if not query._route:
+            raise TypeError("'route' cannot be empty")
+        if self.optimizer is not None:
+            query = self.optimizer.prepare(query)
+        return RowStream(self, query)
+
+    async def _row_decoder(
+        self, query: query.Query
+    ) -> t.Callable[[t.Mapping[str, t.Any]], t.Any]:
+        if self.use_decoders:
+            decoder = await self._get_decoder(query)
+            return decoder.decode_row
+        return functools.partial(build_object, query._route)
+
+    async def _get_decoder(self, query: query.Query) -> Decoder:
+        key = (query._route, query._body["fields"])
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            if self._schema is None:
+                self._schema = t.cast(dict[str, t.Any], await self.get_schema())
+            decoder = self._decoders[key] = Decoder(self._schema, *key)
+        return decoder
+
+    async def _fetch(
+        self,
+        url: str | URL,
+        post: bool = False,
+        data: t.Optional[str | bytes] = None,
+        headers: t.Optional[dict[str, str]] = None,
+    ) -> bytes:
+        async def fetch() -> bytes:
+            return await self._get_raw(await self._request(url, post, data, headers))
+
+        send: t.Callable[[], t.Awaitable[bytes]] = fetch
+        if self.retry is not None:
+            limiter = self.rate_limiter
+            skip = RETRY_STATUSES if limiter and limiter.max_retries else ()
+            send = functools.partial(self.retry.run, fetch, skip=skip)
+        if not self.coalesce:
+            return await send()
+
+        key = (post, str(url), data, frozenset(headers.items()) if headers else None)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = asyncio.ensure_future(send())
+            flight.add_done_callback(functools.partial(self._land, key))
+        return await asyncio.shield(flight)
+
+    def _land(self, key: t.Hashable, flight: asyncio.Future[bytes]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _get_raw(self, resp: aiohttp.ClientResponse) -> bytes:
+        await self._raise_for_status(resp)
+        if self.metrics is None:
+            return await resp.read()
+        with self.metrics.span("download", route=route_of(resp.url)) as span:
+            raw = await resp.read()
+            span.attributes["bytes"] = len(raw)
+        return raw
+
+    async def _raise_for_status(self, resp: aiohttp.ClientResponse) -> None:
         status = resp.status
-        if 400 > status >= 200 and resp.content_type == "application/json":
-            return await resp.json()
-        else:
+        if not (400 > status >= 200 and resp.content_type == "application/json"):
             msg = await resp.text()
             error = EXMAP.get(status)
             if error:
@@ -193,19 +549,35 @@ class Client:
         self,
         url: str | URL,
         post: bool = False,
-        data: t.Optional[str] = None,
+        data: t.Optional[str | bytes] = None,
         headers: t.Optional[dict[str, str]] = None,
     ) -> aiohttp.ClientResponse:
         await self._create_cs()
         assert self.cs
-        if post:
-            return await self.cs.post(url=url, data=data, headers=headers)
-        return await self.cs.get(url=url, headers=headers)
+        cs = self.cs
+
+        def send() -> t.Awaitable[aiohttp.ClientResponse]:
+            if post:
+                return cs.post(
+                    url=url, data=data, headers={**JSON_HEADERS, **(headers or {})}
+                )
+            return cs.get(url=url, headers=headers)
+
+        if self.rate_limiter:
+            return await self.rate_limiter.run(send)
+        return await send()
 
     async def _create_cs(self) -> None:
         if not self.cs:
+            pool = self.pool or PoolConfig()
             self.cs = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json"}
+                headers=JSON_HEADERS,
+                connector=self.connector or pool.connector(),
+                connector_owner=self.connector is None,
+                timeout=pool.timeout(),
+                trace_configs=(
+                    [self.metrics.trace_config()] if self.metrics is not None else None
+                ),
             )
 
     async def close_cs(self) -> None:
@@ -214,6 +586,9 @@ class Client:
         Danger:
             You must call this method after completing the request if you are not using
             Context Manager.
+
+        Note:
+            A session passed to the constructor is shared and left open.
         """
-        if self.cs:
+        if self.cs and self._owns_cs:
             await self.cs.close()
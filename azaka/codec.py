@@ -0,0 +1,114 @@
+import importlib
+import json
+import types
+import typing as t
+
+
+def _optional_import(name: str) -> t.Optional[types.ModuleType]:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover
+        return None
+
+
+orjson = _optional_import("orjson")
+msgspec = _optional_import("msgspec")
+
+__all__ = ("JSONCodec", "StdlibCodec", "OrjsonCodec", "MsgspecCodec", "get_codec")
+
+
+class JSONCodec(t.Protocol):
+    """
+    Protocol of the JSON serializer/deserializer used by the [Client](./client.md).
+    """
+
+    name: str
+
+    def dumps(self, obj: t.Any) -> str | bytes: ...
+
+    def loads(self, data: bytes) -> t.Any: ...
+
+
+class StdlibCodec:
+    """
+    Codec using the standard library [json][] module.
+    """
+
+    __slots__ = ()
+    name = "json"
+
+    def dumps(self, obj: t.Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: bytes) -> t.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    Codec using [orjson](https://github.com/ijl/orjson), requires `orjson` to be installed.
+    """
+
+    __slots__ = ("_orjson",)
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("'orjson' is required for OrjsonCodec")
+        self._orjson = orjson
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> t.Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    """
+    Codec using [msgspec](https://jcristharif.com/msgspec/), requires `msgspec` to be installed.
+    """
+
+    __slots__ = ("_encoder", "_decoder")
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("'msgspec' is required for MsgspecCodec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> t.Any:
+        return self._decoder.decode(data)
+
+
+CODECS: dict[str, t.Callable[[], JSONCodec]] = {
+    "json": StdlibCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(name: str = "json") -> JSONCodec:
+    """
+    Returns a JSON codec by name.
+
+    Args:
+        name: One of `json`, `orjson`, `msgspec` or `auto`. `auto` picks the fastest installed
+            backend and falls back to the standard library.
+
+    Warning:
+        `orjson` and `msgspec` differ from the standard library on edge cases, such as integers
+        wider than 64 bits and `NaN`. Opt in to them, or to `auto`, explicitly.
+
+    Returns:
+        A [JSONCodec](./codec.md#azaka.codec.JSONCodec) object.
+    """
+    if name == "auto":
+        name = "orjson" if orjson else "msgspec" if msgspec else "json"
+    if name not in CODECS:
+        raise ValueError(f"'{name}' is not a known JSON codec")
+    return CODECS[name]()
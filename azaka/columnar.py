@@ -0,0 +1,385 @@
+import json
+import typing as t
+from array import array
+
+from azaka.utils import flatten
+
+__all__ = ("Column", "ColumnBuilder", "ColumnarResponse")
+
+INT, FLOAT, BOOL, STR, OBJECT = "int", "float", "bool", "str", "object"
+TYPECODES = {INT: "q", FLOAT: "d", BOOL: "b"}
+NUMPY_DTYPES = {INT: "int64", FLOAT: "float64", BOOL: "bool"}
+
+
+def _kind(value: t.Any) -> str:
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return FLOAT
+    if isinstance(value, str):
+        return STR
+    return OBJECT
+
+
+class Column:
+    """
+    A column of query results.
+
+    Integers, floats and booleans are stored in typed [array.array][]s, strings are either
+    dictionary encoded into integer codes and a [list][] of categories or stored in a [list][],
+    and every other value (such as arrays of nested objects) is stored in a [list][].
+    Nulls are tracked in a validity mask, which is only allocated once a null shows up.
+
+    Attributes:
+        name str: The dotted name of the column.
+        kind Optional[str]: One of `int`, `float`, `bool`, `str` or `object`. [None][] until a non-null value is appended.
+        values array | list: The values, or the codes of the categories for dictionary encoded strings.
+        validity Optional[bytearray]: `1` for every valid value and `0` for every null, [None][] if there are no nulls.
+        categories Optional[list[str]]: The categories of a dictionary encoded column.
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "values",
+        "validity",
+        "categories",
+        "dictionary_encode",
+        "_length",
+        "_index",
+    )
+
+    def __init__(self, name: str, dictionary_encode: bool = True) -> None:
+        self.name = name
+        self.kind: t.Optional[str] = None
+        self.values: array[t.Any] | list[t.Any] = []
+        self.validity: t.Optional[bytearray] = None
+        self.categories: t.Optional[list[str]] = None
+        self.dictionary_encode = dictionary_encode
+        self._length = 0
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> t.Any:
+        if self.validity is not None and not self.validity[i]:
+            return None
+        value = self.values[i]
+        if self.categories is not None:
+            return self.categories[value]
+        if self.kind == BOOL:
+            return bool(value)
+        return value
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return (self[i] for i in range(self._length))
+
+    def _null(self) -> t.Any:
+        if self.kind in TYPECODES:
+            return 0
+        if self.categories is not None:
+            return -1
+        return None
+
+    def _setup(self, kind: str) -> None:
+        self.kind = kind
+        nulls = self._length
+        if kind in TYPECODES:
+            self.values = array(
+                TYPECODES[kind], bytes(nulls * array(TYPECODES[kind]).itemsize)
+            )
+        elif kind == STR and self.dictionary_encode:
+            self.categories = []
+            self.values = array("q", [-1]) * nulls
+        else:
+            self.values = [None] * nulls
+
+    def _to_object(self) -> None:
+        values = list(self)
+        self.kind = OBJECT
+        self.categories = None
+        self._index = {}
+        self.values = values
+
+    def append(self, value: t.Any) -> None:
+        """
+        Appends a value to the column.
+
+        Args:
+            value: The value, [None][] for a null.
+        """
+        if value is None:
+            if self.validity is None:
+                self.validity = bytearray(b"\x01") * self._length
+            self.validity.append(0)
+            self.values.append(self._null())
+            self._length += 1
+            return
+
+        kind = _kind(value)
+        if self.kind is None:
+            self._setup(kind)
+        elif kind != self.kind and self.kind != OBJECT:
+            if self.kind == INT and kind == FLOAT:
+                self.kind = FLOAT
+                self.values = array("d", self.values)
+            elif not (self.kind == FLOAT and kind == INT):
+                self._to_object()
+
+        if self.categories is not None:
+            code = self._index.get(value)
+            if code is None:
+                code = self._index[value] = len(self.categories)
+                self.categories.append(value)
+            value = code
+        self.values.append(value)
+        if self.validity is not None:
+            self.validity.append(1)
+        self._length += 1
+
+    def to_numpy(self) -> t.Any:
+        """
+        Converts the column into a [numpy](https://numpy.org/) array, requires `numpy` to be installed.
+
+        Typed columns share their buffer with the returned array. Columns with nulls are returned as
+        masked arrays, dictionary encoded columns as arrays of strings.
+        """
+        import numpy as np
+
+        if self.kind in NUMPY_DTYPES:
+            data = np.frombuffer(
+                t.cast(array, self.values), dtype=NUMPY_DTYPES[self.kind]
+            )
+        else:
+            data = np.array(
+                list(self) if self.categories is not None else self.values, dtype=object
+            )
+        if self.validity is None:
+            return data
+        return np.ma.MaskedArray(
+            data, mask=np.frombuffer(self.validity, dtype=np.uint8) == 0
+        )
+
+    def to_pandas(self) -> t.Any:
+        """
+        Converts the column into a [pandas](https://pandas.pydata.org/) Series, requires `pandas` to be installed.
+
+        Typed columns with nulls become nullable extension arrays and dictionary encoded columns become categoricals.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if self.categories is not None:
+            codes = np.frombuffer(self.values, dtype=np.dtype(f"i{self.values.itemsize}"))  # type: ignore
+            return pd.Series(
+                pd.Categorical.from_codes(codes, self.categories), name=self.name
+            )
+        if self.kind in NUMPY_DTYPES:
+            data = np.frombuffer(
+                t.cast(array, self.values), dtype=NUMPY_DTYPES[self.kind]
+            )
+            if self.validity is not None:
+                mask = np.frombuffer(self.validity, dtype=np.uint8) == 0
+                arrays = {
+                    INT: pd.arrays.IntegerArray,
+                    FLOAT: pd.arrays.FloatingArray,
+                    BOOL: pd.arrays.BooleanArray,
+                }
+                return pd.Series(arrays[self.kind](data, mask), name=self.name)  # type: ignore
+            return pd.Series(data, name=self.name)
+        return pd.Series(self.values, name=self.name, dtype=object)
+
+    def to_arrow(self) -> t.Any:
+        """
+        Converts the column into a [pyarrow](https://arrow.apache.org/docs/python/) Array, requires `pyarrow` to be installed.
+
+        Int and float columns share their data buffer with the returned array. Object columns
+        holding values of mixed types, such as strings and arrays, are converted into JSON strings.
+        """
+        import pyarrow as pa
+
+        bitmap = None
+        if self.validity is not None:
+            bitmap = pa.py_buffer(_bitmap(self.validity))
+
+        if self.kind == BOOL:
+            return pa.Array.from_buffers(
+                pa.bool_(), self._length, [bitmap, pa.py_buffer(_bitmap(self.values))]
+            )
+        if self.kind in (INT, FLOAT):
+            dtype = pa.int64() if self.kind == INT else pa.float64()
+            return pa.Array.from_buffers(
+                dtype, self._length, [bitmap, pa.py_buffer(self.values)]
+            )
+        if self.categories is not None:
+            codes = pa.Array.from_buffers(
+                pa.int64() if self.values.itemsize == 8 else pa.int32(),  # type: ignore
+                self._length,
+                [bitmap, pa.py_buffer(self.values)],
+            )
+            return pa.DictionaryArray.from_arrays(
+                codes, pa.array(self.categories, pa.string())
+            )
+        values = list(self)
+        try:
+            return pa.array(values)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            return pa.array(
+                [None if i is None else json.dumps(i) for i in values], pa.string()
+            )
+
+
+def _bitmap(validity: t.Sequence[int]) -> bytes:
+    bits = bytearray((len(validity) + 7) // 8)
+    for i, valid in enumerate(validity):
+        if valid:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+class ColumnBuilder:
+    """
+    Builds [Column](./columnar.md#azaka.columnar.Column)s from result rows as pages arrive.
+
+    Nested objects are flattened into dotted column names, so `image.url` becomes its own column.
+    """
+
+    __slots__ = ("dictionary_encode", "columns", "_length", "_nulls")
+
+    def __init__(self, dictionary_encode: bool = True) -> None:
+        """
+        ColumnBuilder constructor.
+
+        Args:
+            dictionary_encode: Dictionary encode string columns.
+        """
+        self.dictionary_encode = dictionary_encode
+        self.columns: dict[str, Column] = {}
+        self._length = 0
+        self._nulls: dict[str, None] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _column(self, name: str) -> Column:
+        column = Column(name, self.dictionary_encode)
+        for _ in range(self._length):
+            column.append(None)
+        self._nulls.pop(name, None)
+        while "." in name:
+            name = name.rpartition(".")[0]
+            self._nulls.pop(name, None)
+        return column
+
+    def build(self, **meta: t.Any) -> "ColumnarResponse":
+        """
+        Returns a [ColumnarResponse](./columnar.md#azaka.columnar.ColumnarResponse) of the columns built so far.
+
+        Args:
+            meta: The metadata of the last response, such as `more` and `count`.
+        """
+        for name in list(self._nulls):
+            if not any(i.startswith(f"{name}.") for i in self.columns):
+                self.columns[name] = self._column(name)
+        self._nulls.clear()
+        return ColumnarResponse(self, **meta)
+
+    def extend(self, rows: t.Iterable[t.Mapping[str, t.Any]]) -> None:
+        """
+        Appends result rows to the columns.
+
+        Args:
+            rows: The raw result rows.
+        """
+        columns = self.columns
+        for row in rows:
+            flat = flatten(row)
+            for name, value in flat.items():
+                column = columns.get(name)
+                if column is None:
+                    if value is None:
+                        self._nulls[name] = None
+                        continue
+                    column = columns[name] = self._column(name)
+                column.append(value)
+
+            self._length += 1
+            for column in columns.values():
+                if len(column) < self._length:
+                    column.append(None)
+
+
+class ColumnarResponse:
+    """
+    Columnar counterpart of [Response](./models.md#azaka.models.Response).
+
+    Example:
+        ```python
+        resp = await Paginator(client, query, max_results_per_page=100).columns()
+        df = resp.to_pandas()
+        ```
+
+    Attributes:
+        columns dict[str, Column]: The [Column](./columnar.md#azaka.columnar.Column)s keyed by their dotted name.
+        more bool: If there are more results.
+        count int: Total number of entries that matched the filters, see [Response](./models.md#azaka.models.Response).
+        compact_filters Optional[str]: Compact string representation of the filters.
+        normalized_filters list[str]: Normalized JSON representation of the filters.
+    """
+
+    __slots__ = (
+        "columns",
+        "_length",
+        "more",
+        "count",
+        "compact_filters",
+        "normalized_filters",
+    )
+
+    def __init__(
+        self,
+        builder: ColumnBuilder,
+        more: bool = False,
+        count: int = 1,
+        compact_filters: t.Optional[str] = None,
+        normalized_filters: t.Optional[list[str]] = None,
+    ) -> None:
+        self.columns = builder.columns
+        self._length = len(builder)
+        self.more = more
+        self.count = count
+        self.compact_filters = compact_filters
+        self.normalized_filters = normalized_filters or []
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def to_numpy(self) -> dict[str, t.Any]:
+        """
+        Returns a [dict][] of [numpy](https://numpy.org/) arrays keyed by column name, see [Column.to_numpy](./columnar.md#azaka.columnar.Column.to_numpy).
+        """
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def to_pandas(self) -> t.Any:
+        """
+        Returns a [pandas](https://pandas.pydata.org/) DataFrame, see [Column.to_pandas](./columnar.md#azaka.columnar.Column.to_pandas).
+        """
+        import pandas as pd
+
+        return pd.concat([c.to_pandas() for c in self.columns.values()], axis=1)
+
+    def to_arrow(self) -> t.Any:
+        """
+        Returns a [pyarrow](https://arrow.apache.org/docs/python/) Table, see [Column.to_arrow](./columnar.md#azaka.columnar.Column.to_arrow).
+        """
+        import pyarrow as pa
+
+        return pa.table(
+            {name: column.to_arrow() for name, column in self.columns.items()}
+        )
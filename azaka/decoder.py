@@ -0,0 +1,177 @@
+import typing as t
+
+from azaka.models import Response
+from azaka.utils import TYPE_CACHE
+
+__all__ = ("Decoder",)
+
+FieldTree = dict[str, t.Optional["FieldTree"]]
+
+
+def _nested(decode: t.Callable[[t.Any], t.Any], value: t.Any) -> t.Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [decode(i) for i in value]
+    return decode(value)
+
+
+def _lookup(
+    api_fields: t.Mapping[str, t.Any], route: str
+) -> t.Optional[t.Mapping[str, t.Any]]:
+    # The API keys its schema by path ("/vn"), accept bare route names as well.
+    name = route.lstrip("/")
+    for key in (f"/{name}", name):
+        if key in api_fields:
+            return api_fields[key] or {}
+    return None
+
+
+class Decoder:
+    """
+    A precompiled decoder for the results of one (route, fields) query.
+
+    The decoder reads the API schema once, generates a namedtuple record type for the route and
+    for every nested object selected with dot notation, and compiles a function which turns a
+    page of results into records in a single pass.
+
+    Note:
+        Unlike the default decoding, nested fields are decoded into records too, so
+        `image.url` is accessed as `vn.image.url` instead of `vn.image["url"]`.
+
+    Danger:
+        This class is not meant to be instantiated directly, it's created and cached by
+        the [Client](./client.md) when `use_decoders` is set.
+
+    Attributes:
+        route str: The route of the query.
+        fields tuple[str, ...]: The selected fields.
+        record type: The record type of the route.
+    """
+
+    __slots__ = ("route", "fields", "record", "_row", "_rows")
+
+    def __init__(self, schema: t.Mapping[str, t.Any], route: str, fields: str) -> None:
+        """
+        Decoder constructor.
+
+        Args:
+            schema: The output of [Client.get_schema](./client.md#azaka.client.Client.get_schema).
+            route: The route of the query.
+            fields: The comma separated fields of the query.
+
+        Exceptions:
+            ValueError: A [ValueError][] is raised if a field isn't present in the schema.
+        """
+        self.route = route
+        self.fields = tuple(
+            dict.fromkeys(i.strip() for i in fields.split(",") if i.strip())
+        )
+
+        api_fields = schema.get("api_fields", {})
+        fields_of_route = _lookup(api_fields, route)
+        if fields_of_route is None:
+            raise ValueError(f"'{route}' is not a known route")
+
+        tree: FieldTree = {}
+        for f in self.fields:
+            self._insert(api_fields, fields_of_route, tree, f)
+
+        namespace: dict[str, t.Any] = {"_nested": _nested}
+        lines: list[str] = []
+        row = self._compile(route.upper(), tree, namespace, lines)
+        lines.append(f"def _rows(rows):\n    return [{row}(r) for r in rows]\n")
+        exec("\n".join(lines), namespace)
+
+        self.record: type = namespace["_T_" + route.upper()]
+        self._row: t.Callable[[t.Mapping[str, t.Any]], t.Any] = namespace[row]
+        self._rows: t.Callable[[t.Iterable[t.Mapping[str, t.Any]]], list[t.Any]] = (
+            namespace["_rows"]
+        )
+
+    def _insert(
+        self,
+        api_fields: t.Mapping[str, t.Any],
+        node: t.Mapping[str, t.Any],
+        tree: FieldTree,
+        field: str,
+    ) -> None:
+        *parents, leaf = field.split(".")
+        for part in parents:
+            node = self._resolve(api_fields, node, part, field)
+            if tree.get(part) is None:
+                tree[part] = {}
+            tree = t.cast(FieldTree, tree[part])
+        self._resolve(api_fields, node, leaf, field)
+        tree.setdefault(leaf, None)
+
+    def _resolve(
+        self,
+        api_fields: t.Mapping[str, t.Any],
+        node: t.Mapping[str, t.Any],
+        part: str,
+        field: str,
+    ) -> t.Mapping[str, t.Any]:
+        if part not in node:
+            raise ValueError(f"'{field}' is not a valid field for '{self.route}'")
+
+        child = node[part] or {}
+        if "_inherit" in child:
+            child = {**(_lookup(api_fields, child["_inherit"]) or {}), **child}
+        return child
+
+    def _compile(
+        self,
+        name: str,
+        tree: FieldTree,
+        namespace: dict[str, t.Any],
+        lines: list[str],
+    ) -> str:
+        args = []
+        for key, sub in tree.items():
+            if sub:
+                fn = self._compile(f"{name}_{key.upper()}", sub, namespace, lines)
+                args.append(f"_nested({fn}, r.get({key!r}))")
+            else:
+                args.append(f"r.get({key!r})")
+
+        namespace[f"_T_{name}"] = TYPE_CACHE.get(name, tuple(tree))
+        lines.append(f"def _d_{name}(r):\n    return _T_{name}({', '.join(args)})\n")
+        return f"_d_{name}"
+
+    def decode_row(self, row: t.Mapping[str, t.Any]) -> t.Any:
+        """
+        Decodes a single result row into a record.
+
+        Args:
+            row: The raw result row.
+
+        Returns:
+            A record.
+        """
+        return self._row(row)
+
+    def decode_rows(self, rows: t.Iterable[t.Mapping[str, t.Any]]) -> list[t.Any]:
+        """
+        Decodes result rows into records.
+
+        Args:
+            rows: The raw result rows.
+
+        Returns:
+            A [list][] of records.
+        """
+        return self._rows(rows)
+
+    def decode(self, json: dict[str, t.Any]) -> Response:
+        """
+        Decodes a raw query response.
+
+        Args:
+            json: The raw response of the query.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object.
+        """
+        results = self._rows(json.pop("results"))
+        return Response(results=results, **json)
@@ -0,0 +1,272 @@
+import operator
+import typing as t
+
+from azaka.models import Response
+from azaka.query import Query
+from azaka.utils import FT, build_objects
+
+__all__ = ("FILTER_FIELDS", "compile_filters", "to_sql", "execute_local")
+
+Row = t.Mapping[str, t.Any]
+Predicate = t.Callable[[Row], bool]
+
+OPERATORS: dict[str, t.Callable[[t.Any, t.Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+FILTER_FIELDS = {
+    "lang": "languages",
+    "platform": "platforms",
+    "release": "releases",
+    "developer": "developers",
+    "producer": "producers",
+    "tag": "tags",
+    "character": "characters",
+    "trait": "traits",
+}
+"""
+Default mapping of filter names to the names of the fields they're evaluated against.
+"""
+
+
+def _id_key(value: t.Any) -> t.Any:
+    if isinstance(value, str) and value[:1].isalpha() and value[1:].isdigit():
+        return int(value[1:])
+    return value
+
+
+def _coerce(value: t.Any, target: t.Any) -> t.Any:
+    if isinstance(value, (int, float)) and isinstance(target, str):
+        try:
+            return float(target)
+        except ValueError:
+            pass
+    return target
+
+
+def _items(value: t.Any) -> list[t.Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def compile_filters(
+    filters: t.Optional[FT[str]], aliases: t.Optional[t.Mapping[str, str]] = None
+) -> Predicate:
+    """
+    Compiles filters into a Python predicate over raw result rows.
+
+    Comparisons against array fields match if any element matches, `!=` matches if no element
+    is equal. Nested sub-filters, such as `Node("release") == AND(...)`, match if any of the
+    nested objects satisfies them. `id`s are compared by their number.
+
+    Args:
+        filters: A [list][] of filters, as passed to [where](./query.md#azaka.query.Query.where).
+        aliases: Mapping of filter names to field names, [FILTER_FIELDS](./evaluate.md#azaka.evaluate.FILTER_FIELDS) by default.
+
+    Returns:
+        A function returning whether a row matches the filters.
+
+    Example:
+        ```python
+        match = compile_filters(AND(Node("olang") == "ja", Node("id") > "v17"))
+        rows = [i for i in rows if match(i)]
+        ```
+    """
+    aliases = FILTER_FIELDS if aliases is None else aliases
+    if not filters:
+        return lambda row: True
+
+    if filters[0] in ("and", "or"):
+        preds = [compile_filters(t.cast(FT[str], i), aliases) for i in filters[1:]]
+        combine = all if filters[0] == "and" else any
+        return lambda row: combine(p(row) for p in preds)
+
+    if len(filters) != 3 or filters[1] not in OPERATORS:
+        raise ValueError(f"invalid filter {filters!r}")
+    name, op, value = t.cast(tuple[str, str, t.Any], filters)
+    field = aliases.get(name, name)
+
+    if isinstance(value, list):
+        if op not in ("=", "!="):
+            raise ValueError(f"sub-filters only support '=' and '!=', got {op!r}")
+        sub = compile_filters(value, aliases)
+
+        def nested(row: Row) -> bool:
+            return any(sub(i) for i in _items(row.get(field)) if isinstance(i, dict))
+
+        return nested if op == "=" else lambda row: not nested(row)
+
+    key = _id_key if name == "id" else lambda v: v
+    target = key(value)
+    compare = OPERATORS["=" if op == "!=" else op]
+
+    def match(row: Row) -> bool:
+        for i in _items(row.get(field)):
+            i = key(i)
+            try:
+                if compare(i, _coerce(i, target)):
+                    return True
+            except TypeError:
+                pass
+        return False
+
+    return match if op != "!=" else lambda row: not match(row)
+
+
+def to_sql(
+    filters: t.Optional[FT[str]],
+    column: str = "data",
+    aliases: t.Optional[t.Mapping[str, str]] = None,
+    id_column: t.Optional[str] = None,
+) -> tuple[str, list[t.Any]]:
+    """
+    Compiles filters into a SQLite `WHERE` clause over a column of JSON rows.
+
+    The clause has the same semantics as [compile_filters](./evaluate.md#azaka.evaluate.compile_filters)
+    and relies on the JSON1 functions of SQLite.
+
+    Args:
+        filters: A [list][] of filters, as passed to [where](./query.md#azaka.query.Query.where).
+        column: The column holding the JSON of the rows.
+        aliases: Mapping of filter names to field names, [FILTER_FIELDS](./evaluate.md#azaka.evaluate.FILTER_FIELDS) by default.
+        id_column: An integer column holding the number of the `id` of top level rows, used instead of the JSON.
+
+    Returns:
+        A [tuple][] of the clause and its parameters.
+
+    Example:
+        ```python
+        where, params = to_sql(Node("olang") == "ja")
+        conn.execute(f"SELECT data FROM vn WHERE {where}", params)
+        ```
+    """
+    aliases = FILTER_FIELDS if aliases is None else aliases
+    if not filters:
+        return "1", []
+
+    if filters[0] in ("and", "or"):
+        clauses, params = [], []
+        for i in filters[1:]:
+            clause, p = to_sql(t.cast(FT[str], i), column, aliases, id_column)
+            clauses.append(f"({clause})")
+            params += p
+        return f" {str(filters[0]).upper()} ".join(clauses) or "1", params
+
+    if len(filters) != 3 or filters[1] not in OPERATORS:
+        raise ValueError(f"invalid filter {filters!r}")
+    name, op, value = t.cast(tuple[str, str, t.Any], filters)
+    path = f"$.{aliases.get(name, name)}"
+
+    if isinstance(value, list):
+        if op not in ("=", "!="):
+            raise ValueError(f"sub-filters only support '=' and '!=', got {op!r}")
+        clause, params = to_sql(value, "j.value", aliases)
+        exists = (
+            f"EXISTS (SELECT 1 FROM json_each({column}, ?) AS j "
+            f"WHERE j.type = 'object' AND ({clause}))"
+        )
+        nested = (
+            f"(json_type({column}, ?) = 'object' AND EXISTS (SELECT 1 FROM "
+            f"(SELECT json_extract({column}, ?) AS value) AS j WHERE ({clause})))"
+        )
+        sql = f"({exists} OR {nested})"
+        params = [path, *params, path, path, *params]
+        return (sql if op == "=" else f"NOT {sql}"), params
+
+    if name == "id" and id_column:
+        return f"{id_column} {op} ?", [_id_key(value)]
+
+    compare = "=" if op == "!=" else op
+    item, target = "e.value", value
+    if name == "id" and _id_key(value) is not value:
+        item, target = "CAST(substr(e.value, 2) AS INTEGER)", _id_key(value)
+    sql = (
+        f"EXISTS (SELECT 1 FROM json_each({column}, ?) AS e WHERE e.type != 'null' AND "
+        f"CASE WHEN e.type IN ('integer', 'real') THEN {item} {compare} CAST(? AS REAL) "
+        f"ELSE {item} {compare} ? END)"
+    )
+    return (sql if op != "!=" else f"NOT {sql}"), [path, target, target]
+
+
+def field_tree(fields: str) -> dict[str, t.Any]:
+    tree: dict[str, t.Any] = {}
+    for field in (i.strip() for i in fields.split(",") if i.strip()):
+        node = tree
+        *parents, leaf = field.split(".")
+        for part in parents:
+            if node.get(part) is None:
+                node[part] = {}
+            node = node[part]
+        node.setdefault(leaf, None)
+    return tree
+
+
+def project(data: t.Any, tree: dict[str, t.Any]) -> t.Any:
+    if isinstance(data, list):
+        return [project(i, tree) for i in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: project(data.get(key), sub) if sub else data.get(key)
+        for key, sub in tree.items()
+    }
+
+
+def _sort_key(sort: str) -> t.Callable[[Row], t.Any]:
+    if sort == "id":
+        return lambda row: _id_key(row.get("id"))
+
+    def key(row: Row) -> t.Any:
+        value = row.get(sort)
+        return (value is not None, value, _id_key(row.get("id")))
+
+    return key
+
+
+def execute_local(
+    query: Query,
+    rows: t.Iterable[Row],
+    aliases: t.Optional[t.Mapping[str, str]] = None,
+) -> Response:
+    """
+    Answers a query from raw result rows, such as cached or mirrored data, with the semantics
+    of [Client.execute](./client.md#azaka.client.Client.execute).
+
+    The rows are filtered with [compile_filters](./evaluate.md#azaka.evaluate.compile_filters),
+    sorted, paginated and projected onto the selected fields.
+
+    Args:
+        query: A [Query](./query.md#azaka.query.Query) object.
+        rows: The raw rows of the route of the query.
+        aliases: Mapping of filter names to field names, [FILTER_FIELDS](./evaluate.md#azaka.evaluate.FILTER_FIELDS) by default.
+
+    Returns:
+        A [Response](./models.md#azaka.models.Response) object.
+    """
+    return build_objects(query._route, evaluate_body(query._body, rows, aliases))
+
+
+def evaluate_body(
+    body: t.Mapping[str, t.Any],
+    rows: t.Iterable[Row],
+    aliases: t.Optional[t.Mapping[str, str]] = None,
+) -> dict[str, t.Any]:
+    match = compile_filters(body["filters"], aliases)
+    matched = sorted(
+        (i for i in rows if match(i)),
+        key=_sort_key(body["sort"]),
+        reverse=body["reverse"],
+    )
+    start = (body["page"] - 1) * body["results"]
+    tree = field_tree(body["fields"])
+    return {
+        "results": [project(i, tree) for i in matched[start : start + body["results"]]],
+        "more": len(matched) > start + body["results"],
+        "count": len(matched) if body["count"] else 1,
+    }
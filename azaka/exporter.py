@@ -0,0 +1,348 @@
+import asyncio
+import csv
+import json
+import os
+import sqlite3
+import typing as t
+
+from azaka.client import Client
+from azaka.paginator import CursorPaginator
+from azaka.query import Query
+from azaka.utils import flatten
+
+__all__ = ("Sink", "NDJSONSink", "CSVSink", "SQLiteSink", "ParquetSink", "export")
+
+Row = dict[str, t.Any]
+
+
+class Sink(t.Protocol):
+    """
+    Protocol of the destinations of [export](./export.md#azaka.exporter.export).
+
+    The methods are called from a worker thread, so they may block. `position` returns where the
+    written output ends, it's saved in the checkpoint and given back to `open` on resume so the sink
+    can drop anything written after the last checkpoint. Sinks which write idempotently return [None][].
+    """
+
+    def open(self, resume: bool, position: t.Any = None) -> None: ...
+
+    def write(self, rows: list[Row]) -> None: ...
+
+    def position(self) -> t.Any: ...
+
+    def close(self) -> None: ...
+
+
+class NDJSONSink:
+    """
+    Writes every result as a line of JSON.
+    """
+
+    __slots__ = ("path", "_file")
+
+    def __init__(self, path: str) -> None:
+        """
+        NDJSONSink constructor.
+
+        Args:
+            path: Path of the output file.
+        """
+        self.path = path
+        self._file: t.Optional[t.TextIO] = None
+
+    def open(self, resume: bool, position: t.Any = None) -> None:
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if position is not None:
+            self._file.truncate(position)
+
+    def write(self, rows: list[Row]) -> None:
+        assert self._file
+        self._file.writelines(json.dumps(i, ensure_ascii=False) + "\n" for i in rows)
+        self._file.flush()
+
+    def position(self) -> int:
+        assert self._file
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+class CSVSink:
+    """
+    Writes the results as CSV rows.
+
+    Nested objects are flattened into dotted column names such as `image.url`, arrays are written as JSON.
+    The columns are taken from the first written result unless given.
+    """
+
+    __slots__ = ("path", "columns", "_file", "_writer")
+
+    def __init__(self, path: str, columns: t.Optional[list[str]] = None) -> None:
+        """
+        CSVSink constructor.
+
+        Args:
+            path: Path of the output file.
+            columns: The columns to write.
+        """
+        self.path = path
+        self.columns = columns
+        self._file: t.Optional[t.TextIO] = None
+        self._writer: t.Optional[csv.DictWriter[str]] = None
+
+    def open(self, resume: bool, position: t.Any = None) -> None:
+        if resume and os.path.exists(self.path):
+            with open(self.path, newline="", encoding="utf-8") as f:
+                self.columns = next(csv.reader(f), None) or self.columns
+        self._file = open(
+            self.path, "a" if resume else "w", newline="", encoding="utf-8"
+        )
+        if position is not None:
+            self._file.truncate(position)
+
+    def write(self, rows: list[Row]) -> None:
+        assert self._file
+        flat = [
+            {
+                k: json.dumps(v) if isinstance(v, list) else v
+                for k, v in flatten(i).items()
+            }
+            for i in rows
+        ]
+        if self._writer is None:
+            new = not self.columns or self._file.tell() == 0
+            self.columns = self.columns or (list(flat[0]) if flat else [])
+            self._writer = csv.DictWriter(
+                self._file, self.columns, extrasaction="ignore"
+            )
+            if new:
+                self._writer.writeheader()
+        self._writer.writerows(flat)
+        self._file.flush()
+
+    def position(self) -> int:
+        assert self._file
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+class SQLiteSink:
+    """
+    Upserts the results into a SQLite table of `(id TEXT PRIMARY KEY, data TEXT)` rows,
+    `data` holding the JSON of the result.
+    """
+
+    __slots__ = ("path", "table", "_conn")
+
+    def __init__(self, path: str, table: str) -> None:
+        """
+        SQLiteSink constructor.
+
+        Args:
+            path: Path of the database file.
+            table: Name of the table.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"'{table}' is not a valid table name")
+        self.path = path
+        self.table = table
+        self._conn: t.Optional[sqlite3.Connection] = None
+
+    def open(self, resume: bool, position: t.Any = None) -> None:
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (id TEXT PRIMARY KEY, data TEXT)"
+            )
+
+    def write(self, rows: list[Row]) -> None:
+        assert self._conn
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} VALUES (?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                ((i["id"], json.dumps(i, ensure_ascii=False)) for i in rows),
+            )
+
+    def position(self) -> None:
+        return None
+
+    def close(self) -> None:
+        if self._conn:
+            self._conn.close()
+
+
+class ParquetSink:
+    """
+    Writes every page as a Parquet part file (`part-00000.parquet`, ...) of a directory,
+    requires `pyarrow` to be installed.
+
+    All the parts share one schema. When a page widens the type of a column, such as a column
+    which was null in every earlier result, the earlier parts are rewritten with the wider type.
+    """
+
+    __slots__ = ("path", "_parts", "_schema")
+
+    def __init__(self, path: str) -> None:
+        """
+        ParquetSink constructor.
+
+        Args:
+            path: Path of the output directory.
+        """
+        self.path = path
+        self._parts = 0
+        self._schema: t.Any = None
+
+    def _part(self, index: int) -> str:
+        return os.path.join(self.path, f"part-{index:05}.parquet")
+
+    def open(self, resume: bool, position: t.Any = None) -> None:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("'pyarrow' is required for ParquetSink") from None
+
+        os.makedirs(self.path, exist_ok=True)
+        parts = sorted(i for i in os.listdir(self.path) if i.startswith("part-"))
+        if parts and not resume:
+            raise FileExistsError(f"'{self.path}' already contains part files")
+        self._parts = len(parts) if position is None else position
+        for name in parts[self._parts :]:
+            os.remove(os.path.join(self.path, name))
+        if self._parts:
+            self._schema = pq.read_schema(self._part(self._parts - 1))
+
+    def write(self, rows: list[Row]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(rows)
+        schema = table.schema
+        if self._schema is not None:
+            schema = pa.unify_schemas(
+                [self._schema, table.schema], promote_options="permissive"
+            )
+            if not schema.equals(self._schema):
+                for i in range(self._parts):
+                    part = _conform(pq.read_table(self._part(i)), schema)
+                    pq.write_table(part, self._part(i))
+        self._schema = schema
+        pq.write_table(_conform(table, schema), self._part(self._parts))
+        self._parts += 1
+
+    def position(self) -> int:
+        return self._parts
+
+    def close(self) -> None:
+        pass
+
+
+def _conform(table: t.Any, schema: t.Any) -> t.Any:
+    import pyarrow as pa
+
+    columns = [
+        (
+            table.column(i.name).cast(i.type)
+            if i.name in table.column_names
+            else pa.nulls(table.num_rows, i.type)
+        )
+        for i in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _read_checkpoint(path: t.Optional[str]) -> dict[str, t.Any]:
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _write_checkpoint(path: str, state: dict[str, t.Any]) -> None:
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(f"{path}.tmp", path)
+
+
+async def export(
+    client: Client,
+    query: Query,
+    sink: Sink,
+    checkpoint: t.Optional[str] = None,
+    page_size: int = 100,
+    buffer: int = 2,
+) -> int:
+    """
+    Streams every result of a query into a sink.
+
+    Pages are fetched with id cursor pagination (see [CursorPaginator](./paginator.md#azaka.paginator.CursorPaginator))
+    and written as they arrive. At most `buffer` fetched pages wait for the sink, fetching pauses
+    while the buffer is full. After every written page the id cursor and the position of the sink
+    are saved to the `checkpoint` file, so a crashed run resumes where it stopped when called again
+    with the same checkpoint. Anything the sink wrote after the last checkpoint is dropped on resume,
+    so no result is written twice.
+
+    Args:
+        client: The [Client](./client.md) object.
+        query: The [Query](./query.md#azaka.query.Query) object to export.
+        sink: The destination, such as an [NDJSONSink](./export.md#azaka.exporter.NDJSONSink).
+        checkpoint: Path of the checkpoint file.
+        page_size: Number of results per page.
+        buffer: Maximum number of pages waiting to be written.
+
+    Returns:
+        The number of results written by this run.
+
+    Example:
+        ```python
+        query = select("title", "released").frm("vn")
+        async with Client() as client:
+            await export(client, query, NDJSONSink("vn.ndjson"), checkpoint="vn.ckpt")
+        ```
+    """
+    state = _read_checkpoint(checkpoint)
+    paginator = CursorPaginator(client, query, page_size, cursor=state.get("cursor"))
+    queue: asyncio.Queue[list[Row] | BaseException | None] = asyncio.Queue(buffer)
+
+    async def produce() -> None:
+        try:
+            while True:
+                data = await client._execute_raw(paginator.query)
+                rows = data["results"]
+                if rows:
+                    await queue.put(rows)
+                if not data.get("more") or not rows:
+                    break
+                paginator._advance(rows[-1]["id"])
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    written = 0
+    await asyncio.to_thread(sink.open, "cursor" in state, state.get("position"))
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (rows := await queue.get()) is not None:
+            if isinstance(rows, BaseException):
+                raise rows
+            await asyncio.to_thread(sink.write, rows)
+            written += len(rows)
+            if checkpoint:
+                state = {
+                    "cursor": rows[-1]["id"],
+                    "rows": state.get("rows", 0) + len(rows),
+                    "position": await asyncio.to_thread(sink.position),
+                }
+                _write_checkpoint(checkpoint, state)
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        await asyncio.to_thread(sink.close)
+    return written
@@ -0,0 +1,149 @@
+import typing as t
+
+from azaka.models import Response
+from azaka.utils import TYPE_CACHE
+
+__all__ = ("Record", "LazyResults", "build_lazy_objects")
+
+
+class Record:
+    """
+    A read-only view over one raw result row.
+
+    Attribute access reads straight from the row [dict][], nothing is copied. Nested fields are
+    returned as they are in the response, like the namedtuples of a [Response](./models.md#azaka.models.Response).
+
+    Example:
+        ```python
+        record.title
+        record.image["url"]
+        record.materialize()  # VN(id=..., title=..., image={...})
+        ```
+    """
+
+    __slots__ = ("_route", "_row")
+
+    def __init__(self, route: str, row: t.Mapping[str, t.Any]) -> None:
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name: str) -> t.Any:
+        if name in Record.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._row[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self._route.upper()}' record has no attribute '{name}'"
+            ) from None
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError("Record objects are read-only")
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (Record, (self._route, self._row))
+
+    def __getitem__(self, index: int) -> t.Any:
+        return tuple(self._row.values())[index]
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self._row.values())
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return self._row == other._row
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self._row.items())
+        return f"{self._route.upper()}({fields})"
+
+    @property
+    def _fields(self) -> tuple[str, ...]:
+        return tuple(self._row)
+
+    def _asdict(self) -> dict[str, t.Any]:
+        return dict(self._row)
+
+    def materialize(self) -> t.NamedTuple:
+        """
+        Returns the row as the namedtuple [execute](./client.md#azaka.client.Client.execute) would have built.
+        """
+        cls = TYPE_CACHE.get(self._route.upper(), tuple(self._row))
+        return cls(*self._row.values())  # type: ignore
+
+
+class LazyResults(t.Sequence[Record]):
+    """
+    A sequence of query results which creates a [Record](./lazy.md#azaka.lazy.Record) only when a row is accessed.
+
+    The raw rows are kept as they were decoded, so filtering or sampling a large result only
+    allocates the records which are read. Slicing returns another lazy view.
+
+    Attributes:
+        route str: The route of the query.
+        rows list[dict]: The raw result rows.
+    """
+
+    __slots__ = ("route", "rows")
+
+    def __init__(self, route: str, rows: list[dict[str, t.Any]]) -> None:
+        self.route = route
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @t.overload
+    def __getitem__(self, index: int) -> Record: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "LazyResults": ...
+
+    def __getitem__(self, index: int | slice) -> "Record | LazyResults":
+        if isinstance(index, slice):
+            return LazyResults(self.route, self.rows[index])
+        return Record(self.route, self.rows[index])
+
+    def __iter__(self) -> t.Iterator[Record]:
+        route = self.route
+        for row in self.rows:
+            yield Record(route, row)
+
+    def __repr__(self) -> str:
+        return f"<LazyResults route={self.route!r} rows={len(self.rows)}>"
+
+    def filter(self, predicate: t.Callable[[Record], bool]) -> "LazyResults":
+        """
+        Returns a lazy view of the rows matching a predicate.
+
+        Args:
+            predicate: A function called with the [Record](./lazy.md#azaka.lazy.Record) of every row.
+        """
+        route = self.route
+        return LazyResults(
+            route, [row for row in self.rows if predicate(Record(route, row))]
+        )
+
+    def materialize(self) -> list[t.NamedTuple]:
+        """
+        Returns the results as the [list][] of namedtuples [execute](./client.md#azaka.client.Client.execute) would have built.
+        """
+        name = self.route.upper()
+        objects = []
+        for row in self.rows:
+            cls = TYPE_CACHE.get(name, tuple(row))
+            objects.append(cls(*row.values()))
+        return objects
+
+
+def build_lazy_objects(route: str, json: dict[str, t.Any]) -> Response:
+    results = LazyResults(route, json.pop("results"))
+    return Response(results=results, **json)  # type: ignore
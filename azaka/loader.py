@@ -0,0 +1,125 @@
+import asyncio
+import typing as t
+
+from azaka.client import Client
+from azaka.query import OR, Node, select
+from azaka.utils import clean_string
+
+__all__ = ("Loader",)
+
+MAX_RESULTS = 100
+
+Batch = dict[str, asyncio.Future[t.Any]]
+
+
+class Loader:
+    """
+    Loader class for batching single id lookups.
+
+    Lookups of the same route and fields made within a short window are merged into one query
+    with an `OR` filter of all the ids, the results are then handed back to each caller.
+
+    Example:
+        ```python
+        async def main() -> None:
+            async with Client() as client:
+                loader = Loader(client)
+                vns = await asyncio.gather(
+                    *(loader.load("vn", f"v{i}", "title") for i in range(1, 500))
+                )
+        ```
+    """
+
+    __slots__ = ("client", "window", "max_batch", "_batches", "_tasks")
+
+    def __init__(
+        self, client: Client, window: float = 0.005, max_batch: int = MAX_RESULTS
+    ) -> None:
+        """
+        Loader constructor.
+
+        Args:
+            client: The [Client](./client.md) object.
+            window: Time in seconds during which lookups are collected into one batch.
+            max_batch: Maximum number of ids in one batch, capped at the API maximum of `100`.
+        """
+        if not isinstance(max_batch, int) or max_batch < 1:
+            raise ValueError("'max_batch' must be a positive integer")
+        self.client = client
+        self.window = window
+        self.max_batch = min(max_batch, MAX_RESULTS)
+        self._batches: dict[tuple[str, tuple[str, ...]], Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, route: str, id: str, *fields: str) -> t.Optional[t.Any]:
+        """
+        Looks an entry up by its id.
+
+        Args:
+            route: The route of the entry.
+            id: The id of the entry.
+            fields: The fields to select.
+
+        Returns:
+            The result for the id, or [None][] if there's no such entry.
+        """
+        key = (clean_string(route), tuple(clean_string(i) for i in fields))
+        id = clean_string(id)
+        loop = asyncio.get_running_loop()
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = {}
+            loop.call_later(self.window, self._dispatch, key, batch)
+
+        future = batch.get(id)
+        if future is None:
+            future = batch[id] = loop.create_future()
+            if len(batch) >= self.max_batch:
+                self._dispatch(key, batch)
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self, route: str, ids: t.Iterable[str], *fields: str
+    ) -> list[t.Optional[t.Any]]:
+        """
+        Looks many entries up by their ids.
+
+        Args:
+            route: The route of the entries.
+            ids: The ids of the entries.
+            fields: The fields to select.
+
+        Returns:
+            A [list][] of results in the order of the ids, [None][] for the ids without an entry.
+        """
+        return list(await asyncio.gather(*(self.load(route, i, *fields) for i in ids)))
+
+    def _dispatch(self, key: tuple[str, tuple[str, ...]], batch: Batch) -> None:
+        if self._batches.get(key) is not batch:
+            return
+        del self._batches[key]
+        task = asyncio.ensure_future(self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: tuple[str, tuple[str, ...]], batch: Batch) -> None:
+        route, fields = key
+        nodes = [Node("id") == i for i in batch]
+        query = (
+            select(*fields).frm(route).where(OR(*nodes) if len(nodes) > 1 else nodes[0])
+        )
+        query._body["results"] = MAX_RESULTS
+
+        try:
+            resp = await self.client.execute(query)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        rows = {getattr(i, "id"): i for i in resp.results}
+        for id, future in batch.items():
+            if not future.done():
+                future.set_result(rows.get(id))
@@ -0,0 +1,369 @@
+import contextlib
+import time
+import types
+import typing as t
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+import aiohttp
+from yarl import URL
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover
+    otel_trace = None
+
+__all__ = ("Span", "Histogram", "Metrics", "OpenTelemetryHook")
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Labels = tuple[tuple[str, str], ...]
+Hook = t.Callable[["Span"], None]
+
+
+def route_of(url: str | URL) -> str:
+    return URL(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _labels(labels: t.Mapping[str, t.Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+@dataclass
+class Span:
+    """
+    Span [dataclasses.dataclass][] containing the timing of one phase of a request.
+
+    Attributes:
+        name str: The phase, one of `queue`, `dns`, `connect`, `server`, `download`, `decode`, `build` or `execute`.
+        start float: Start of the phase as a UNIX timestamp.
+        duration float: Duration of the phase in seconds.
+        attributes dict[str, Any]: Details of the phase, such as the `route`, `status`, `bytes` and `rows`.
+    """
+
+    name: str
+    start: float
+    duration: float = 0.0
+    attributes: dict[str, t.Any] = field(default_factory=dict)
+
+
+class Histogram:
+    """
+    Histogram of observed values with cumulative buckets.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: t.Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        """
+        Returns the number of values less than or equal to each bucket.
+        """
+        total, out = 0, []
+        for i in self.counts:
+            total += i
+            out.append(total)
+        return out
+
+
+class Metrics:
+    """
+    In-process counters, histograms and span hooks for a [Client](./client.md).
+
+    Every phase of a request is timed as a [Span](./metrics.md#azaka.metrics.Span), observed in the
+    `azaka_<phase>_seconds` histogram and handed to the hooks. The network phases are timed with an
+    [aiohttp.TraceConfig](https://docs.aiohttp.org/en/stable/tracing_reference.html) installed on the
+    session created by the client.
+
+    Counters:
+
+    - `azaka_requests_total`: Responses by `route` and `status`.
+    - `azaka_request_errors_total`: Failed requests by `route` and `error`.
+    - `azaka_request_bytes_total`: Bytes sent by `route`.
+    - `azaka_download_bytes_total`: Bytes received by `route`.
+    - `azaka_decode_rows_total`, `azaka_build_rows_total`: Rows decoded and built by `route`.
+
+    Note:
+        The network phases aren't recorded for a session passed to the [Client](./client.md).
+
+    Example:
+        ```python
+        metrics = Metrics(hooks=[print])
+        async with Client(metrics=metrics) as client:
+            await client.execute(query)
+        print(metrics.prometheus())
+        ```
+    """
+
+    __slots__ = ("hooks", "buckets", "counters", "histograms")
+
+    def __init__(
+        self, hooks: t.Iterable[Hook] = (), buckets: t.Sequence[float] = BUCKETS
+    ) -> None:
+        """
+        Metrics constructor.
+
+        Args:
+            hooks: Functions called with every finished [Span](./metrics.md#azaka.metrics.Span).
+            buckets: Upper bounds of the histogram buckets, in seconds.
+
+        Attributes:
+            counters (dict[str, dict[tuple, float]]): Counter values by name and labels.
+            histograms (dict[str, dict[tuple, Histogram]]): Histograms by name and labels.
+        """
+        self.hooks = list(hooks)
+        self.buckets = tuple(sorted(buckets))
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: t.Any) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name: The name of the counter.
+            value: The increment.
+            labels: The labels of the counter.
+        """
+        series = self.counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: t.Any) -> None:
+        """
+        Observes a value in a histogram.
+
+        Args:
+            name: The name of the histogram.
+            value: The observed value.
+            labels: The labels of the histogram.
+        """
+        series = self.histograms.setdefault(name, {})
+        key = _labels(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def counter(self, name: str, **labels: t.Any) -> float:
+        """
+        Returns the value of a counter, `0` if it was never incremented.
+        """
+        return self.counters.get(name, {}).get(_labels(labels), 0)
+
+    def histogram(self, name: str, **labels: t.Any) -> t.Optional[Histogram]:
+        """
+        Returns a histogram, [None][] if nothing was observed.
+        """
+        return self.histograms.get(name, {}).get(_labels(labels))
+
+    def record(self, span: Span) -> None:
+        """
+        Records a finished span and hands it to the hooks.
+
+        Args:
+            span: A [Span](./metrics.md#azaka.metrics.Span) object.
+        """
+        route = span.attributes.get("route", "")
+        self.observe(f"azaka_{span.name}_seconds", span.duration, route=route)
+        for key in ("bytes", "rows"):
+            if key in span.attributes:
+                self.inc(
+                    f"azaka_{span.name}_{key}_total", span.attributes[key], route=route
+                )
+        for hook in self.hooks:
+            hook(span)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: t.Any) -> t.Iterator[Span]:
+        """
+        Times the body of a `with` block as a span.
+
+        Args:
+            name: The name of the phase.
+            attributes: The attributes of the span, more can be added to the yielded span.
+
+        Returns:
+            A context manager yielding the [Span](./metrics.md#azaka.metrics.Span).
+        """
+        span = Span(name, time.time(), attributes=attributes)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - start
+            self.record(span)
+
+    def _phase(
+        self, ctx: types.SimpleNamespace, name: str, start: float, **attributes: t.Any
+    ) -> None:
+        end = time.perf_counter()
+        ctx.spent += end - start
+        self.record(
+            Span(
+                name,
+                ctx.epoch + (start - ctx.clock),
+                end - start,
+                {"route": ctx.route, **attributes},
+            )
+        )
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Returns a TraceConfig timing the `queue`, `dns`, `connect` and `server` phases of the requests.
+
+        The `server` phase lasts from sending the request to receiving the response headers, without
+        the time spent in the other phases.
+        """
+        config = aiohttp.TraceConfig()
+
+        async def on_request_start(
+            session: aiohttp.ClientSession,
+            ctx: types.SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            ctx.route = route_of(params.url)
+            ctx.epoch, ctx.clock, ctx.spent = time.time(), time.perf_counter(), 0.0
+
+        async def on_request_end(
+            session: aiohttp.ClientSession,
+            ctx: types.SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            status = params.response.status
+            self.inc("azaka_requests_total", route=ctx.route, status=status)
+            start = ctx.clock + ctx.spent
+            self._phase(ctx, "server", start, status=status)
+
+        async def on_request_exception(
+            session: aiohttp.ClientSession,
+            ctx: types.SimpleNamespace,
+            params: aiohttp.TraceRequestExceptionParams,
+        ) -> None:
+            error = type(params.exception).__name__
+            self.inc("azaka_request_errors_total", route=ctx.route, error=error)
+
+        async def on_request_chunk_sent(
+            session: aiohttp.ClientSession,
+            ctx: types.SimpleNamespace,
+            params: aiohttp.TraceRequestChunkSentParams,
+        ) -> None:
+            self.inc("azaka_request_bytes_total", len(params.chunk), route=ctx.route)
+
+        def phase(name: str) -> tuple[t.Callable[..., t.Any], t.Callable[..., t.Any]]:
+            async def start(
+                session: aiohttp.ClientSession,
+                ctx: types.SimpleNamespace,
+                params: t.Any,
+            ) -> None:
+                setattr(ctx, name, time.perf_counter())
+
+            async def end(
+                session: aiohttp.ClientSession,
+                ctx: types.SimpleNamespace,
+                params: t.Any,
+            ) -> None:
+                self._phase(ctx, name, getattr(ctx, name))
+
+            return start, end
+
+        config.on_request_start.append(on_request_start)
+        config.on_request_end.append(on_request_end)
+        config.on_request_exception.append(on_request_exception)
+        config.on_request_chunk_sent.append(on_request_chunk_sent)
+        for name, (start, end) in (
+            (
+                "queue",
+                (config.on_connection_queued_start, config.on_connection_queued_end),
+            ),
+            ("dns", (config.on_dns_resolvehost_start, config.on_dns_resolvehost_end)),
+            (
+                "connect",
+                (config.on_connection_create_start, config.on_connection_create_end),
+            ),
+        ):
+            on_start, on_end = phase(name)
+            start.append(on_start)
+            end.append(on_end)
+        return config
+
+    def prometheus(self) -> str:
+        """
+        Returns the counters and histograms in the Prometheus text exposition format.
+        """
+        lines: list[str] = []
+        for name, series in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_fmt_labels(labels)} {value:g}")
+
+        for name, hseries in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in hseries.items():
+                bounds = [*(f"{i:g}" for i in histogram.buckets), "+Inf"]
+                counts = [*histogram.cumulative(), histogram.count]
+                for bound, count in zip(bounds, counts):
+                    le = _fmt_labels((*labels, ("le", bound)))
+                    lines.append(f"{name}_bucket{le} {count}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {histogram.sum:g}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook:
+    """
+    Span hook exporting the spans to [OpenTelemetry](https://opentelemetry.io/), requires
+    `opentelemetry-api` to be installed.
+
+    Example:
+        ```python
+        metrics = Metrics(hooks=[OpenTelemetryHook()])
+        ```
+    """
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer: t.Optional[t.Any] = None) -> None:
+        """
+        OpenTelemetryHook constructor.
+
+        Args:
+            tracer: The tracer creating the spans, the `azaka` tracer of the global provider by default.
+        """
+        if otel_trace is None:
+            raise ImportError("'opentelemetry-api' is required for OpenTelemetryHook")
+        self.tracer = tracer or otel_trace.get_tracer("azaka")
+
+    def __call__(self, span: Span) -> None:
+        start = int(span.start * 1e9)
+        attributes = {
+            f"azaka.{k}": v
+            for k, v in span.attributes.items()
+            if isinstance(v, (str, int, float, bool))
+        }
+        otel = self.tracer.start_span(
+            f"azaka.{span.name}", start_time=start, attributes=attributes
+        )
+        otel.end(end_time=start + int(span.duration * 1e9))
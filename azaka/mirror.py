@@ -0,0 +1,309 @@
+import json
+import re
+import sqlite3
+import time
+import typing as t
+
+from azaka.client import Client
+from azaka.evaluate import FILTER_FIELDS, field_tree, project, to_sql
+from azaka.models import Response
+from azaka.paginator import CursorPaginator
+from azaka.query import Query, select
+from azaka.utils import FT, build_objects
+
+__all__ = ("Mirror",)
+
+ID_PREFIXES = {
+    "vn": "v",
+    "release": "r",
+    "producer": "p",
+    "character": "c",
+    "staff": "s",
+    "tag": "g",
+    "trait": "i",
+}
+ID_NUMBER = re.compile(r"\d+")
+
+
+def _id_number(id: str) -> int:
+    match = ID_NUMBER.search(id)
+    if not match:
+        raise ValueError(f"'{id}' is not a valid id")
+    return int(match.group())
+
+
+def _filter_fields(filters: FT[str], prefix: str = "") -> t.Iterator[str]:
+    if filters[0] in ("and", "or"):
+        for i in filters[1:]:
+            yield from _filter_fields(t.cast(FT[str], i), prefix)
+        return
+    name, _, value = filters
+    field = prefix + FILTER_FIELDS.get(str(name), str(name))
+    yield field
+    if isinstance(value, list):
+        yield from _filter_fields(value, f"{field}.")
+
+
+class Mirror:
+    """
+    A local SQLite mirror of VNDB routes, kept up to date with incremental syncs.
+
+    Every route is stored in its own table with one row per entry. A sync only fetches the
+    entries above the highest stored id (the high-water mark), plus a window of `recent` ids
+    below it to pick up recent edits. Mirrored routes can answer [Query](./query.md#azaka.query.Query)
+    objects locally.
+
+    Note:
+        The API doesn't expose modification times, so the recently changed window is expressed in ids:
+        new entries are the ones most likely to be edited.
+
+    Note:
+        The synced fields of every route are kept in the `azaka_fields` table,
+        [fetch](./mirror.md#azaka.mirror.Mirror.fetch) uses them to tell which queries the mirror can answer.
+
+    Example:
+        ```python
+        async with Client() as client:
+            mirror = Mirror(client, "vndb.db")
+            await mirror.sync("vn", "title", "released", "image.url", recent=500)
+            resp = mirror.execute(select("title").frm("vn").where(Node("id") >= "v17"))
+        ```
+    """
+
+    __slots__ = ("client", "path", "_conn")
+
+    def __init__(self, client: Client, path: str) -> None:
+        """
+        Mirror constructor.
+
+        Args:
+            client: The [Client](./client.md) object used to sync.
+            path: Path of the database file.
+        """
+        self.client = client
+        self.path = path
+        self._conn = sqlite3.connect(path)
+
+    def _table(self, route: str) -> str:
+        if not route.isidentifier():
+            raise ValueError(f"'{route}' is not a valid route")
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {route} "
+                "(id TEXT PRIMARY KEY, num INTEGER UNIQUE, data TEXT, synced REAL)"
+            )
+        return route
+
+    def high_water_mark(self, route: str) -> t.Optional[str]:
+        """
+        Returns the highest id stored for a route.
+
+        Args:
+            route: The route.
+
+        Returns:
+            The id, or [None][] if nothing is stored yet.
+        """
+        row = self._conn.execute(
+            f"SELECT id FROM {self._table(route)} ORDER BY num DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def fields(self, route: str) -> set[str]:
+        """
+        Returns the fields stored for every entry of a route.
+
+        Args:
+            route: The route.
+
+        Returns:
+            A [set][] of the fields, empty if the route hasn't been synced.
+        """
+        self._fields_table()
+        row = self._conn.execute(
+            "SELECT fields FROM azaka_fields WHERE route = ?", (route,)
+        ).fetchone()
+        return set(row[0].split(", ")) if row else set()
+
+    def _fields_table(self) -> None:
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS azaka_fields (route TEXT PRIMARY KEY, fields TEXT)"
+            )
+
+    def _covers(self, query: Query) -> bool:
+        body = query._body
+        stored = self.fields(query._route)
+        if not stored:
+            return False
+
+        def covered(field: str) -> bool:
+            parts = field.split(".")
+            return any(".".join(parts[:i]) in stored for i in range(1, len(parts) + 1))
+
+        try:
+            to_sql(body["filters"], id_column="num")
+            filters = list(_filter_fields(body["filters"])) if body["filters"] else []
+        except (ValueError, TypeError):
+            return False
+        fields = [i.strip() for i in body["fields"].split(",") if i.strip()]
+        return all(covered(i) for i in [*fields, *filters, body["sort"]])
+
+    def __len__(self) -> int:
+        tables = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name != 'azaka_fields'"
+        ).fetchall()
+        return sum(
+            self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+            for (name,) in tables
+        )
+
+    def upsert(self, route: str, rows: t.Iterable[t.Mapping[str, t.Any]]) -> None:
+        """
+        Inserts or replaces entries in one transaction.
+
+        Args:
+            route: The route of the entries.
+            rows: The raw results, each must contain the `id` field.
+        """
+        table, now = self._table(route), time.time()
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?, ?) ON CONFLICT(id) DO UPDATE "
+                "SET data = excluded.data, synced = excluded.synced",
+                (
+                    (
+                        i["id"],
+                        _id_number(i["id"]),
+                        json.dumps(i, ensure_ascii=False),
+                        now,
+                    )
+                    for i in rows
+                ),
+            )
+
+    async def sync(
+        self, route: str, *fields: str, recent: int = 0, page_size: int = 100
+    ) -> int:
+        """
+        Fetches the new and recently changed entries of a route.
+
+        Note:
+            Fetched entries replace the stored ones, sync a route with the same fields every time.
+            Only the fields shared with the previous syncs are recorded, until a sync fetches every entry again.
+
+        Args:
+            route: The route to sync.
+            fields: The fields to store.
+            recent: Number of ids below the high-water mark to fetch again.
+            page_size: Number of results per request.
+
+        Returns:
+            The number of entries fetched.
+        """
+        cursor = None
+        hwm = self.high_water_mark(route)
+        if hwm is not None:
+            prefix = ID_NUMBER.split(hwm)[0] or ID_PREFIXES.get(route, "")
+            start = _id_number(hwm) - recent
+            cursor = f"{prefix}{start}" if start > 0 else None
+
+        query = select(*fields).frm(route)
+        synced = {i.strip() for i in query._body["fields"].split(",")}
+        if cursor is not None:
+            synced &= self.fields(route) or synced
+        self._fields_table()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO azaka_fields VALUES (?, ?)",
+                (route, ", ".join(sorted(synced))),
+            )
+
+        paginator = CursorPaginator(self.client, query, page_size, cursor=cursor)
+        fetched = 0
+        while True:
+            data = await self.client._execute_raw(paginator.query)
+            rows = data["results"]
+            self.upsert(route, rows)
+            fetched += len(rows)
+            if not data.get("more") or not rows:
+                return fetched
+            paginator._advance(rows[-1]["id"])
+
+    def execute(self, query: Query) -> Response:
+        """
+        Answers a query from the mirror, with the semantics of [Client.execute](./client.md#azaka.client.Client.execute).
+
+        Filters are compiled with [to_sql](./evaluate.md#azaka.evaluate.to_sql).
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object.
+
+        Exceptions:
+            ValueError: A [ValueError][] is raised if a filter is invalid.
+        """
+        body = query._body
+        table = self._table(query._route)
+        where, params = to_sql(body["filters"], id_column="num")
+        sort = "num" if body["sort"] == "id" else "json_extract(data, ?)"
+        sort_params = [] if body["sort"] == "id" else [f"$.{body['sort']}"]
+        order = "DESC" if body["reverse"] else "ASC"
+
+        rows = self._conn.execute(
+            f"SELECT data FROM {table} WHERE {where} ORDER BY {sort} {order}, num {order} "
+            "LIMIT ? OFFSET ?",
+            [
+                *params,
+                *sort_params,
+                body["results"] + 1,
+                (body["page"] - 1) * body["results"],
+            ],
+        ).fetchall()
+
+        tree = field_tree(body["fields"])
+        results = [project(json.loads(i), tree) for (i,) in rows[: body["results"]]]
+        count = 1
+        if body["count"]:
+            count = self._conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE {where}", params
+            ).fetchone()[0]
+        return build_objects(
+            query._route,
+            {"results": results, "more": len(rows) > body["results"], "count": count},
+        )
+
+    def is_synced(self, route: str) -> bool:
+        """
+        Returns whether a route has been synced.
+
+        Args:
+            route: The route.
+        """
+        return self.high_water_mark(route) is not None
+
+    async def fetch(self, query: Query) -> Response:
+        """
+        Answers a query from the mirror if it can, from the API otherwise.
+
+        The mirror answers a query if its route has been synced with every field the query selects,
+        filters or sorts on, and its filters compile with [to_sql](./evaluate.md#azaka.evaluate.to_sql).
+        Filters without a field, such as `search`, are always sent to the API.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object.
+        """
+        if self._covers(query):
+            return self.execute(query)
+        return await self.client.execute(query)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
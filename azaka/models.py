@@ -84,7 +84,7 @@ class Response:
     Response [dataclasses.dataclass][] containing the results and metadata of a query.
 
     Attributes:
-        results list[t.NamedTuple]: A [list][] of nametuples dynamically created from the response representing the query results.
+        results Sequence[t.NamedTuple]: A [list][] of nametuples dynamically created from the response representing the query results, or a [LazyResults](./lazy.md#azaka.lazy.LazyResults) view if the client was created with `lazy_results=True`.
         more bool: If there are more results. Used for pagination.
         count int: Indicates the total number of entries that matched the given filters. Defaults to `1` if count is not explicitly set to true in the query.
         compact_filters Optional[str]: This is a compact string representation of the filters given in the query. Defaults to `None` if `compact_filters` is not explicitly set to `true` in the query.
@@ -0,0 +1,178 @@
+import json
+import typing as t
+from collections import OrderedDict
+
+from azaka.query import Query
+from azaka.utils import FT
+
+__all__ = ("optimize_filters", "FilterOptimizer")
+
+
+def _key(filters: t.Any) -> str:
+    return json.dumps(filters, separators=(",", ":"))
+
+
+def optimize_filters(filters: t.Optional[FT[str]]) -> FT[str]:
+    """
+    Rewrites filters into a smaller equivalent form.
+
+    - Nested groups with the same operator are flattened, `AND(a, AND(b, c))` becomes `AND(a, b, c)`.
+    - Duplicate predicates in a group are dropped.
+    - Empty `AND`s always match, they're dropped from `AND`s and make the `OR`s containing them match everything.
+    - Empty `OR`s never match, they're dropped from `OR`s and kept everywhere else.
+    - Groups left with a single predicate are replaced by it.
+
+    Sub-filters are optimized the same way.
+
+    Args:
+        filters: A [list][] of filters, as passed to [where](./query.md#azaka.query.Query.where).
+
+    Returns:
+        The optimized filters, an empty [list][] if they match everything.
+
+    Example:
+        ```python
+        optimize_filters(AND(Node("id") > "v1", AND(Node("id") > "v1", AND())))
+        # ['id', '>', 'v1']
+        ```
+    """
+    return _optimize(filters)[0]
+
+
+Optimized = tuple[FT[str], list[str]]
+
+
+def _optimize(filters: t.Optional[FT[str]]) -> Optimized:
+    # Returns the optimized filters with the keys of their members (their own key for a
+    # predicate), so flattening deeply nested groups doesn't serialize predicates again.
+    if not filters:
+        return [], []
+
+    op = filters[0]
+    if op in ("and", "or"):
+        members: list[tuple[t.Any, str, list[str]]] = []
+        seen: set[str] = set()
+        stack = [iter(filters[1:])]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            if child and child[0] == op:
+                stack.append(iter(child[1:]))
+                continue
+            node, keys = _optimize(t.cast(FT[str], child))
+            if not node:
+                if op == "or":
+                    return [], []
+                continue
+            if node[0] == op:
+                flat = [(i, k, [k]) for i, k in zip(node[1:], keys)]
+            elif node[0] in ("and", "or"):
+                key = f'[{",".join([json.dumps(node[0]), *keys])}]'
+                flat = [(node, key, keys)]
+            else:
+                flat = [(node, keys[0], keys)]
+            for member in flat:
+                if member[1] not in seen:
+                    seen.add(member[1])
+                    members.append(member)
+        if not members:
+            return ([op], []) if op == "or" else ([], [])
+        if len(members) < 2:
+            return members[0][0], members[0][2]
+        return [op, *(i[0] for i in members)], [i[1] for i in members]
+
+    name, cmp, value = t.cast(tuple[str, str, t.Any], filters)
+    if isinstance(value, list):
+        value = optimize_filters(value) or value
+    node = [name, cmp, value]
+    return node, [_key(node)]
+
+
+class FilterOptimizer:
+    """
+    Optimizes the filters of the queries sent by a [Client](./client.md) and reuses the
+    compact filter strings of hot queries.
+
+    Filters are rewritten with [optimize_filters](./optimize.md#azaka.optimize.optimize_filters).
+    Once the same filters have been sent `hot` times, the `compact_filters` flag is requested and the
+    compact string returned by the API is sent in place of the filters from then on.
+
+    Example:
+        ```python
+        async with Client(optimizer=FilterOptimizer(hot=2)) as client:
+            ...
+        ```
+    """
+
+    __slots__ = ("hot", "maxsize", "_uses", "_compact")
+
+    def __init__(self, hot: int = 3, maxsize: int = 1024) -> None:
+        """
+        FilterOptimizer constructor.
+
+        Args:
+            hot: Number of times the same filters are sent before their compact string is requested, `0` disables compaction.
+            maxsize: Maximum number of filters tracked, the least recently used ones are forgotten first.
+        """
+        if hot < 0:
+            raise ValueError("'hot' must be a non-negative integer")
+        if maxsize <= 0:
+            raise ValueError("'maxsize' must be a positive integer")
+        self.hot = hot
+        self.maxsize = maxsize
+        self._uses: OrderedDict[str, int] = OrderedDict()
+        self._compact: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._compact)
+
+    def _touch(self, cache: OrderedDict[str, t.Any], key: str, value: t.Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def prepare(self, query: Query) -> Query:
+        """
+        Returns the query to send in place of the given one.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A new [Query](./query.md#azaka.query.Query) object, or the same one if it has no filters.
+        """
+        filters = query._body["filters"]
+        if not filters or not isinstance(filters, list):
+            return query
+
+        filters = optimize_filters(filters)
+        key = f"{query._route}:{_key(filters)}"
+        compact = self._compact.get(key)
+        if compact is not None:
+            self._compact.move_to_end(key)
+            return query._derive(filters=compact)
+
+        if self.hot and filters:
+            uses = self._uses.get(key, 0) + 1
+            self._touch(self._uses, key, uses)
+            if uses >= self.hot:
+                return query._derive(filters=filters, compact_filters=True)
+        return query._derive(filters=filters)
+
+    def learn(self, query: Query, data: t.Mapping[str, t.Any]) -> None:
+        """
+        Stores the compact filter string from the response of a prepared query.
+
+        Args:
+            query: The [Query](./query.md#azaka.query.Query) returned by [prepare](./optimize.md#azaka.optimize.FilterOptimizer.prepare).
+            data: The decoded response.
+        """
+        filters = query._body["filters"]
+        compact = data.get("compact_filters")
+        if compact and filters and isinstance(filters, list):
+            key = f"{query._route}:{_key(filters)}"
+            self._uses.pop(key, None)
+            self._touch(self._compact, key, compact)
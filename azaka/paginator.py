@@ -1,16 +1,32 @@
+import asyncio
+import itertools
 import typing as t
+from collections import deque
 
 from azaka.client import Client
+from azaka.columnar import ColumnarResponse, ColumnBuilder
 from azaka.models import Response
-from azaka.query import Query
+from azaka.query import AND, Node, Query
 
-__all__ = ("Paginator",)
+__all__ = ("Paginator", "CursorPaginator")
+
+
+def _last_id(resp: Response) -> str:
+    return t.cast(str, getattr(resp.results[-1], "id"))
 
 
 class Paginator:
     """
     Paginator class for starting a pagination session.
 
+    With `prefetch` set, iterating keeps up to that many of the next pages in flight while the
+    current one is processed, and buffers up to that many fetched pages. Pages still in flight
+    are cancelled when the iteration stops, including on `break`.
+
+    Note:
+        The number of pages isn't known in advance, so the last `prefetch` requests may be for
+        pages past the end.
+
     Example:
         ```python
         async def main() -> None:
@@ -29,7 +45,7 @@ class Paginator:
         ```
     """
 
-    __slots__ = ("client", "query", "_resp", "_exit_after")
+    __slots__ = ("client", "query", "prefetch", "_resp", "_exit_after")
 
     def __init__(
         self,
@@ -37,6 +53,7 @@ class Paginator:
         query: Query,
         max_results_per_page: int,
         exit_after: t.Optional[int] = None,
+        prefetch: int = 0,
     ) -> None:
         """
         Paginator constructor.
@@ -46,10 +63,13 @@ class Paginator:
             query: The [Query](./query.md#azaka.query.Query) object for pagination.
             max_results_per_page: Maximum number of results per page.
             exit_after: Exit after a certain number of pages.
+            prefetch: Number of pages fetched ahead of the consumer when iterating, `0` disables it.
         """
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ValueError("'prefetch' must be a non-negative integer")
         self.client = client
-        query._body["results"] = max_results_per_page
-        self.query = query
+        self.prefetch = prefetch
+        self.query = query._derive(results=max_results_per_page)
         self._resp: t.Optional[Response] = None
         self._exit_after = exit_after
 
@@ -68,7 +88,7 @@ class Paginator:
             return await self._generate()
 
         if self._resp.more:
-            self.query._body["page"] += 1
+            self.query = self.query._derive(page=self.query._body["page"] + 1)
             return await self._generate()
 
         return None
@@ -81,16 +101,64 @@ class Paginator:
             A [Response](./models.md#azaka.models.Response) object.
         """
         if self.query and self.query._body["page"] > 1:
-            self.query._body["page"] -= 1
+            self.query = self.query._derive(page=self.query._body["page"] - 1)
             return await self._generate()
         return None
 
-    def __aiter__(self) -> t.Self:
-        return self
+    def __aiter__(self) -> t.AsyncIterator[Response]:
+        return self._prefetched(self.prefetch) if self.prefetch else self
+
+    async def _prefetched(self, depth: int) -> t.AsyncGenerator[Response, None]:
+        if self._resp:
+            if not (self._resp.more and self._resp.results):
+                return
+            self._advance(_last_id(self._resp))
+
+        queue: asyncio.Queue[Response | BaseException | None] = asyncio.Queue(depth)
+
+        async def produce() -> None:
+            pages = self._read_ahead(depth)
+            try:
+                async for resp in pages:
+                    await queue.put(resp)
+                    if not (resp.more and resp.results):
+                        break
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await pages.aclose()
+            await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while not self._handle_counter():
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                if self._resp:
+                    self._advance(_last_id(self._resp))
+                self._resp = item
+                yield item
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _read_ahead(self, limit: int) -> t.AsyncGenerator[Response, None]:
+        pages = self._window(itertools.count(self.query._body["page"]), limit, True)
+        try:
+            async for _, resp in pages:
+                yield resp
+        finally:
+            await pages.aclose()
 
     async def __anext__(self) -> Response:
+        if self._handle_counter():
+            raise StopAsyncIteration
+
         data = await self.next()
-        if not data or self._handle_counter():
+        if not data:
             raise StopAsyncIteration
 
         return data
@@ -114,6 +182,134 @@ class Paginator:
         """
         return self._resp
 
+    async def concurrent(
+        self, limit: int = 4, ordered: bool = True
+    ) -> t.AsyncGenerator[Response, None]:
+        """
+        Fetch the pages concurrently.
+
+        The first page is requested with the `count` flag set to work out the number of pages,
+        the remaining pages are then fetched with at most `limit` requests in flight. Afterwards
+        the paginator is on the highest page yielded, as after iterating it.
+
+        Args:
+            limit: Maximum number of pages fetched at the same time.
+            ordered: Yield the pages in order. If `False`, pages are yielded as they complete.
+
+        Returns:
+            An asynchronous iterator of [Response](./models.md#azaka.models.Response) objects.
+
+        Example:
+            ```python
+            async for page in paginator.concurrent(limit=8):
+                for vn in page.results:
+                    print(vn.title)
+            ```
+        """
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError("'limit' must be a positive integer")
+
+        body = self.query._body
+        first = self.query._derive(count=True)
+        if self._handle_counter():
+            return
+        resp = await self.client.execute(query=first)
+        self._resp = resp
+        yield resp
+
+        start = body["page"]
+        last = -(-resp.count // body["results"])
+        if self._exit_after is not None:
+            last = min(last, start + self._exit_after)
+
+        pages = self._window(iter(range(start + 1, last + 1)), limit, ordered)
+        try:
+            async for page, resp in pages:
+                self._handle_counter()
+                if page > self.query._body["page"]:
+                    self.query = self.query._derive(page=page)
+                    self._resp = resp
+                yield resp
+        finally:
+            await pages.aclose()
+
+    async def _window(
+        self, pages: t.Iterator[int], limit: int, ordered: bool
+    ) -> t.AsyncGenerator[tuple[int, Response], None]:
+        pending: deque[asyncio.Task[tuple[int, Response]]] = deque()
+
+        async def fetch(page: int) -> tuple[int, Response]:
+            return page, await self.client.execute(query=self.query._derive(page=page))
+
+        def schedule() -> None:
+            for page in itertools.islice(pages, limit - len(pending)):
+                pending.append(asyncio.ensure_future(fetch(page)))
+
+        try:
+            schedule()
+            while pending:
+                if ordered:
+                    item = await pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    pending.remove(task)
+                    item = task.result()
+                schedule()
+                yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def rows(self) -> t.AsyncIterator[t.Any]:
+        """
+        Iterate over the results of every page one at a time.
+
+        Each page is streamed with [Client.iter_rows](./client.md#azaka.client.Client.iter_rows),
+        so memory stays flat no matter how large the pages are.
+
+        Returns:
+            An asynchronous iterator of results.
+        """
+        while not self._handle_counter():
+            stream = self.client.iter_rows(self.query)
+            last = None
+            async for last in stream:
+                yield last
+
+            if not stream.more or last is None:
+                return
+            self._advance(last.id)
+
+    async def columns(self, dictionary_encode: bool = True) -> ColumnarResponse:
+        """
+        Collect the results of every page into columns.
+
+        The columns are built as the pages arrive, without creating an object per result.
+
+        Args:
+            dictionary_encode: Dictionary encode string columns.
+
+        Returns:
+            A [ColumnarResponse](./columnar.md#azaka.columnar.ColumnarResponse) object.
+        """
+        builder = ColumnBuilder(dictionary_encode)
+        meta: dict[str, t.Any] = {}
+        while not self._handle_counter():
+            meta = await self.client._execute_raw(self.query)
+            results = meta.pop("results")
+            builder.extend(results)
+
+            if not meta.get("more") or not results:
+                break
+            self._advance(results[-1]["id"])
+        return builder.build(**meta)
+
+    def _advance(self, last_id: str) -> None:
+        self.query = self.query._derive(page=self.query._body["page"] + 1)
+
     async def flatten(self) -> list[Response]:
         """
         Flatten the results of the pagination into a [list][].
@@ -122,3 +318,138 @@ class Paginator:
             list[Response]: A [list][] of [Response](./models.md#azaka.models.Response) objects.
         """
         return [i async for i in self]
+
+
+class CursorPaginator(Paginator):
+    """
+    Paginator class which uses keyset (id cursor) pagination instead of page numbers.
+
+    Results are sorted by `id` and every step adds an `id` bound after the last seen id
+    to the filters of the query, so deep pages are as cheap as the first one.
+    Saving [cursor](./paginator.md#azaka.paginator.CursorPaginator.cursor) and passing
+    it back to the constructor resumes the pagination.
+
+    Note:
+        The `id` field is always selected by [select](./query.md#azaka.query.select),
+        the paginator relies on it to advance.
+
+    Example:
+        ```python
+        async def main() -> None:
+            query = select("id", "title").frm("vn").where(Node("olang") == "en")
+
+            async with Client() as client:
+                paginator = CursorPaginator(client, query=query, max_results_per_page=100)
+                async for page in paginator:
+                    for vn in page.results:
+                        print(vn.title)
+                    save(paginator.cursor)
+        ```
+    """
+
+    __slots__ = ("_filters", "_cursors")
+
+    def __init__(
+        self,
+        client: Client,
+        query: Query,
+        max_results_per_page: int,
+        exit_after: t.Optional[int] = None,
+        cursor: t.Optional[str] = None,
+        prefetch: int = 0,
+    ) -> None:
+        """
+        CursorPaginator constructor.
+
+        Args:
+            client: The [Client](./client.md) object.
+            query: The [Query](./query.md#azaka.query.Query) object for pagination.
+            max_results_per_page: Maximum number of results per page.
+            exit_after: Exit after a certain number of pages.
+            cursor: The id after which the pagination starts.
+            prefetch: Number of pages fetched ahead of the consumer when iterating, `0` disables it.
+        """
+        super().__init__(client, query, max_results_per_page, exit_after, prefetch)
+        self._filters = query._body["filters"]
+        self._cursors: list[t.Optional[str]] = [cursor]
+        self.query = self._step(cursor)
+
+    @property
+    def cursor(self) -> t.Optional[str]:
+        """
+        The id of the last result of the current page.
+        """
+        if self._resp and self._resp.results:
+            return _last_id(self._resp)
+        return self._cursors[-1]
+
+    def _step(self, cursor: t.Optional[str]) -> Query:
+        filters = self._filters
+        if cursor is not None:
+            node = Node("id")
+            bound = node < cursor if self.query._body["reverse"] else node > cursor
+            filters = AND(filters, bound) if filters else bound
+        return self.query._derive(filters=filters, sort="id", page=1)
+
+    async def next(self) -> t.Optional[Response]:
+        """
+        Progress to the next page of results.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object.
+        """
+        if not self._resp:
+            return await self._generate()
+
+        if self._resp.more and self._resp.results:
+            self._cursors.append(_last_id(self._resp))
+            self.query = self._step(self._cursors[-1])
+            return await self._generate()
+
+        return None
+
+    async def previous(self) -> t.Optional[Response]:
+        """
+        Move back to the previous page of results.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object.
+        """
+        if len(self._cursors) > 1:
+            self._cursors.pop()
+            self.query = self._step(self._cursors[-1])
+            return await self._generate()
+        return None
+
+    def _advance(self, last_id: str) -> None:
+        self._cursors.append(last_id)
+        self.query = self._step(last_id)
+
+    async def _read_ahead(self, limit: int) -> t.AsyncGenerator[Response, None]:
+        query = self.query
+        while True:
+            resp = await self.client.execute(query=query)
+            yield resp
+            if not (resp.more and resp.results):
+                return
+            query = self._step(_last_id(resp))
+
+    def concurrent(
+        self, limit: int = 4, ordered: bool = True
+    ) -> t.AsyncGenerator[Response, None]:
+        """
+        Fetch the pages ahead of the consumer.
+
+        Every step depends on the last id of the previous page, so the pages are requested one
+        after another, while up to `limit` fetched pages wait for the consumer.
+
+        Args:
+            limit: Maximum number of fetched pages waiting for the consumer.
+            ordered: Has no effect, the pages are always yielded in order.
+
+        Returns:
+            An asynchronous iterator of [Response](./models.md#azaka.models.Response) objects.
+        """
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError("'limit' must be a positive integer")
+        return self._prefetched(limit)
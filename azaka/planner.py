@@ -0,0 +1,137 @@
+import asyncio
+import time
+import typing as t
+
+from azaka.client import Client
+from azaka.lazy import build_lazy_objects
+from azaka.models import Response
+from azaka.query import Query
+from azaka.utils import build_objects, clean_string
+
+__all__ = ("Planner",)
+
+
+def _top(field: str) -> str:
+    return field.split(".", 1)[0]
+
+
+class Planner:
+    """
+    Planner class for splitting queries with wide field lists into narrower queries.
+
+    The fields are split into groups, each group is fetched by its own query with the same filters,
+    sort and page, and the queries run concurrently. The rows are then joined by `id`.
+    Fields sharing a top level field, such as `image.url` and `image.sexual`, always stay in the same group.
+
+    Every group goes through [Client.execute](./client.md#azaka.client.Client.execute)'s cache,
+    so the groups of fields that rarely change can be cached separately.
+
+    Note:
+        The groups must agree on which entries are on the page, sort by a key that doesn't change
+        between the requests, such as `id`.
+
+    Example:
+        ```python
+        async with Client(cache=ResponseCache()) as client:
+            planner = Planner(client, groups=[("title", "released"), ("tags.name",)])
+            query = select("title", "released", "tags.name", "releases.producers.name").frm("vn")
+            resp = await planner.execute(query)
+            print(planner.latencies)
+        ```
+    """
+
+    __slots__ = ("client", "groups", "max_fields", "latencies")
+
+    def __init__(
+        self,
+        client: Client,
+        groups: t.Optional[t.Sequence[t.Sequence[str]]] = None,
+        max_fields: int = 8,
+    ) -> None:
+        """
+        Planner constructor.
+
+        Args:
+            client: The [Client](./client.md) object.
+            groups: Fields fetched together, the remaining fields are grouped by `max_fields`.
+            max_fields: Maximum number of fields in a group that isn't given explicitly.
+
+        Attributes:
+            latencies (dict[str, float]): The latency in seconds of the last request of each group, keyed by its fields.
+        """
+        if not isinstance(max_fields, int) or max_fields < 1:
+            raise ValueError("'max_fields' must be a positive integer")
+        self.client = client
+        self.groups = [[clean_string(i) for i in group] for group in groups or ()]
+        self.max_fields = max_fields
+        self.latencies: dict[str, float] = {}
+
+    def plan(self, query: Query) -> list[Query]:
+        """
+        Splits a query into the queries of its field groups.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A [list][] of [Query](./query.md#azaka.query.Query) objects, each selecting `id` and the fields of a group.
+        """
+        fields = [i.strip() for i in query._body["fields"].split(",") if i.strip()]
+        tops: dict[str, list[str]] = {}
+        for field in fields:
+            if field != "id":
+                tops.setdefault(_top(field), []).append(field)
+
+        groups: list[list[str]] = []
+        for group in self.groups:
+            taken = [top for top in dict.fromkeys(map(_top, group)) if top in tops]
+            if taken:
+                groups.append([i for top in taken for i in tops.pop(top)])
+
+        rest: list[str] = []
+        for top_fields in tops.values():
+            if rest and len(rest) + len(top_fields) > self.max_fields:
+                groups.append(rest)
+                rest = []
+            rest += top_fields
+        if rest:
+            groups.append(rest)
+
+        return [query._derive(fields=", ".join(["id", *i])) for i in groups] or [query]
+
+    async def _run(self, query: Query) -> dict[str, t.Any]:
+        start = time.perf_counter()
+        data = await self.client._execute_raw(query)
+        self.latencies[query._body["fields"]] = time.perf_counter() - start
+        return data
+
+    async def execute(self, query: Query) -> Response:
+        """
+        Sends the queries of the field groups concurrently and joins their results.
+
+        Args:
+            query: A [Query](./query.md#azaka.query.Query) object.
+
+        Returns:
+            A [Response](./models.md#azaka.models.Response) object, with the results ordered as by a single query.
+        """
+        queries = self.plan(query)
+        pages = await asyncio.gather(*(self._run(i) for i in queries))
+
+        data = pages[0]
+        order = [_top(i.strip()) for i in query._body["fields"].split(",") if i.strip()]
+        order = list(dict.fromkeys(["id", *order]))
+        rows: dict[str, dict[str, t.Any]] = {}
+        for page in pages:
+            for row in page["results"]:
+                rows.setdefault(row["id"], {}).update(row)
+
+        data["results"] = [
+            {key: rows[i["id"]].get(key) for key in order} for i in data["results"]
+        ]
+        if self.client.use_decoders:
+            decoder = await self.client._get_decoder(query)
+            return decoder.decode(data)
+        if self.client.lazy_results:
+            return build_lazy_objects(query._route, data)
+        return build_objects(query._route, data)
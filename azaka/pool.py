@@ -0,0 +1,199 @@
+import asyncio
+import time
+import typing as t
+from types import TracebackType
+
+from azaka.client import Client
+from azaka.columnar import ColumnarResponse
+from azaka.exceptions import ThrottledError
+from azaka.models import Response, User
+from azaka.query import Query
+from azaka.ratelimit import RateLimiter
+from azaka.stream import RowStream
+
+__all__ = ("ClientPool",)
+
+T = t.TypeVar("T")
+
+
+class ClientPool:
+    """
+    A pool of [Client](./client.md)s spreading the load over several API tokens.
+
+    Every token gets its own client and [RateLimiter](./ratelimit.md). Each call goes to the
+    least loaded client which isn't cooling down. A client answering with `429` is taken out of
+    rotation for `cooldown` seconds, doubled for every further consecutive throttle, and the call
+    is sent again through another client.
+
+    The pool has the same `execute` API as a [Client](./client.md), so it can drive a
+    [Paginator](./paginator.md) unchanged.
+
+    Note:
+        The limiters of the pool don't retry (`max_retries=0`), so a `429` is handled by moving the
+        call to another client. A `502` isn't retried either, pass a [RetryPolicy](./retry.md) as
+        `retry` to retry it.
+
+    Example:
+        ```python
+        async with ClientPool(["token1", "token2", "token3"]) as pool:
+            paginator = Paginator(pool, query, max_results_per_page=100)
+            async for page in paginator:
+                ...
+        ```
+    """
+
+    __slots__ = (
+        "clients",
+        "cooldown",
+        "max_cooldown",
+        "max_attempts",
+        "_until",
+        "_strikes",
+        "_busy",
+    )
+
+    def __init__(
+        self,
+        tokens: t.Iterable[str],
+        *,
+        requests: int = 200,
+        window: float = 300.0,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+        max_attempts: t.Optional[int] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """
+        ClientPool constructor.
+
+        Args:
+            tokens: VNDB API access tokens.
+            requests: Number of requests allowed per window for each token.
+            window: Length of the window in seconds.
+            cooldown: Time in seconds a throttled client is out of rotation.
+            max_cooldown: Upper bound of the cooldown in seconds.
+            max_attempts: Maximum number of clients a throttled call is sent through, twice the number of tokens by default.
+            kwargs: Keyword arguments passed to every [Client](./client.md), such as a shared `connector`.
+
+        Exceptions:
+            ValueError: A [ValueError][] is raised if no token is given, or if a `rate_limiter` is passed.
+        """
+        if "rate_limiter" in kwargs:
+            raise ValueError(
+                "'rate_limiter' can't be passed to ClientPool, use 'requests' and 'window' instead"
+            )
+        self.clients = [
+            Client(
+                token,
+                rate_limiter=RateLimiter(requests, window, max_retries=0),
+                **kwargs,
+            )
+            for token in tokens
+        ]
+        if not self.clients:
+            raise ValueError("'tokens' cannot be empty")
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_attempts = max_attempts or 2 * len(self.clients)
+        self._until = [0.0] * len(self.clients)
+        self._strikes = [0] * len(self.clients)
+        self._busy = [0] * len(self.clients)
+
+    async def __aenter__(self) -> t.Self:
+        for client in self.clients:
+            await client._create_cs()
+        return self
+
+    async def __aexit__(
+        self,
+        exc: t.Optional[t.Type[BaseException]],
+        exc_val: t.Optional[BaseException],
+        tb: t.Optional[TracebackType],
+    ) -> None:
+        await self.close_cs()
+
+    async def close_cs(self) -> None:
+        """
+        Closes the sessions of all the clients.
+        """
+        await asyncio.gather(*(i.close_cs() for i in self.clients))
+
+    @property
+    def available(self) -> int:
+        """
+        Number of clients currently in rotation.
+        """
+        now = time.monotonic()
+        return sum(until <= now for until in self._until)
+
+    def _load(self, index: int) -> tuple[int, float]:
+        limiter = t.cast(RateLimiter, self.clients[index].rate_limiter)
+        return (self._busy[index], -limiter.tokens)
+
+    async def _pick(self) -> int:
+        while True:
+            now = time.monotonic()
+            ready = [i for i, until in enumerate(self._until) if until <= now]
+            if ready:
+                return min(ready, key=self._load)
+            await asyncio.sleep(min(self._until) - now)
+
+    def _throttled(self, index: int) -> None:
+        delay = min(self.max_cooldown, self.cooldown * 2 ** self._strikes[index])
+        self._until[index] = time.monotonic() + delay
+        self._strikes[index] += 1
+
+    async def _call(self, fn: t.Callable[[Client], t.Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            index = await self._pick()
+            self._busy[index] += 1
+            try:
+                result = await fn(self.clients[index])
+            except ThrottledError:
+                self._throttled(index)
+                attempt += 1
+                if attempt >= self.max_attempts:
+                    raise
+                continue
+            finally:
+                self._busy[index] -= 1
+            self._strikes[index] = 0
+            return result
+
+    async def execute(self, query: Query) -> Response:
+        """
+        Sends the query through the least loaded client, see [Client.execute](./client.md#azaka.client.Client.execute).
+        """
+        return await self._call(lambda client: client.execute(query))
+
+    async def execute_columnar(
+        self, query: Query, dictionary_encode: bool = True
+    ) -> ColumnarResponse:
+        """
+        Sends the query through the least loaded client, see [Client.execute_columnar](./client.md#azaka.client.Client.execute_columnar).
+        """
+        return await self._call(
+            lambda client: client.execute_columnar(query, dictionary_encode)
+        )
+
+    async def _execute_raw(self, query: Query) -> dict[str, t.Any]:
+        return await self._call(lambda client: client._execute_raw(query))
+
+    def iter_rows(self, query: Query) -> RowStream:
+        """
+        Streams the query through the least loaded client in rotation, see [Client.iter_rows](./client.md#azaka.client.Client.iter_rows).
+
+        Note:
+            A stream isn't sent again if it gets throttled.
+        """
+        now = time.monotonic()
+        ready = [i for i, until in enumerate(self._until) if until <= now]
+        index = min(ready or range(len(self.clients)), key=self._load)
+        return self.clients[index].iter_rows(query)
+
+    async def get_user(self, *users: str, fields: t.Sequence[str] = ()) -> list[User]:
+        """
+        Looks users up through the least loaded client, see [Client.get_user](./client.md#azaka.client.Client.get_user).
+        """
+        return await self._call(lambda client: client.get_user(*users, fields=fields))
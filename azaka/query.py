@@ -1,9 +1,11 @@
+import copy
 import json
+import types
 import typing as t
 
 from azaka.utils import FT, clean_string
 
-__all__ = ("select", "AND", "OR", "Node", "Query")
+__all__ = ("select", "AND", "OR", "Node", "Query", "FrozenQuery")
 
 BASE = "https://api.vndb.org/kana"
 
@@ -107,6 +109,9 @@ class Query:
             "normalized_filters": False,
         }
 
+    def _derive(self, **body: t.Any) -> "Query":
+        return Query(self._route, t.cast(Body, {**self._body, **body}))
+
     def frm(self, route: str) -> t.Self:
         """
         The `frm` directive is used to specify the route of the query. 
@@ -229,9 +234,135 @@ class Query:
         """
         Returns the low level representation of the query body.
         """
+        return t.cast(str, self.dump())
+
+    def dump(self, dumps: t.Callable[[t.Any], str | bytes] = json.dumps) -> str | bytes:
+        """
+        Returns the query body serialized with the given function.
+
+        Args:
+            dumps: The JSON serializer, [json.dumps][] by default.
+        """
         if not self._body["fields"]:
             raise ValueError("'fields' cannot be empty.")
-        return json.dumps(self._body)
+        return dumps(self._body)
+
+    def freeze(self) -> "FrozenQuery":
+        """
+        Returns an immutable copy of the query.
+
+        Returns:
+            A [FrozenQuery](./query.md#azaka.query.FrozenQuery) object.
+        """
+        return FrozenQuery(self._route, self._body)
+
+
+class FrozenQuery(Query):
+    """
+    An immutable and hashable [Query](./query.md#azaka.query.Query).
+
+    The directives return new queries instead of changing this one, so a frozen query can be shared
+    across coroutines and used as a key. The serialized body is computed once per serializer.
+
+    Note:
+        Unlike [Query.set_flags](./query.md#azaka.query.Query.set_flags), `set_flags` returns the new query.
+
+    Example:
+        ```python
+        query = select("title").frm("vn").freeze()
+        english = query.where(Node("olang") == "en")
+        pages = [english.with_page(i) for i in range(1, 4)]
+        ```
+    """
+
+    __slots__ = ("_key", "_dumped")
+
+    _key: t.Optional[str]
+    _dumped: dict[t.Callable[[t.Any], str | bytes], str | bytes]
+
+    def __init__(self, route: str = "", body: t.Optional[Body] = None) -> None:
+        body = t.cast(Body, dict(body or self._defaults()))
+        body["filters"] = copy.deepcopy(body["filters"])
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_body", types.MappingProxyType(body))
+        object.__setattr__(self, "_key", None)
+        object.__setattr__(self, "_dumped", {})
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def _derive(self, **body: t.Any) -> "FrozenQuery":
+        return FrozenQuery(self._route, t.cast(Body, {**self._body, **body}))
+
+    def frm(self, route: str) -> "FrozenQuery":  # type: ignore[override]
+        return FrozenQuery(clean_string(route), t.cast(Body, self._body))
+
+    def where(self, filters: t.Optional[FT[str]] = None) -> "FrozenQuery":  # type: ignore[override]
+        return self._derive(filters=filters) if filters else self
+
+    def sort(self, key: t.Optional[str] = None) -> "FrozenQuery":  # type: ignore[override]
+        return self._derive(sort=key) if key else self
+
+    def set_flags(  # type: ignore[override]
+        self,
+        reverse: bool = False,
+        count: bool = False,
+        compact_filters: bool = False,
+        normalized_filters: bool = False,
+    ) -> "FrozenQuery":
+        return self._derive(
+            reverse=reverse,
+            count=count,
+            compact_filters=compact_filters,
+            normalized_filters=normalized_filters,
+        )
+
+    def with_page(self, page: int, results: t.Optional[int] = None) -> "FrozenQuery":
+        """
+        Returns a copy of the query for another page.
+
+        Args:
+            page: The page number.
+            results: The number of results per page, unchanged by default.
+
+        Returns:
+            A [FrozenQuery](./query.md#azaka.query.FrozenQuery) object.
+        """
+        if results is None:
+            return self._derive(page=page)
+        return self._derive(page=page, results=results)
+
+    def freeze(self) -> "FrozenQuery":
+        return self
+
+    def dump(self, dumps: t.Callable[[t.Any], str | bytes] = json.dumps) -> str | bytes:
+        dumped = self._dumped.get(dumps)
+        if dumped is None:
+            if not self._body["fields"]:
+                raise ValueError("'fields' cannot be empty.")
+            dumped = self._dumped[dumps] = dumps(dict(self._body))
+        return dumped
+
+    @property
+    def key(self) -> str:
+        """
+        The canonical representation of the query, equal for queries with the same route and body.
+        """
+        if self._key is None:
+            body = json.dumps(dict(self._body), sort_keys=True, separators=(",", ":"))
+            object.__setattr__(self, "_key", f"{self._route}:{body}")
+        return t.cast(str, self._key)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenQuery):
+            return NotImplemented
+        return self.key == other.key
+
+    def __repr__(self) -> str:
+        return f"<FrozenQuery {self.key}>"
 
 
 class Node:
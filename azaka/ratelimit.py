@@ -0,0 +1,192 @@
+import asyncio
+import contextlib
+import random
+import time
+import typing as t
+
+import aiohttp
+
+from azaka.exceptions import STATUS_SERVER_DOWN, STATUS_THROTTLED
+
+__all__ = ("RateLimiter",)
+
+RETRY_STATUSES = frozenset((STATUS_THROTTLED, STATUS_SERVER_DOWN))
+
+
+class RateLimiter:
+    """
+    An asynchronous token bucket rate limiter with adaptive backoff.
+
+    Every request takes a token from the bucket, the bucket refills at `requests / window`
+    tokens per second and holds at most `requests` tokens. When the API answers with
+    `429` or `502`, the request is retried after an exponential backoff with jitter.
+    A `429` also halves the refill rate, and every successful request then recovers a part
+    of the rate, so the sustained throughput settles right under the limit of the API.
+    A `502` is a server fault rather than a limit, so it leaves the rate alone.
+
+    Example:
+        ```python
+        async with Client(rate_limiter=RateLimiter(requests=200, window=300)) as client:
+            ...
+        ```
+    """
+
+    __slots__ = (
+        "requests",
+        "window",
+        "max_concurrency",
+        "max_retries",
+        "base_delay",
+        "max_delay",
+        "_rate",
+        "_tokens",
+        "_updated",
+        "_waiting",
+        "_in_flight",
+        "_lock",
+        "_semaphore",
+    )
+
+    def __init__(
+        self,
+        requests: int = 200,
+        window: float = 300.0,
+        max_concurrency: t.Optional[int] = None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        """
+        RateLimiter constructor.
+
+        Args:
+            requests: Number of requests allowed per window.
+            window: Length of the window in seconds.
+            max_concurrency: Maximum number of requests in flight, unbounded if [None][].
+            max_retries: Maximum number of retries of a throttled or failed request.
+            base_delay: The backoff delay of the first retry in seconds.
+            max_delay: Upper bound of the backoff delay in seconds.
+        """
+        if requests < 1 or window <= 0:
+            raise ValueError("'requests' and 'window' must be positive")
+        self.requests = requests
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._rate = requests / window
+        self._tokens = float(requests)
+        self._updated = time.monotonic()
+        self._waiting = 0
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of tokens currently available in the bucket.
+        """
+        self._refill()
+        return self._tokens
+
+    @property
+    def rate(self) -> float:
+        """
+        The current refill rate in tokens per second.
+        """
+        return self._rate
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of requests waiting for a token.
+        """
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests currently in flight.
+        """
+        return self._in_flight
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.requests), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Waits until a token is available and takes it.
+        """
+        self._waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                while self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+
+    def _throttled(self) -> None:
+        self._refill()
+        self._rate = max(self._rate / 2, 1 / self.window)
+        self._tokens = min(self._tokens, 0.0)
+
+    def _recovered(self) -> None:
+        nominal = self.requests / self.window
+        if self._rate < nominal:
+            self._refill()
+            self._rate = min(nominal, self._rate + nominal / 20)
+
+    def _delay(self, attempt: int, resp: aiohttp.ClientResponse) -> float:
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        delay = random.uniform(delay / 2, delay)
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, min(self.max_delay, float(retry_after)))
+        return delay
+
+    async def run(
+        self, send: t.Callable[[], t.Awaitable[aiohttp.ClientResponse]]
+    ) -> aiohttp.ClientResponse:
+        """
+        Sends a request under the limits, retrying it if it gets throttled.
+
+        Args:
+            send: A callable which sends the request.
+
+        Returns:
+            The [aiohttp.ClientResponse](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse) of the last attempt.
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            async with self._semaphore or contextlib.nullcontext():
+                self._in_flight += 1
+                try:
+                    resp = await send()
+                finally:
+                    self._in_flight -= 1
+
+            if resp.status not in RETRY_STATUSES:
+                self._recovered()
+                return resp
+
+            if resp.status == STATUS_THROTTLED:
+                self._throttled()
+            if attempt >= self.max_retries:
+                return resp
+
+            resp.release()
+            await asyncio.sleep(self._delay(attempt, resp))
+            attempt += 1
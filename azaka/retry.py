@@ -0,0 +1,203 @@
+import asyncio
+import random
+import time
+import typing as t
+from collections import deque
+
+import aiohttp
+
+from azaka.exceptions import STATUS_SERVER_DOWN, STATUS_SERVER_ERROR, AzakaException
+
+__all__ = ("RetryPolicy",)
+
+T = t.TypeVar("T")
+
+RETRY_STATUSES = frozenset((STATUS_SERVER_ERROR, STATUS_SERVER_DOWN))
+RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with exponential backoff and jitter, and optionally hedges slow ones.
+
+    A request is retried when it raises one of `exceptions`, or an
+    [AzakaException](./exceptions.md#azaka.exceptions.AzakaException) with one of `statuses`.
+    With hedging enabled, a duplicate of an idempotent request is sent when the first one takes
+    longer than the `hedge_percentile` of the recent latencies, and whichever answers first wins.
+    Every endpoint used by the [Client](./client.md) is a read, so all of its requests can be hedged.
+
+    Note:
+        Throttling (`429`) is left to the [RateLimiter](./ratelimit.md), which applies to every attempt.
+        A [Client](./client.md) with a retrying limiter leaves the statuses the limiter retries to it,
+        so a request isn't retried by both.
+
+    Example:
+        ```python
+        async with Client(retry=RetryPolicy(max_attempts=4, hedge=True)) as client:
+            ...
+        ```
+    """
+
+    __slots__ = (
+        "max_attempts",
+        "base_delay",
+        "max_delay",
+        "statuses",
+        "exceptions",
+        "hedge",
+        "hedge_percentile",
+        "hedge_delay",
+        "min_samples",
+        "retries",
+        "hedges",
+        "_latencies",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        statuses: t.Iterable[int] = RETRY_STATUSES,
+        exceptions: t.Iterable[type[BaseException]] = RETRY_EXCEPTIONS,
+        hedge: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_delay: t.Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 256,
+    ) -> None:
+        """
+        RetryPolicy constructor.
+
+        Args:
+            max_attempts: Maximum number of attempts of a request, including the first one.
+            base_delay: Delay in seconds before the first retry, doubled for every further retry.
+            max_delay: Maximum delay in seconds between two attempts.
+            statuses: Status codes of the errors which are retried.
+            exceptions: Exception types which are retried.
+            hedge: Send a duplicate of slow idempotent requests.
+            hedge_percentile: Percentile of the recent latencies after which a request is hedged.
+            hedge_delay: Fixed delay in seconds after which a request is hedged, overrides `hedge_percentile`.
+            min_samples: Number of latencies needed before hedging on the percentile.
+            window: Number of recent latencies kept.
+
+        Attributes:
+            retries (int): Number of retries made.
+            hedges (int): Number of hedged requests sent.
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("'max_attempts' must be a positive integer")
+        if not 0 < hedge_percentile < 100:
+            raise ValueError("'hedge_percentile' must be between 0 and 100")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.exceptions = tuple(exceptions)
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.min_samples = min_samples
+        self.retries = 0
+        self.hedges = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def is_retryable(self, error: BaseException, skip: t.Collection[int] = ()) -> bool:
+        """
+        Returns whether an error is retried.
+
+        Args:
+            error: The error raised by an attempt.
+            skip: Statuses retried by another layer, such as the [RateLimiter](./ratelimit.md).
+        """
+        if isinstance(error, AzakaException):
+            return error.status_code in self.statuses and error.status_code not in skip
+        return isinstance(error, self.exceptions)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before a retry.
+
+        Args:
+            attempt: The number of the failed attempt, starting at `0`.
+        """
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+    def threshold(self) -> t.Optional[float]:
+        """
+        Returns the delay in seconds after which a request is hedged, [None][] if it isn't.
+        """
+        if not self.hedge:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        index = int(self.hedge_percentile / 100 * len(latencies))
+        return latencies[min(index, len(latencies) - 1)]
+
+    async def run(
+        self,
+        send: t.Callable[[], t.Awaitable[T]],
+        idempotent: bool = True,
+        skip: t.Collection[int] = (),
+    ) -> T:
+        """
+        Sends a request under the policy.
+
+        Args:
+            send: A callable which sends the request and returns its result.
+            idempotent: Whether the request can be hedged.
+            skip: Statuses retried by another layer, such as the [RateLimiter](./ratelimit.md).
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(send, idempotent)
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts or not self.is_retryable(e, skip):
+                    raise
+            await asyncio.sleep(self.delay(attempt))
+            attempt += 1
+            self.retries += 1
+
+    async def _attempt(
+        self, send: t.Callable[[], t.Awaitable[T]], idempotent: bool
+    ) -> T:
+        start = time.perf_counter()
+        threshold = self.threshold() if idempotent else None
+        if threshold is None:
+            result = await send()
+            self._latencies.append(time.perf_counter() - start)
+            return result
+
+        pending = {asyncio.ensure_future(send())}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=threshold)
+            if not done:
+                pending.add(asyncio.ensure_future(send()))
+                self.hedges += 1
+
+            error: t.Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._latencies.append(time.perf_counter() - start)
+                        return task.result()
+                    error = task.exception()
+            raise t.cast(BaseException, error)
+        finally:
+            for task in pending:
+                task.cancel()
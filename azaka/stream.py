@@ -0,0 +1,197 @@
+import json
+import re
+import typing as t
+
+from azaka.query import Query
+
+if t.TYPE_CHECKING:
+    from azaka.client import Client
+
+__all__ = ("RowSplitter", "RowStream")
+
+TOKENS = re.compile(rb'["\[\]{}]')
+STRING_END = re.compile(rb'["\\]')
+
+HEAD, ROWS, TAIL = range(3)
+QUOTE, BACKSLASH, OPEN_ARRAY, CLOSE_BRACE = b'"\\[}'
+
+
+class RowSplitter:
+    """
+    Incremental splitter of a query response body.
+
+    Chunks of the body are fed as they arrive, and the raw JSON of every complete row of the
+    `results` array is returned as soon as it's available. Only the row being parsed is
+    kept in memory.
+    """
+
+    __slots__ = (
+        "_buf",
+        "_pos",
+        "_phase",
+        "_depth",
+        "_in_string",
+        "_string_start",
+        "_key",
+        "_row_start",
+        "_head",
+    )
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0
+        self._phase = HEAD
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._key = b""
+        self._row_start = 0
+        self._head = b""
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Feeds a chunk of the body.
+
+        Args:
+            chunk: The next chunk of the body.
+
+        Returns:
+            A [list][] of the raw JSON of the rows completed by this chunk.
+        """
+        buf = self._buf
+        buf += chunk
+        pos = self._pos
+        rows = []
+
+        while True:
+            if self._in_string:
+                m = STRING_END.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                if buf[m.start()] == BACKSLASH:
+                    if m.end() == len(buf):
+                        pos = m.start()
+                        break
+                    pos = m.end() + 1
+                    continue
+                self._in_string = False
+                pos = m.end()
+                if self._phase == HEAD and self._depth == 1:
+                    self._key = bytes(buf[self._string_start : m.start()])
+                continue
+
+            m = TOKENS.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            char = buf[m.start()]
+            pos = m.end()
+
+            if char == QUOTE:
+                self._in_string = True
+                self._string_start = pos
+            elif char in b"[{":
+                self._depth += 1
+                if self._phase == ROWS and self._depth == 3:
+                    self._row_start = m.start()
+                elif (
+                    self._phase == HEAD
+                    and self._depth == 2
+                    and char == OPEN_ARRAY
+                    and self._key == b"results"
+                ):
+                    self._phase = ROWS
+                    self._head = bytes(buf[:pos])
+                    del buf[:pos]
+                    pos = 0
+            else:
+                self._depth -= 1
+                if self._phase == ROWS:
+                    if self._depth == 2 and char == CLOSE_BRACE:
+                        rows.append(bytes(buf[self._row_start : pos]))
+                    elif self._depth == 1:
+                        self._phase = TAIL
+                        del buf[: m.start()]
+                        pos = 1
+
+        if self._phase == ROWS:
+            start = self._row_start if self._depth > 2 else pos
+            del buf[:start]
+            pos -= start
+            self._row_start = 0
+        self._pos = pos
+        return rows
+
+    def finish(self) -> dict[str, t.Any]:
+        """
+        Finishes the parsing.
+
+        Returns:
+            A [dict][] of the response metadata, with an empty `results` array.
+        """
+        if self._phase != TAIL:
+            raise ValueError("incomplete response body")
+        return json.loads(self._head + self._buf)
+
+
+class RowStream:
+    """
+    Asynchronous iterator over the results of a query, parsed and decoded one at a time.
+
+    The metadata of the response is available once the iteration has finished.
+
+    Danger:
+        This class is not meant to be instantiated directly but rather through
+        [Client.iter_rows](./client.md#azaka.client.Client.iter_rows).
+
+    Attributes:
+        more bool: If there are more results.
+        count int: Total number of entries that matched the filters, see [Response](./models.md#azaka.models.Response).
+        compact_filters Optional[str]: Compact string representation of the filters.
+        normalized_filters list[str]: Normalized JSON representation of the filters.
+    """
+
+    __slots__ = (
+        "_client",
+        "_query",
+        "more",
+        "count",
+        "compact_filters",
+        "normalized_filters",
+    )
+
+    def __init__(self, client: "Client", query: Query) -> None:
+        self._client = client
+        self._query = query
+        self.more = False
+        self.count = 1
+        self.compact_filters: t.Optional[str] = None
+        self.normalized_filters: list[str] = []
+
+    def __aiter__(self) -> t.AsyncIterator[t.Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> t.AsyncIterator[t.Any]:
+        client, query = self._client, self._query
+        decode = await client._row_decoder(query)
+        loads = client.codec.loads
+        resp = await client._request(
+            client._url(query._route),
+            post=True,
+            data=query.dump(client.codec.dumps),
+            headers=client.base_header,
+        )
+        try:
+            await client._raise_for_status(resp)
+            splitter = RowSplitter()
+            async for chunk in resp.content.iter_any():
+                for row in splitter.feed(chunk):
+                    yield decode(loads(row))
+            meta = splitter.finish()
+        finally:
+            resp.release()
+
+        for key in ("more", "count", "compact_filters", "normalized_filters"):
+            if key in meta:
+                setattr(self, key, meta[key])
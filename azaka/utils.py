@@ -1,9 +1,18 @@
 import typing as t
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from azaka.models import Response
 
-__all__ = ("clean_string", "build_objects", "FT", "RespT")
+__all__ = (
+    "clean_string",
+    "flatten",
+    "build_object",
+    "build_objects",
+    "TypeCache",
+    "TYPE_CACHE",
+    "FT",
+    "RespT",
+)
 
 T = t.TypeVar("T")
 FT = list[T | "FT[T]"]
@@ -17,14 +26,97 @@ class RespT(t.TypedDict):
     normalized_filters: list[str]
 
 
+class TypeCache:
+    """
+    A bounded LRU registry of the namedtuple classes used for query results.
+
+    Every result row with the same route and the same ordered set of keys reuses
+    one class instead of compiling a new one per row.
+
+    Attributes:
+        maxsize int: Maximum number of classes kept before the least recently used one is evicted.
+        hits int: Number of lookups served from the registry.
+        misses int: Number of lookups that had to create a new class.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_types")
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._types: OrderedDict[tuple[str, tuple[str, ...]], type] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def get(self, name: str, fields: tuple[str, ...]) -> type:
+        """
+        Returns the namedtuple class for the given name and fields, creating it on a miss.
+
+        Args:
+            name: The name of the class, usually the upper cased route.
+            fields: The ordered field names of the class.
+
+        Returns:
+            A namedtuple class.
+        """
+        key = (name, fields)
+        try:
+            cls = self._types[key]
+        except KeyError:
+            self.misses += 1
+            cls = namedtuple(name, fields)  # type: ignore
+            self._types[key] = cls
+            if len(self._types) > self.maxsize:
+                self._types.popitem(last=False)
+        else:
+            self.hits += 1
+            self._types.move_to_end(key)
+        return cls
+
+    def clear(self) -> None:
+        """
+        Removes every class from the registry and resets the counters.
+        """
+        self._types.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+TYPE_CACHE = TypeCache()
+
+
 def clean_string(string: str) -> str:
     return string.strip().lower()
 
 
+def flatten(
+    row: t.Mapping[str, t.Any],
+    prefix: str = "",
+    out: t.Optional[dict[str, t.Any]] = None,
+) -> dict[str, t.Any]:
+    out = {} if out is None else out
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flatten(value, f"{prefix}{key}.", out)
+        else:
+            out[prefix + key] = value
+    return out
+
+
+def build_object(route: str, res: t.Mapping[str, t.Any]) -> t.Any:
+    object = TYPE_CACHE.get(route.upper(), tuple(res))
+    return object(*res.values())
+
+
 def build_objects(route: str, json: dict[str, t.Any]) -> Response:
     objects = []
+    name = route.upper()
     for res in json["results"]:
-        object = namedtuple(route.upper(), res)  # type: ignore
+        object = TYPE_CACHE.get(name, tuple(res))
         objects.append(object(*res.values()))
 
     del json["results"]
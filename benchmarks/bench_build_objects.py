@@ -0,0 +1,52 @@
+"""
+Rows per second of `build_objects` with and without the namedtuple class registry.
+
+Usage (from the repository root): PYTHONPATH=. python benchmarks/bench_build_objects.py [ROWS] [REPEAT]
+"""
+import copy
+import sys
+import time
+import typing as t
+from collections import namedtuple
+
+from payloads import vn_payload
+
+from azaka.models import Response
+from azaka.utils import TYPE_CACHE, build_objects
+
+
+def build_objects_uncached(route: str, json: dict[str, t.Any]) -> Response:
+    objects = []
+    for res in json["results"]:
+        object = namedtuple(route.upper(), res)  # type: ignore
+        objects.append(object(*res.values()))
+
+    del json["results"]
+    return Response(results=objects, **json)
+
+
+def bench(fn: t.Callable[[str, dict[str, t.Any]], Response], payload: dict[str, t.Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        data = copy.copy(payload)
+        start = time.perf_counter()
+        fn("vn", data)
+        best = min(best, time.perf_counter() - start)
+    return len(payload["results"]) / best
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    payload = vn_payload(rows)
+
+    before = bench(build_objects_uncached, payload, repeat)
+    after = bench(build_objects, payload, repeat)
+    print(f"rows: {rows}")
+    print(f"before: {before:>12,.0f} rows/s")
+    print(f"after:  {after:>12,.0f} rows/s ({after / before:.1f}x)")
+    print(f"registry: {len(TYPE_CACHE)} classes, {TYPE_CACHE.hits} hits, {TYPE_CACHE.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Request body size before and after filter optimization.
+
+The filters mimic generated ones: id lookups built as `OR` chains with duplicates, nested `AND`s,
+and groups left empty by optional conditions. The compact strings are only known to the API, the
+size of a sample compact string is reported for reference.
+
+Usage (from the repository root): PYTHONPATH=. python benchmarks/bench_filters.py
+"""
+
+import random
+import time
+
+from azaka import AND, OR, Node, optimize_filters, select
+from azaka.utils import FT
+
+# Size class of the strings returned with `compact_filters`, e.g. for `OR(id=v1, id=v2, ...)`.
+COMPACT_PER_PREDICATE = 6
+
+
+def generated_filters(ids: int, rng: random.Random) -> FT[str]:
+    lookups = [Node("id") == f"v{rng.randint(1, ids // 2)}" for _ in range(ids)]
+    chain: FT[str] = OR(*lookups[:1])
+    for node in lookups[1:]:
+        chain = OR(chain, node)
+    optional = AND(*([Node("olang") == "ja"] if rng.random() < 0.5 else []))
+    return AND(
+        AND(Node("lang") == "en", optional),
+        AND(Node("lang") == "en", AND(Node("votecount") >= "10", chain)),
+        OR(),
+    )
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(
+        f"{'ids':>6} {'original':>10} {'optimized':>10} {'saved':>7} {'compact':>8} {'time':>10}"
+    )
+    for ids in (10, 50, 100, 500):
+        filters = generated_filters(ids, rng)
+        start = time.perf_counter()
+        optimized = optimize_filters(filters)
+        elapsed = time.perf_counter() - start
+
+        before = len(select("title").frm("vn").where(filters).parse_body)
+        after = len(select("title").frm("vn").where(optimized).parse_body)
+        predicates = len(optimized[-1]) - 1
+        print(
+            f"{ids:>6} {before:>9}B {after:>9}B {1 - after / before:>7.1%} "
+            f"{COMPACT_PER_PREDICATE * predicates:>7}B {elapsed * 1e6:>8.0f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Throughput of the JSON codecs on query response payloads.
+
+Recorded VNDB responses can be passed as arguments, a synthetic 10k-row `vn` page is used otherwise.
+
+Usage (from the repository root): PYTHONPATH=. python benchmarks/bench_json.py [PAYLOAD.json ...]
+"""
+
+import json
+import sys
+import time
+import typing as t
+
+from payloads import vn_payload
+
+from azaka.codec import CODECS, JSONCodec
+
+
+def bench(fn: t.Callable[[], t.Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    payloads = {p: open(p, "rb").read() for p in sys.argv[1:]}
+    if not payloads:
+        payloads["synthetic vn (10k rows)"] = json.dumps(vn_payload(10_000)).encode()
+
+    codecs: list[JSONCodec] = []
+    for factory in CODECS.values():
+        try:
+            codecs.append(factory())
+        except ImportError:
+            pass
+
+    for name, raw in payloads.items():
+        obj = json.loads(raw)
+        print(f"{name}: {len(raw) / 1e6:.2f} MB")
+        for codec in codecs:
+            loads = bench(lambda: codec.loads(raw))
+            dumps = bench(lambda: codec.dumps(obj))
+            print(
+                f"  {codec.name:<8} loads {len(raw) / loads / 1e6:>8.1f} MB/s"
+                f"  dumps {len(raw) / dumps / 1e6:>8.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Load benchmark of Client.execute, Client.get_user and Paginator against the local stand-in
+server from `tests/fakevndb.py`, so it runs without a network.
+
+Reports p50/p95/p99 latency of each call (a paginator call walks 5 pages), requests per second, rows per second and the peak RSS of the process.
+Latency and fault rates of the server can be set to mimic the API. The server shares the process
+and event loop with the client, so the numbers are meant for comparing revisions.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/bench_load.py [--requests N] [--concurrency 1 8 32]
+        [--latency SECONDS] [--throttle-rate P] [--error-rate P] [--recorded DIR]
+"""
+
+import argparse
+import asyncio
+import pathlib
+import resource
+import sys
+import time
+import typing as t
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "tests"))
+
+from fakevndb import FakeVNDB  # noqa: E402
+
+from azaka import Client, Node, Paginator, RateLimiter, select  # noqa: E402
+
+Scenario = t.Callable[[Client, int], t.Awaitable[int]]
+
+
+async def execute(client: Client, i: int) -> int:
+    start = (i * 37) % 900
+    query = (
+        select("title", "released", "image.url", "languages")
+        .frm("vn")
+        .where(Node("id") > f"v{start}")
+    )
+    query._body["results"] = 100
+    return len((await client.execute(query)).results)
+
+
+async def get_user(client: Client, i: int) -> int:
+    users = [f"u{(i + j) % 100 + 1}" for j in range(10)]
+    return len(await client.get_user(*users, fields=["lengthvotes"]))
+
+
+async def paginate(client: Client, i: int) -> int:
+    query = select("title").frm("vn").where(Node("id") > f"v{(i * 37) % 500}")
+    pages = await Paginator(client, query, 100, exit_after=5, prefetch=2).flatten()
+    return sum(len(p.results) for p in pages)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "execute": execute,
+    "get_user": get_user,
+    "paginator": paginate,
+}
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def peak_rss() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+async def run(
+    client: Client, scenario: Scenario, requests: int, concurrency: int
+) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    rows = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal rows
+        for i in counter:
+            start = time.perf_counter()
+            n = await scenario(client, i)
+            latencies.append(time.perf_counter() - start)
+            rows += n
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, rows, time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--recorded", help="directory of recorded <route>.json payloads"
+    )
+    args = parser.parse_args()
+
+    faults = dict(
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+    )
+    server = (
+        FakeVNDB.from_recorded(args.recorded, **faults)
+        if args.recorded
+        else FakeVNDB(**faults)
+    )
+
+    print(
+        f"{'scenario':<10} {'conc':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'req/s':>8} {'rows/s':>10} {'rss MB':>8}"
+    )
+    async with server:
+        for name, scenario in SCENARIOS.items():
+            for concurrency in args.concurrency:
+                sent = sum(server.requests.values())
+                limiter = RateLimiter(requests=10**9, window=1, base_delay=0.01)
+                async with Client(
+                    base_url=server.url, rate_limiter=limiter, coalesce=False
+                ) as client:
+                    latencies, rows, elapsed = await run(
+                        client, scenario, args.requests, concurrency
+                    )
+                sent = sum(server.requests.values()) - sent
+                ms = [i * 1000 for i in latencies]
+                print(
+                    f"{name:<10} {concurrency:>5} {percentile(ms, 50):>8.2f} "
+                    f"{percentile(ms, 95):>8.2f} {percentile(ms, 99):>8.2f} "
+                    f"{sent / elapsed:>8.0f} {rows / elapsed:>10.0f} "
+                    f"{peak_rss():>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
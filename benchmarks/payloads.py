@@ -0,0 +1,22 @@
+"""
+Synthetic VNDB-shaped payloads shared by the benchmarks.
+"""
+import pathlib
+import random
+import sys
+import typing as t
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "tests"))
+
+from fakevndb import vn_row  # noqa: E402
+
+
+def vn_payload(rows: int, seed: int = 0) -> dict[str, t.Any]:
+    rng = random.Random(seed)
+    return {
+        "results": [vn_row(i, rng) for i in range(1, rows + 1)],
+        "more": True,
+        "count": rows,
+        "compact_filters": None,
+        "normalized_filters": [],
+    }
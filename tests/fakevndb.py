@@ -0,0 +1,306 @@
+"""
+A local stand-in for the VNDB API built on aiohttp.web.
+
+It serves recorded or synthetic payloads for the query routes and `/user`, `/stats`, `/schema`
+and `/authinfo`, and can inject latency, `429` and `502` responses.
+
+Example:
+    ```python
+    async with FakeVNDB(latency=0.01, throttle_rate=0.1) as server:
+        async with Client(base_url=server.url) as client:
+            resp = await client.execute(select("title").frm("vn"))
+    ```
+"""
+
+import asyncio
+import json
+import pathlib
+import random
+import typing as t
+import zlib
+from collections import Counter
+
+from aiohttp import web
+
+from azaka.evaluate import evaluate_body
+
+LANGUAGES = ("en", "ja", "zh-Hans", "de", "fr", "ru", "es")
+PLATFORMS = ("win", "lin", "mac", "and", "ios", "swi", "ps4")
+TOKEN = "fake-token"
+
+
+def vn_row(i: int, rng: random.Random) -> dict[str, t.Any]:
+    olang = rng.choice(LANGUAGES)
+    return {
+        "id": f"v{i}",
+        "title": f"Visual Novel {i}",
+        "titles": [
+            {
+                "lang": olang,
+                "title": f"Visual Novel {i}",
+                "latin": None,
+                "official": True,
+                "main": True,
+            }
+        ],
+        "olang": olang,
+        "released": f"{rng.randint(1995, 2023)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}",
+        "languages": rng.sample(LANGUAGES, rng.randint(1, 4)),
+        "platforms": rng.sample(PLATFORMS, rng.randint(1, 3)),
+        "image": {
+            "id": f"cv{i}",
+            "url": f"https://t.vndb.org/cv/{i % 100:02}/{i}.jpg",
+        },
+        "length_minutes": rng.choice((None, rng.randint(60, 6000))),
+        "rating": rng.choice((None, round(rng.uniform(10, 100), 2))),
+        "votecount": rng.randint(0, 20000),
+    }
+
+
+def synthetic_vns(rows: int, seed: int = 0) -> list[dict[str, t.Any]]:
+    rng = random.Random(seed)
+    return [vn_row(i, rng) for i in range(1, rows + 1)]
+
+
+def synthetic_users(users: int) -> dict[str, dict[str, t.Any]]:
+    return {
+        f"u{i}": {
+            "id": f"u{i}",
+            "username": f"user{i}",
+            "lengthvotes": i % 50,
+            "lengthvotes_sum": (i % 50) * 600,
+        }
+        for i in range(1, users + 1)
+    }
+
+
+def _fields(rows: t.Iterable[t.Any]) -> t.Optional[dict[str, t.Any]]:
+    tree: dict[str, t.Any] = {}
+    found = False
+    for row in rows:
+        for i in row if isinstance(row, list) else [row]:
+            if isinstance(i, dict):
+                found = True
+                for key, value in i.items():
+                    sub = _fields([value])
+                    tree[key] = (
+                        {**(tree.get(key) or {}), **sub} if sub else tree.get(key)
+                    )
+    return tree if found else None
+
+
+class FakeVNDB:
+    """
+    Stand-in VNDB server.
+
+    Args:
+        routes: The raw rows of each query route, 1000 synthetic `vn` rows by default.
+        users: The users served by `/user`, keyed by id.
+        latency: Base latency in seconds added to every response.
+        jitter: Maximum random latency in seconds added on top of `latency`.
+        throttle_rate: Probability of answering with `429`.
+        error_rate: Probability of answering with `502`.
+        retry_after: Value of the `Retry-After` header of the `429` responses.
+        seed: Seed of the fault injection.
+
+    Attributes:
+        requests: Number of requests by path.
+        tokens: Number of requests by token.
+        bodies: The bodies of the query requests, in order.
+        lookups: The users looked up by every `/user` request, in order.
+        in_flight: Number of requests being handled.
+        peak: Highest number of requests handled at the same time.
+        throttled: Tokens always answered with `429`.
+        fail_after: Number of requests after which every request is answered with `502`.
+        faults: Number of injected faults by status.
+    """
+
+    def __init__(
+        self,
+        routes: t.Optional[dict[str, list[dict[str, t.Any]]]] = None,
+        users: t.Optional[dict[str, dict[str, t.Any]]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: int = 0,
+        seed: int = 0,
+    ) -> None:
+        self.routes = routes if routes is not None else {"vn": synthetic_vns(1000)}
+        self.users = users if users is not None else synthetic_users(100)
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.requests: Counter[str] = Counter()
+        self.tokens: Counter[str] = Counter()
+        self.bodies: list[dict[str, t.Any]] = []
+        self.lookups: list[list[str]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.throttled: set[str] = set()
+        self.fail_after: t.Optional[int] = None
+        self.faults: Counter[int] = Counter()
+        self._compact: dict[str, t.Any] = {}
+        self._rng = random.Random(seed)
+        self._runner: t.Optional[web.AppRunner] = None
+        self.url = ""
+
+    @classmethod
+    def from_recorded(cls, path: str | pathlib.Path, **kwargs: t.Any) -> "FakeVNDB":
+        """
+        Builds a server from recorded responses, `<route>.json` files holding the `results` of a query.
+        """
+        routes: dict[str, list[dict[str, t.Any]]] = {}
+        for file in sorted(pathlib.Path(path).glob("*.json")):
+            data = json.loads(file.read_text())
+            routes.setdefault(file.stem, []).extend(data["results"])
+        return cls(routes, **kwargs)
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get("/kana/schema", self._schema)
+        app.router.add_get("/kana/stats", self._stats)
+        app.router.add_get("/kana/authinfo", self._authinfo)
+        app.router.add_get("/kana/user", self._user)
+        app.router.add_post("/kana/{route}", self._query)
+        return app
+
+    async def start(self) -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/kana"
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeVNDB":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    @web.middleware
+    async def _faults(
+        self,
+        request: web.Request,
+        handler: t.Callable[..., t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        self.requests[request.path] += 1
+        token = request.headers.get("Authorization", "").removeprefix("token ")
+        self.tokens[token] += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await self._respond(request, handler, token)
+        finally:
+            self.in_flight -= 1
+
+    async def _respond(
+        self,
+        request: web.Request,
+        handler: t.Callable[..., t.Awaitable[web.StreamResponse]],
+        token: str,
+    ) -> web.StreamResponse:
+        delay = self.latency + self._rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if (
+            self.fail_after is not None
+            and sum(self.requests.values()) > self.fail_after
+        ):
+            self.faults[502] += 1
+            return web.Response(status=502, text="Bad Gateway")
+        roll = self._rng.random()
+        if token in self.throttled or roll < self.throttle_rate:
+            self.faults[429] += 1
+            return web.Response(
+                status=429,
+                text="Throttled",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            self.faults[502] += 1
+            return web.Response(status=502, text="Bad Gateway")
+        return await handler(request)
+
+    async def _query(self, request: web.Request) -> web.StreamResponse:
+        route = request.match_info["route"]
+        if route not in self.routes:
+            return web.Response(status=404, text="Not found")
+        try:
+            body = {
+                "filters": [],
+                "sort": "id",
+                "reverse": False,
+                "results": 10,
+                "page": 1,
+                "count": False,
+                "compact_filters": False,
+                "normalized_filters": False,
+                **await request.json(),
+            }
+            self.bodies.append(body)
+            filters = body["filters"]
+            if isinstance(filters, str):
+                filters = self._compact[filters]
+            data = evaluate_body({**body, "filters": filters}, self.routes[route])
+        except (ValueError, KeyError, TypeError) as e:
+            return web.Response(status=400, text=f"Invalid request body: {e}")
+
+        if body["compact_filters"]:
+            compact = f"fake{zlib.crc32(json.dumps(filters).encode()):08x}"
+            self._compact[compact] = filters
+            data["compact_filters"] = compact
+        if body["normalized_filters"]:
+            data["normalized_filters"] = filters or None
+        return web.json_response(data)
+
+    async def _user(self, request: web.Request) -> web.StreamResponse:
+        fields = request.query.getall("fields", [])
+        names = {u["username"].lower(): u for u in self.users.values()}
+        data: dict[str, t.Any] = {}
+        self.lookups.append(request.query.getall("q", []))
+        for q in request.query.getall("q", []):
+            user = self.users.get(q) or names.get(q.lower())
+            data[q] = (
+                {k: user[k] for k in ("id", "username", *fields) if k in user}
+                if user
+                else None
+            )
+        return web.json_response(data)
+
+    async def _stats(self, request: web.Request) -> web.StreamResponse:
+        return web.json_response(
+            {
+                "chars": len(self.routes.get("character", ())),
+                "producers": len(self.routes.get("producer", ())),
+                "releases": len(self.routes.get("release", ())),
+                "staff": len(self.routes.get("staff", ())),
+                "tags": len(self.routes.get("tag", ())),
+                "traits": len(self.routes.get("trait", ())),
+                "vn": len(self.routes.get("vn", ())),
+            }
+        )
+
+    async def _schema(self, request: web.Request) -> web.StreamResponse:
+        api_fields = {
+            f"/{route}": _fields(rows) or {} for route, rows in self.routes.items()
+        }
+        return web.json_response({"api_fields": api_fields})
+
+    async def _authinfo(self, request: web.Request) -> web.StreamResponse:
+        if request.headers.get("Authorization") != f"token {TOKEN}":
+            return web.Response(status=401, text="Invalid token")
+        return web.json_response(
+            {"id": "u1", "username": "user1", "permissions": ["listread"]}
+        )
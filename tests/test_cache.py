@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from azaka import Client, MemoryBackend, ResponseCache, SQLiteBackend, select
+
+RAW = b'{"results": [], "more": false}'
+
+
+def test_response_cache() -> None:
+    cache = ResponseCache(ttl=60, route_ttls={"release": 0})
+    vn = select("title").frm("vn")
+
+    assert cache.get(vn) is None
+    cache.set(vn, RAW)
+    assert cache.get(vn) == RAW
+    assert cache.get(select("title", "olang").frm("vn")) is None
+
+    cache.set(select().frm("release"), RAW)
+    assert cache.get(select().frm("release")) is None
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 0,
+        "expired": 0,
+        "size": 1,
+    }
+
+    cache.backend.set(cache.key(vn), RAW, time.time() - 1)
+    assert cache.get(vn) is None
+    assert cache.expired == 1
+
+
+def test_memory_backend() -> None:
+    backend = MemoryBackend(maxsize=2, max_bytes=10)
+    backend.set("a", b"1234", 0)
+    backend.set("b", b"1234", 0)
+    backend.get("a")
+    backend.set("c", b"1234", 0)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    backend.set("d", b"123456789", 0)
+    assert len(backend) == 1
+    assert backend.evictions == 3
+
+
+def test_sqlite_backend(tmp_path) -> None:
+    backend = SQLiteBackend(str(tmp_path / "cache.db"), maxsize=2)
+    backend.set("a", RAW, 1.0)
+    backend.set("b", RAW, 2.0)
+    time.sleep(0.01)
+    backend.get("a")
+    backend.set("c", RAW, 3.0)
+
+    assert backend.get("a") == (RAW, 1.0)
+    assert backend.get("b") is None
+    assert backend.evictions == 1
+
+    backend.set("c", RAW, 4.0)
+    assert backend.evictions == 1 and backend.get("c") == (RAW, 4.0)
+    backend.delete("c")
+    backend.set("d", RAW, 5.0)
+    assert backend.evictions == 1 and len(backend) == 2
+    backend.close()
+
+    backend = SQLiteBackend(str(tmp_path / "cache.db"))
+    assert len(backend) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_hit() -> None:
+    query = select("title").frm("vn")
+    cache = ResponseCache()
+    cache.set(query, b'{"results": [{"id": "v17", "title": "Ever17"}], "more": false}')
+
+    client = Client(cache=cache)
+    resp = await client.execute(query)
+    assert resp.results[0].title == "Ever17"
+    assert client.cs is None
@@ -1,16 +1,18 @@
 import asyncio
 import re
 
+import aiohttp
 import pytest
+from fakevndb import FakeVNDB, synthetic_users, synthetic_vns
 
-from azaka import AND, OR, Client, Node, Response, select
+from azaka import AND, OR, Client, Node, PoolConfig, Response, select
 from azaka.query import Query
 
 
-async def execute_(req: Query) -> None:
+async def execute_(req: Query, url: str) -> None:
     req.set_flags(normalized_filters=True)
 
-    async with Client() as client:
+    async with Client(base_url=url) as client:
         resp = await client.execute(req)
         fltrs = req._body["filters"] or None
 
@@ -21,7 +23,7 @@ async def execute_(req: Query) -> None:
         )
 
 
-async def select_(q: Query) -> None:
+async def select_(q: Query, url: str) -> None:
     req1 = select().frm(q._route).where(q._body["filters"])
     req2 = (
         select(
@@ -40,26 +42,90 @@ async def select_(q: Query) -> None:
         .where(q._body["filters"])
     )
 
-    await execute_(req1)
-    await execute_(req2)
+    await execute_(req1, url)
+    await execute_(req2, url)
 
 
-async def frm_(q: Query) -> None:
+async def frm_(q: Query, url: str) -> None:
     query = select()
     with pytest.raises(TypeError):
-        await select_(query)
+        await select_(query, url)
 
     query.frm("vn").where(q._body["filters"])
-    await select_(query)
+    await select_(query, url)
 
 
 @pytest.mark.asyncio
 async def test_where() -> None:  # TODO: add more filters.
-    query = select().frm("vn").where()
-    await frm_(query)
+    async with FakeVNDB({"vn": synthetic_vns(2002)}) as server:
+        query = select().frm("vn").where()
+        await frm_(query, server.url)
 
-    query = select().frm("vn").where(Node("id") == "v2002")
-    await frm_(query)
+        query = select().frm("vn").where(Node("id") == "v2002")
+        await frm_(query, server.url)
 
-    query = select().frm("vn").where(["id", "=", "v2002"])
-    await frm_(query)
+        query = select().frm("vn").where(["id", "=", "v2002"])
+        await frm_(query, server.url)
+
+
+@pytest.mark.asyncio
+async def test_coalesce() -> None:
+    async with FakeVNDB(latency=0.01) as server:
+        async with Client(base_url=server.url) as client:
+            query = select().frm("vn").where(Node("id") == "v17")
+            resps = await asyncio.gather(*(client.execute(query) for _ in range(5)))
+
+            assert len(server.bodies) == 1
+            assert all(r.results[0].id == "v17" for r in resps)
+            assert resps[0] is not resps[1]
+            assert not client._flights
+
+            await client.execute(query)
+            assert len(server.bodies) == 2
+
+            client.coalesce = False
+            await asyncio.gather(*(client.execute(query) for _ in range(3)))
+            assert len(server.bodies) == 5
+
+
+@pytest.mark.asyncio
+async def test_resolve_users() -> None:
+    async with FakeVNDB(users=synthetic_users(250)) as server:
+        async with Client(base_url=server.url) as client:
+            names = [f"u{i}" for i in range(1, 251)] + ["nobody", "u1"]
+            users = await client.resolve_users(names)
+
+            assert list(users) == names[:-1]
+            assert [len(i) for i in server.lookups] == [100, 100, 51]
+            assert users["u7"].FOUND and not users["nobody"].FOUND
+
+            server.lookups.clear()
+            users = await client.resolve_users(["NOBODY", "u1"], max_url_length=60)
+            assert server.lookups == [["u1"]]
+            assert not users["NOBODY"].FOUND
+
+            server.lookups.clear()
+            await client.resolve_users(names[:30], max_url_length=120)
+            assert all(len(i) < 30 for i in server.lookups)
+
+
+@pytest.mark.asyncio
+async def test_pool_config() -> None:
+    pool = PoolConfig(limit=5, limit_per_host=2, total_timeout=10, read_timeout=3)
+    async with Client(pool=pool) as client:
+        assert client.cs
+        assert client.cs.connector.limit == 5  # type: ignore
+        assert client.cs.connector.limit_per_host == 2  # type: ignore
+        assert client.cs.timeout.sock_read == 3
+        assert client.cs.timeout.sock_connect == 30
+    assert client.cs.closed
+
+    connector = pool.connector()
+    async with Client(connector=connector) as a, Client(connector=connector) as b:
+        assert a.cs.connector is b.cs.connector  # type: ignore
+    assert not connector.closed
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async with Client(session=session) as client:
+            assert client.cs is session
+        assert not session.closed
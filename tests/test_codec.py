@@ -0,0 +1,25 @@
+import pytest
+
+from azaka import Client, get_codec, select
+from azaka.codec import CODECS
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+def test_codec(name: str) -> None:
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    query = select("title").frm("vn")
+    raw = query.dump(codec.dumps)
+    assert codec.loads(raw.encode() if isinstance(raw, str) else raw) == query._body
+
+
+def test_get_codec() -> None:
+    assert get_codec().name == "json"
+    assert Client().codec.name == "json"
+    assert get_codec("auto").name in CODECS
+
+    with pytest.raises(ValueError):
+        get_codec("yaml")
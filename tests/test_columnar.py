@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from azaka import Client, ColumnBuilder, ResponseCache, select
+
+ROWS = [
+    {"id": "v1", "olang": "ja", "rating": 80, "image": {"url": "a"}, "length": None},
+    {"id": "v2", "olang": "en", "rating": 75.5, "image": None, "length": None},
+    {"id": "v3", "olang": "ja", "rating": None, "image": {"url": "c"}, "length": None},
+    {"id": "v4", "olang": "ja", "rating": 90, "titles": [{"lang": "ja"}]},
+]
+
+
+def build(dictionary_encode: bool = True):  # type: ignore
+    builder = ColumnBuilder(dictionary_encode)
+    builder.extend(ROWS[:2])
+    builder.extend(ROWS[2:])
+    return builder.build(more=False, count=4)
+
+
+def test_columns() -> None:
+    resp = build()
+
+    assert len(resp) == 4
+    assert resp.count == 4
+    assert list(resp.columns) == [
+        "id",
+        "olang",
+        "rating",
+        "image.url",
+        "titles",
+        "length",
+    ]
+    assert resp["olang"].categories == ["ja", "en"]
+    assert list(resp["olang"]) == ["ja", "en", "ja", "ja"]
+    assert resp["rating"].kind == "float"
+    assert list(resp["rating"]) == [80.0, 75.5, None, 90.0]
+    assert list(resp["image.url"]) == ["a", None, "c", None]
+    assert list(resp["titles"]) == [None, None, None, [{"lang": "ja"}]]
+    assert list(resp["length"]) == [None] * 4
+
+    assert list(build(dictionary_encode=False)["olang"]) == ["ja", "en", "ja", "ja"]
+
+
+def test_conversions() -> None:
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    resp = build()
+
+    df = resp.to_pandas()
+    assert isinstance(df["olang"].dtype, pd.CategoricalDtype)
+    assert df["rating"].isna().tolist() == [False, False, True, False]
+
+    table = resp.to_arrow()
+    assert table.column("rating").to_pylist() == [80.0, 75.5, None, 90.0]
+    assert table.column("olang").to_pylist() == ["ja", "en", "ja", "ja"]
+    assert table.column("image.url").to_pylist() == ["a", None, "c", None]
+    assert isinstance(table.column("olang").type, pa.DictionaryType)
+
+    arrays = resp.to_numpy()
+    assert arrays["rating"].mask.tolist() == [False, False, True, False]
+
+
+def test_mixed_columns() -> None:
+    pa = pytest.importorskip("pyarrow")
+    builder = ColumnBuilder()
+    builder.extend(
+        [
+            {"id": "v1", "has_ero": True, "extlinks": "x"},
+            {"id": "v2", "has_ero": None, "extlinks": [{"id": 1}]},
+            {"id": "v3", "has_ero": False, "extlinks": None},
+        ]
+    )
+    resp = builder.build()
+    assert list(resp["has_ero"]) == [True, None, False]
+
+    table = resp.to_arrow()
+    assert table.column("has_ero").type == pa.bool_()
+    assert table.column("has_ero").to_pylist() == [True, None, False]
+    assert table.column("extlinks").to_pylist() == ['"x"', '[{"id": 1}]', None]
+
+
+def test_null_objects() -> None:
+    builder = ColumnBuilder()
+    builder.extend(
+        [
+            {"id": "v1", "image": {"url": "a"}},
+            {"id": "v2", "image": None},
+            {"id": "v3", "image": {"url": "c"}},
+        ]
+    )
+    resp = builder.build()
+    assert list(resp.columns) == ["id", "image.url"]
+    assert list(resp["image.url"]) == ["a", None, "c"]
+
+
+@pytest.mark.asyncio
+async def test_execute_columnar() -> None:
+    query = select("olang").frm("vn")
+    cache = ResponseCache()
+    cache.set(query, json.dumps({"results": ROWS, "more": True}).encode())
+
+    resp = await Client(cache=cache).execute_columnar(query)
+    assert resp.more
+    assert list(resp["id"]) == ["v1", "v2", "v3", "v4"]
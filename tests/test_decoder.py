@@ -0,0 +1,102 @@
+import pytest
+
+from azaka import Decoder, Response
+
+SCHEMA = {
+    "api_fields": {
+        "vn": {
+            "id": None,
+            "title": None,
+            "image": {"id": None, "url": None},
+            "titles": {"lang": None, "title": None},
+            "developers": {"_inherit": "producer"},
+        },
+        "producer": {"id": None, "name": None},
+    }
+}
+
+# Excerpt of GET /kana/schema, the API keys the routes by path.
+KANA_SCHEMA = {
+    "api_fields": {
+        "/vn": {
+            "id": None,
+            "title": None,
+            "released": None,
+            "image": {"id": None, "url": None, "dims": None, "sexual": None},
+            "titles": {"lang": None, "title": None, "latin": None, "main": None},
+            "developers": {"_inherit": "/producer"},
+            "tags": {"_inherit": "/tag", "rating": None, "spoiler": None},
+        },
+        "/producer": {"id": None, "name": None, "original": None, "type": None},
+        "/tag": {"id": None, "name": None, "category": None},
+    },
+    "enums": {"language": [{"id": "en", "label": "English"}]},
+    "extlinks": {"/release": [{"name": "steam", "label": "Steam"}]},
+}
+
+
+def test_decode() -> None:
+    decoder = Decoder(
+        SCHEMA, "vn", "id, title, image.url, titles.lang, developers.name"
+    )
+    resp = decoder.decode(
+        {
+            "results": [
+                {
+                    "id": "v17",
+                    "title": "Ever17",
+                    "image": {"url": "https://t.vndb.org/cv/1.jpg"},
+                    "titles": [{"lang": "en"}, {"lang": "ja"}],
+                    "developers": [{"name": "KID"}],
+                },
+                {
+                    "id": "v2",
+                    "title": "Other",
+                    "image": None,
+                    "titles": [],
+                    "developers": [],
+                },
+            ],
+            "more": True,
+        }
+    )
+
+    assert isinstance(resp, Response)
+    assert resp.more
+    vn = resp.results[0]
+    assert isinstance(vn, decoder.record)
+    assert vn._fields == ("id", "title", "image", "titles", "developers")
+    assert vn.image.url == "https://t.vndb.org/cv/1.jpg"
+    assert [i.lang for i in vn.titles] == ["en", "ja"]
+    assert vn.developers[0].name == "KID"
+    assert resp.results[1].image is None
+
+
+def test_invalid_field() -> None:
+    with pytest.raises(ValueError):
+        Decoder(SCHEMA, "vn", "id, image.nope")
+
+    with pytest.raises(ValueError):
+        Decoder(SCHEMA, "nope", "id")
+
+
+def test_kana_schema() -> None:
+    decoder = Decoder(
+        KANA_SCHEMA, "vn", "title, developers.name, tags.name, tags.rating"
+    )
+    vn = decoder.decode(
+        {
+            "results": [
+                {
+                    "title": "Ever17",
+                    "developers": [{"name": "KID"}],
+                    "tags": [{"name": "Mystery", "rating": 2.8}],
+                }
+            ]
+        }
+    ).results[0]
+    assert vn.developers[0].name == "KID"
+    assert vn.tags[0].name == "Mystery" and vn.tags[0].rating == 2.8
+
+    with pytest.raises(ValueError):
+        Decoder(KANA_SCHEMA, "vn", "developers.nope")
@@ -0,0 +1,69 @@
+import json
+import sqlite3
+
+import pytest
+
+from azaka import AND, OR, Node, compile_filters, execute_local, select, to_sql
+
+ROWS = [
+    {
+        "id": f"v{i}",
+        "title": f"t{i:02}",
+        "votecount": i * 10,
+        "languages": ["ja", "en"] if i % 3 == 0 else ["ja"],
+        "image": {"id": i, "sexual": i % 2} if i % 4 else None,
+        "releases": [{"id": f"r{i}", "platforms": ["win"]}, {"id": f"r{i + 100}"}],
+    }
+    for i in range(1, 21)
+]
+
+FILTERS = [
+    Node("id") >= "v9",
+    Node("id") < "v10",
+    Node("votecount") > "150",
+    Node("lang") == "en",
+    Node("lang") != "en",
+    Node("title") <= "t03",
+    Node("image") == (Node("sexual") == 1),
+    Node("image") != (Node("sexual") == 1),
+    Node("release") == AND(Node("id") > "r15", Node("platform") == "win"),
+    OR(Node("id") == "v2", AND(Node("lang") == "en", Node("votecount") <= "60")),
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_compile_filters(filters) -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE vn (data TEXT)")
+    conn.executemany("INSERT INTO vn VALUES (?)", [(json.dumps(i),) for i in ROWS])
+
+    match = compile_filters(filters)
+    where, params = to_sql(filters)
+    expected = [i["id"] for i in ROWS if match(i)]
+    rows = conn.execute(f"SELECT data FROM vn WHERE {where}", params).fetchall()
+    assert expected and [json.loads(i)["id"] for (i,) in rows] == expected
+
+
+def test_filter_semantics() -> None:
+    ids = lambda f: [i["id"] for i in ROWS if compile_filters(f)(i)]  # noqa: E731
+
+    assert ids(Node("id") < "v10") == [f"v{i}" for i in range(1, 10)]
+    assert ids(Node("lang") == "en") == ["v3", "v6", "v9", "v12", "v15", "v18"]
+    assert ids(Node("image") == (Node("id") > "17")) == ["v18", "v19"]
+    assert ids(Node("release") == (Node("id") > "r118")) == ["v19", "v20"]
+    with pytest.raises(ValueError):
+        compile_filters(["id", "~", "v1"])
+
+
+def test_execute_local() -> None:
+    query = select("title", "image.id").frm("vn").where(Node("lang") == "en")
+    query.sort("votecount").set_flags(reverse=True, count=True)
+    resp = execute_local(query, ROWS)
+    assert [i.id for i in resp.results] == ["v18", "v15", "v12", "v9", "v6", "v3"]
+    assert resp.results[1].image == {"id": 15} and resp.results[2].image is None
+    assert resp.count == 6 and not resp.more
+
+    query = select().frm("vn")
+    query._body["results"], query._body["page"] = 8, 3
+    resp = execute_local(query, ROWS)
+    assert [i.id for i in resp.results] == [f"v{i}" for i in range(17, 21)]
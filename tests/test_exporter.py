@@ -0,0 +1,98 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from fakevndb import FakeVNDB
+
+from azaka import (
+    Client,
+    CSVSink,
+    NDJSONSink,
+    ParquetSink,
+    ServerDownError,
+    SQLiteSink,
+    export,
+    select,
+)
+
+ROWS = [
+    {"id": f"v{i}", "title": f"t{i}", "image": {"url": f"u{i}"}} for i in range(1, 24)
+]
+
+
+@pytest.mark.asyncio
+async def test_export_resume(tmp_path) -> None:
+    out, ckpt = tmp_path / "vn.ndjson", str(tmp_path / "vn.ckpt")
+    query = select("title", "image.url").frm("vn")
+
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            server.fail_after = 2
+            with pytest.raises(ServerDownError):
+                await export(client, query, NDJSONSink(str(out)), ckpt, page_size=5)
+            state = json.load(open(ckpt))
+            assert state == {"cursor": "v10", "rows": 10, "position": out.stat().st_size}
+
+            with open(out, "a") as f:
+                f.write('{"id": "v11"}\n')  # written before a crash, but not checkpointed
+            server.fail_after = None
+            written = await export(client, query, NDJSONSink(str(out)), ckpt, page_size=5)
+
+    assert written == 13
+    assert [json.loads(i) for i in out.read_text().splitlines()] == ROWS
+
+
+@pytest.mark.asyncio
+async def test_sinks(tmp_path) -> None:
+    query = select("title", "image.url").frm("vn")
+
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            await export(client, query, CSVSink(str(tmp_path / "vn.csv")), page_size=10)
+            rows = list(csv.DictReader(open(tmp_path / "vn.csv")))
+            assert rows[0] == {"id": "v1", "title": "t1", "image.url": "u1"}
+            assert len(rows) == 23
+
+            db = str(tmp_path / "vn.db")
+            for _ in range(2):
+                await export(client, query, SQLiteSink(db, "vn"), page_size=10)
+            conn = sqlite3.connect(db)
+            assert conn.execute("SELECT COUNT(*) FROM vn").fetchone() == (23,)
+
+
+@pytest.mark.asyncio
+async def test_parquet_sink(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            await export(client, select().frm("vn"), ParquetSink(str(tmp_path)), page_size=10)
+
+    assert sorted(i.name for i in tmp_path.iterdir())[0] == "part-00000.parquet"
+    assert pq.read_table(str(tmp_path)).num_rows == 23
+
+
+@pytest.mark.asyncio
+async def test_parquet_resume(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    ckpt = str(tmp_path / "vn.ckpt")
+    out = tmp_path / "parts"
+    rows = [{**row, "rating": None if i < 10 else i / 2} for i, row in enumerate(ROWS)]
+    query = select("rating").frm("vn")
+
+    async with FakeVNDB({"vn": rows}) as server:
+        async with Client(base_url=server.url) as client:
+            server.fail_after = 2
+            with pytest.raises(ServerDownError):
+                await export(client, query, ParquetSink(str(out)), ckpt, page_size=5)
+            # A part written before a crash, but not checkpointed.
+            part = (out / "part-00000.parquet").read_bytes()
+            (out / "part-00002.parquet").write_bytes(part)
+
+            server.fail_after = None
+            await export(client, query, ParquetSink(str(out)), ckpt, page_size=5)
+
+    table = pq.read_table(str(out))
+    assert table.column("id").to_pylist() == [i["id"] for i in rows]
+    assert table.column("rating").to_pylist() == [i["rating"] for i in rows]
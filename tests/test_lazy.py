@@ -0,0 +1,56 @@
+import pickle
+
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import Client, LazyResults, Node, Record, select
+from azaka.lazy import build_lazy_objects
+from azaka.utils import build_objects
+
+
+def rows() -> list[dict]:
+    return [
+        {"id": f"v{i}", "title": f"t{i}", "image": {"url": f"u{i}"}}
+        for i in range(1, 6)
+    ]
+
+
+def test_lazy_results() -> None:
+    raw = rows()
+    results = build_lazy_objects("vn", {"results": raw, "more": False}).results
+    assert isinstance(results, LazyResults) and results.rows is raw
+    assert len(results) == 5
+
+    record = results[1]
+    assert isinstance(record, Record)
+    assert record.title == "t2" and record.image is raw[1]["image"]
+    assert record[0] == "v2" and record._fields == ("id", "title", "image")
+    assert repr(record) == "VN(id='v2', title='t2', image={'url': 'u2'})"
+    with pytest.raises(AttributeError):
+        record.rating
+    with pytest.raises(AttributeError):
+        record.title = "x"
+
+    expected = build_objects("vn", {"results": rows()}).results
+    assert results.materialize() == expected
+    assert type(record.materialize()) is type(expected[1])
+    assert record == expected[1] and results[1] == record
+
+    assert [i.id for i in results[1:3]] == ["v2", "v3"]
+    odd = results.filter(lambda r: int(r.id[1:]) % 2 == 1)
+    assert [i.id for i in odd] == ["v1", "v3", "v5"] and odd.rows[0] is raw[0]
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+@pytest.mark.asyncio
+async def test_lazy_client() -> None:
+    async with FakeVNDB() as server:
+        async with Client(base_url=server.url, lazy_results=True) as client:
+            query = select("title", "image.url").frm("vn").where(Node("id") <= "v3")
+            resp = await client.execute(query)
+            assert isinstance(resp.results, LazyResults)
+            assert [i.image["url"] for i in resp.results] == [
+                "https://t.vndb.org/cv/01/1.jpg",
+                "https://t.vndb.org/cv/02/2.jpg",
+                "https://t.vndb.org/cv/03/3.jpg",
+            ]
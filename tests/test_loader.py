@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import Client, Loader
+
+ROWS = [{"id": f"v{i}", "title": f"t{i}"} for i in range(1, 26, 2)]
+
+
+@pytest.mark.asyncio
+async def test_loader() -> None:
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            loader = Loader(client, max_batch=10)
+
+            ids = [f"v{i}" for i in range(1, 26)]
+            rows = await asyncio.gather(*(loader.load("vn", i) for i in ids + ["V1"]))
+
+            assert len(server.bodies) == 3
+            assert server.bodies[0]["results"] == 100
+            assert [r and r.id for r in rows] == [
+                i if int(i[1:]) % 2 else None for i in ids
+            ] + ["v1"]
+
+            rows = await loader.load_many("vn", ["v3"], "title")
+            assert [r.id for r in rows] == ["v3"]  # type: ignore
+            assert server.bodies[-1]["filters"] == ["id", "=", "v3"]
+            assert server.bodies[-1]["fields"] == "id, title"
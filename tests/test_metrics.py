@@ -0,0 +1,60 @@
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import Client, Metrics, Node, OpenTelemetryHook, Span, select
+
+
+def test_prometheus() -> None:
+    metrics = Metrics(buckets=(0.1, 1))
+    metrics.inc("azaka_requests_total", route="vn", status=200)
+    metrics.inc("azaka_requests_total", 2, route="vn", status=200)
+    for i in (0.05, 0.5, 5):
+        metrics.observe("azaka_server_seconds", i, route='v"n')
+
+    assert metrics.counter("azaka_requests_total", route="vn", status=200) == 3
+    assert metrics.prometheus().splitlines() == [
+        "# TYPE azaka_requests_total counter",
+        'azaka_requests_total{route="vn",status="200"} 3',
+        "# TYPE azaka_server_seconds histogram",
+        'azaka_server_seconds_bucket{route="v\\"n",le="0.1"} 1',
+        'azaka_server_seconds_bucket{route="v\\"n",le="1"} 2',
+        'azaka_server_seconds_bucket{route="v\\"n",le="+Inf"} 3',
+        'azaka_server_seconds_sum{route="v\\"n"} 5.55',
+        'azaka_server_seconds_count{route="v\\"n"} 3',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_metrics() -> None:
+    spans: list[Span] = []
+    metrics = Metrics(hooks=[spans.append])
+
+    async with FakeVNDB(latency=0.01) as server:
+        async with Client(base_url=server.url, metrics=metrics) as client:
+            query = select("title").frm("vn").where(Node("id") <= "v5")
+            await client.execute(query)
+            await client.get_stats()
+
+    vn = [i for i in spans if i.attributes["route"] == "vn"]
+    assert [i.name for i in vn] == [
+        "connect",
+        "server",
+        "download",
+        "decode",
+        "build",
+        "execute",
+    ]
+    assert vn[1].duration >= 0.01 and vn[1].attributes["status"] == 200
+    assert vn[-1].duration >= sum(i.duration for i in vn[1:5])
+
+    assert metrics.counter("azaka_requests_total", route="vn", status=200) == 1
+    assert metrics.counter("azaka_requests_total", route="stats", status=200) == 1
+    assert metrics.counter("azaka_decode_rows_total", route="vn") == 5
+    assert metrics.counter("azaka_download_bytes_total", route="vn") > 0
+    assert metrics.counter("azaka_request_bytes_total", route="vn") > 0
+    assert metrics.histogram("azaka_server_seconds", route="stats").count == 1  # type: ignore
+
+
+def test_opentelemetry() -> None:
+    trace = pytest.importorskip("opentelemetry.trace")
+    OpenTelemetryHook(trace.get_tracer("test"))(Span("server", 0.0, 0.5))
@@ -0,0 +1,101 @@
+import pytest
+
+from fakevndb import FakeVNDB
+
+from azaka import AND, OR, Client, Mirror, Node, select
+
+ROWS = [
+    {
+        "id": f"v{i}",
+        "title": f"t{i:02}",
+        "olang": "ja" if i % 2 else "en",
+        "image": {"url": f"u{i}", "id": i},
+    }
+    for i in range(1, 31)
+]
+
+
+@pytest.mark.asyncio
+async def test_sync(tmp_path) -> None:
+    async with FakeVNDB({"vn": ROWS[:20]}) as server:
+        async with Client(base_url=server.url) as client:
+            mirror = Mirror(client, str(tmp_path / "vndb.db"))
+            assert await mirror.sync("vn", "title", "olang", "image.url", page_size=8) == 20
+            assert mirror.high_water_mark("vn") == "v20"
+            assert server.bodies[0]["fields"] == "id, title, olang, image.url"
+
+            server.routes["vn"] = ROWS
+            server.bodies.clear()
+            assert await mirror.sync("vn", "title", recent=5) == 15
+            assert server.bodies[0]["filters"] == ["id", ">", "v15"]
+            assert mirror.high_water_mark("vn") == "v30"
+            assert mirror.fields("vn") == {"id", "title"} and len(mirror) == 30
+
+
+@pytest.mark.asyncio
+async def test_execute(tmp_path) -> None:
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            mirror = Mirror(client, str(tmp_path / "vndb.db"))
+            await mirror.sync("vn", "title", "olang", "image.url", "image.id")
+
+    query = (
+        select("title", "image.url")
+        .frm("vn")
+        .where(AND(Node("id") >= "v9", Node("olang") == "ja"))
+    )
+    query.set_flags(count=True)
+    resp = mirror.execute(query)
+    assert [i.id for i in resp.results] == [f"v{i}" for i in range(9, 28, 2)]
+    assert resp.results[0].image == {"url": "u9"}
+    assert resp.more and resp.count == 11
+
+    query = (
+        select("title")
+        .frm("vn")
+        .where(OR(Node("id") == "v2", Node("title") == "t03"))
+        .sort("title")
+    )
+    query.set_flags(reverse=True)
+    assert [i.title for i in mirror.execute(query).results] == ["t03", "t02"]
+
+    query = select("title").frm("vn").where(Node("image") == (Node("id") >= "29"))
+    assert [i.title for i in mirror.execute(query).results] == ["t29", "t30"]
+
+
+@pytest.mark.asyncio
+async def test_fetch(tmp_path) -> None:
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            mirror = Mirror(client, str(tmp_path / "vndb.db"))
+
+            assert not mirror.is_synced("vn")
+            resp = await mirror.fetch(select().frm("vn"))
+            assert len(resp.results) == 10 and len(server.bodies) == 1
+
+            await mirror.sync("vn", "title")
+            server.bodies.clear()
+            query = select("title").frm("vn").where(Node("id") == "v3")
+            resp = await mirror.fetch(query)
+            assert [i.title for i in resp.results] == ["t03"] and not server.bodies
+
+            query = select("title").frm("vn").where(Node("search") == "t03")
+            await mirror.fetch(query)
+            assert server.bodies[-1]["filters"] == ["search", "=", "t03"]
+
+            query = select("title", "olang").frm("vn").where(Node("id") == "v3")
+            resp = await mirror.fetch(query)
+            assert resp.results[0].olang == "ja" and len(server.bodies) == 2
+
+            query = select("title").frm("vn").where(Node("olang") == "ja")
+            await mirror.fetch(query)
+            assert len(server.bodies) == 3
+
+            await mirror.sync("vn", "title", "image", recent=10)
+            assert mirror.fields("vn") == {"id", "title"}
+            await mirror.sync("vn", "title", "image", recent=30)
+            assert mirror.fields("vn") == {"id", "title", "image"}
+            server.bodies.clear()
+            query = select("title", "image.url").frm("vn").where(Node("id") == "v3")
+            resp = await mirror.fetch(query)
+            assert resp.results[0].image == {"url": "u3"} and not server.bodies
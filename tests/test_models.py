@@ -1,7 +1,5 @@
-import os
-
 import pytest
-from dotenv import load_dotenv
+from fakevndb import TOKEN, FakeVNDB, synthetic_users
 
 from azaka import Client
 from azaka.exceptions import InvalidAuthTokenError
@@ -9,60 +7,64 @@ from azaka.models import AuthInfo, Stats, User
 
 VALID_NAME = "Azaka"
 INVALID_NAME = "NoUserWithThisNameExists"
+USERS = {**synthetic_users(5), "u6": {"id": "u6", "username": VALID_NAME}}
 
 
 @pytest.mark.asyncio
 async def test_get_stats() -> None:
-    client = Client()
+    async with FakeVNDB() as server:
+        client = Client(base_url=server.url)
 
-    stats = await client.get_stats()
-    assert isinstance(stats, Stats)
+        stats = await client.get_stats()
+        assert isinstance(stats, Stats)
 
-    await client.close_cs()
+        await client.close_cs()
 
 
 @pytest.mark.asyncio
 async def test_get_user() -> None:
-    client = Client()
+    async with FakeVNDB(users=USERS) as server:
+        client = Client(base_url=server.url)
 
-    users = await client.get_user(VALID_NAME)
-    for u in users:
-        assert isinstance(u, User)
-        assert VALID_NAME == u.search_term
-        assert u.FOUND == True
+        users = await client.get_user(VALID_NAME)
+        for u in users:
+            assert isinstance(u, User)
+            assert VALID_NAME == u.search_term
+            assert u.FOUND == True
 
-    users = await client.get_user(INVALID_NAME)
-    for u in users:
-        assert isinstance(u, User)
-        assert INVALID_NAME == u.search_term
-        assert u.FOUND == False
+        users = await client.get_user(INVALID_NAME)
+        for u in users:
+            assert isinstance(u, User)
+            assert INVALID_NAME == u.search_term
+            assert u.FOUND == False
 
-    await client.close_cs()
+        await client.close_cs()
 
 
 @pytest.mark.asyncio
 async def test_get_auth_info() -> None:
-    load_dotenv()
-    client = Client(token=os.getenv("TOKEN"))
-    info = await client.get_auth_info()
-    assert isinstance(info, AuthInfo)
+    async with FakeVNDB() as server:
+        client = Client(token=TOKEN, base_url=server.url)
+        info = await client.get_auth_info()
+        assert isinstance(info, AuthInfo)
 
-    client.token = "faketoken"
-    with pytest.raises(InvalidAuthTokenError):
-        await client.get_auth_info()
+        client.token = "faketoken"
+        with pytest.raises(InvalidAuthTokenError):
+            await client.get_auth_info()
 
-    client.token = None
-    with pytest.raises(TypeError):
-        await client.get_auth_info()
+        client.token = None
+        with pytest.raises(TypeError):
+            await client.get_auth_info()
 
-    await client.close_cs()
+        await client.close_cs()
 
 
 @pytest.mark.asyncio
 async def test_get_schema() -> None:
-    client = Client()
+    async with FakeVNDB() as server:
+        client = Client(base_url=server.url)
 
-    schema = await client.get_schema()
-    assert isinstance(schema, dict)
+        schema = await client.get_schema()
+        assert isinstance(schema, dict)
 
-    await client.close_cs()
+        await client.close_cs()
@@ -0,0 +1,51 @@
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import AND, OR, Client, FilterOptimizer, Node, optimize_filters, select
+
+
+def test_optimize_filters() -> None:
+    a, b, c = Node("id") > "v1", Node("olang") == "ja", Node("lang") == "en"
+
+    assert optimize_filters(AND(a, AND(b, AND(c, a)), b)) == AND(a, b, c)
+    assert optimize_filters(OR(a, OR(b, a))) == OR(a, b)
+    assert optimize_filters(AND(a, OR(b, AND(c)))) == AND(a, OR(b, c))
+    assert optimize_filters(AND(AND(), a, OR(a))) == a
+    assert optimize_filters(OR(a, AND())) == []
+    assert optimize_filters(AND(OR(), AND())) == OR()
+    assert optimize_filters(AND(a, OR(), OR())) == AND(a, OR())
+    assert optimize_filters(OR(a, OR())) == a
+    assert optimize_filters(OR()) == OR()
+    assert optimize_filters(Node("release") == AND(a, AND(a))) == ["release", "=", a]
+
+
+@pytest.mark.asyncio
+async def test_filter_optimizer() -> None:
+    filters = AND(Node("olang") == "ja", AND(Node("olang") == "ja"))
+    async with FakeVNDB({"vn": [], "release": []}) as server:
+        optimizer = FilterOptimizer(hot=2)
+        async with Client(base_url=server.url, optimizer=optimizer) as client:
+            for _ in range(4):
+                await client.execute(select().frm("vn").where(filters))
+            await client.execute(select().frm("release").where(filters))
+
+    compact = server.bodies[2]["filters"]
+    assert isinstance(compact, str)
+    sent = [i["filters"] for i in server.bodies]
+    assert sent[:2] == [["olang", "=", "ja"]] * 2 and sent[2:4] == [compact] * 2
+    assert sent[4] == ["olang", "=", "ja"]
+    assert [i["compact_filters"] for i in server.bodies] == [0, 1, 0, 0, 0]
+    assert len(optimizer) == 1
+
+
+def test_filter_optimizer_bounds() -> None:
+    optimizer = FilterOptimizer(hot=1, maxsize=2)
+    for i in range(3):
+        query = optimizer.prepare(select().frm("vn").where(Node("id") == f"v{i}"))
+        optimizer.learn(query, {"compact_filters": f"c{i}"})
+    assert len(optimizer) == 2
+
+    query = select().frm("vn")
+    assert optimizer.prepare(query) is query
+    with pytest.raises(ValueError):
+        FilterOptimizer(hot=-1)
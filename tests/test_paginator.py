@@ -1,22 +1,133 @@
+import asyncio
+
 import pytest
+from fakevndb import FakeVNDB
 
-from azaka import Client, Node, Paginator, select
+from azaka import Client, CursorPaginator, Node, Paginator, Response, select
 
 MAX_RESULTS = 2
 EXIT_AFTER = 3
+IDS = [f"v{i}" for i in range(1, 26)]
+ROWS = [{"id": i, "title": f"t{i}", "olang": "en"} for i in IDS]
 
 
 @pytest.mark.asyncio
 async def test_paginator() -> None:
     query = select("id", "title").frm("vn").where(Node("olang") == "en")
     response_counter = 0
-    async with Client() as client:
-        paginator = Paginator(
-            client, query=query, max_results_per_page=MAX_RESULTS, exit_after=EXIT_AFTER
-        )
-        async for page in paginator:
-            for vn in page.results:
-                assert len(vn) == MAX_RESULTS
-
-            response_counter += 1
-        assert response_counter == EXIT_AFTER
+    async with FakeVNDB() as server:
+        async with Client(base_url=server.url) as client:
+            paginator = Paginator(
+                client, query=query, max_results_per_page=MAX_RESULTS, exit_after=EXIT_AFTER
+            )
+            async for page in paginator:
+                for vn in page.results:
+                    assert len(vn) == MAX_RESULTS
+
+                response_counter += 1
+            assert response_counter == EXIT_AFTER
+
+
+def ids(pages: list[Response]) -> list[str]:
+    return [r.id for p in pages for r in p.results]
+
+
+@pytest.mark.asyncio
+async def test_concurrent() -> None:
+    async with FakeVNDB({"vn": ROWS}, latency=0.002, jitter=0.003) as server:
+        async with Client(base_url=server.url) as client:
+            paginator = Paginator(client, query=select().frm("vn"), max_results_per_page=2)
+            pages = [i async for i in paginator.concurrent(limit=3)]
+
+            assert ids(pages) == IDS
+            assert server.peak == 3
+            assert paginator.current() is pages[-1]
+
+            paginator = Paginator(client, query=select().frm("vn"), max_results_per_page=2)
+            pages = [i async for i in paginator.concurrent(limit=3, ordered=False)]
+            assert sorted(ids(pages)) == sorted(IDS)
+            assert ids([paginator.current()]) == ["v25"]  # type: ignore
+            assert await paginator.next() is None
+            assert ids([await paginator.previous()]) == IDS[22:24]  # type: ignore
+
+            paginator = Paginator(
+                client, query=select().frm("vn"), max_results_per_page=2, exit_after=EXIT_AFTER
+            )
+            pages = [i async for i in paginator.concurrent()]
+            assert ids(pages) == IDS[: 2 * EXIT_AFTER]
+
+            with pytest.raises(ValueError):
+                [i async for i in paginator.concurrent(limit=0)]
+
+            query = select().frm("vn").freeze()
+            paginator = Paginator(client, query=query, max_results_per_page=2)
+            pages = [i async for i in paginator.concurrent(limit=3)]
+            assert len(pages) == 13 and ids(pages) == IDS
+            assert not query._body["count"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_paginator() -> None:
+    async with FakeVNDB({"vn": ROWS}) as server:
+        async with Client(base_url=server.url) as client:
+            query = select().frm("vn").where(Node("olang") == "en")
+            paginator = CursorPaginator(client, query=query, max_results_per_page=4)
+            pages = await paginator.flatten()
+
+            assert ids(pages) == IDS
+            assert paginator.query._body["filters"] == ["and", ["olang", "=", "en"], ["id", ">", "v24"]]
+
+            paginator = CursorPaginator(client, query=query, max_results_per_page=4, exit_after=2)
+            pages = await paginator.flatten()
+            assert ids(pages) == IDS[:8]
+            assert paginator.cursor == "v8"
+            assert ids([await paginator.previous()]) == IDS[:4]  # type: ignore
+
+            paginator = CursorPaginator(client, query=query, max_results_per_page=4, cursor="v8")
+            assert ids(await paginator.flatten()) == IDS[8:]
+
+            query.set_flags(reverse=True)
+            paginator = CursorPaginator(client, query=query, max_results_per_page=4, cursor="v8")
+            assert ids(await paginator.flatten()) == IDS[:7][::-1]
+
+            paginator = CursorPaginator(client, query=select().frm("vn"), max_results_per_page=4, exit_after=5)
+            pages = [i async for i in paginator.concurrent(limit=2)]
+            assert ids(pages) == IDS[:20]
+            assert paginator.cursor == "v20"
+
+
+@pytest.mark.asyncio
+async def test_prefetch() -> None:
+    async with FakeVNDB({"vn": ROWS}, latency=0.002) as server:
+        async with Client(base_url=server.url) as client:
+            paginator = Paginator(client, query=select().frm("vn"), max_results_per_page=2, prefetch=3)
+            pages = await paginator.flatten()
+
+            assert ids(pages) == IDS
+            assert server.peak == 3
+            assert paginator.current() is pages[-1]
+            assert ids([await paginator.previous()]) == IDS[22:24]  # type: ignore
+
+            sent = sum(server.requests.values())
+            paginator = Paginator(client, query=select().frm("vn"), max_results_per_page=2, prefetch=2)
+            async for page in paginator:
+                if page.results[0].id == "v5":
+                    break
+            await asyncio.sleep(0.05)
+            # 3 pages consumed, at most 2 queued and 2 in flight when the loop stopped.
+            assert sum(server.requests.values()) - sent <= 7
+            assert ids([await paginator.next()]) == ["v7", "v8"]  # type: ignore
+
+            paginator = Paginator(
+                client, query=select().frm("vn"), max_results_per_page=2, exit_after=EXIT_AFTER, prefetch=4
+            )
+            assert ids(await paginator.flatten()) == IDS[: 2 * EXIT_AFTER]
+
+            query = select().frm("vn").where(Node("olang") == "en")
+            paginator = CursorPaginator(client, query=query, max_results_per_page=4, prefetch=2)
+            assert ids(await paginator.flatten()) == IDS
+            assert paginator.cursor == "v25" and len(paginator._cursors) == 7
+            assert ids([await paginator.previous()]) == IDS[20:24]  # type: ignore
+
+            with pytest.raises(ValueError):
+                Paginator(client, query=select().frm("vn"), max_results_per_page=2, prefetch=-1)
@@ -0,0 +1,53 @@
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import Client, Planner, select
+
+ROWS = [
+    {
+        "id": f"v{i}",
+        "title": f"t{i}",
+        "released": "2020-01-01",
+        "image": {"url": f"u{i}", "sexual": 0},
+        "tags": [{"name": "a"}],
+    }
+    for i in range(1, 6)
+]
+
+
+def test_plan() -> None:
+    planner = Planner(Client(), groups=[("tags.name",)], max_fields=2)
+    query = select("title", "image.url", "image.sexual", "released", "tags.name")
+    fields = [i._body["fields"] for i in planner.plan(query.frm("vn"))]
+    assert fields == [
+        "id, tags.name",
+        "id, title",
+        "id, image.url, image.sexual",
+        "id, released",
+    ]
+    assert planner.plan(select().frm("vn"))[0]._body["fields"] == "id"
+
+    planner = Planner(Client(), groups=[("released", "title", "image.sexual", "tags")])
+    fields = [i._body["fields"] for i in planner.plan(query.frm("vn"))]
+    assert fields == ["id, released, title, image.url, image.sexual, tags.name"]
+
+    with pytest.raises(ValueError):
+        Planner(Client(), max_fields=0)
+
+
+@pytest.mark.asyncio
+async def test_execute() -> None:
+    async with FakeVNDB({"vn": ROWS}, latency=0.01) as server:
+        async with Client(base_url=server.url) as client:
+            planner = Planner(client, max_fields=1)
+            query = select("title", "image.url", "tags.name").frm("vn")
+            query._body["results"] = 4
+            query.set_flags(count=True)
+            resp = await planner.execute(query)
+
+    assert len(server.bodies) == 3 and server.peak == 3
+    assert resp.results[0]._fields == ("id", "title", "image", "tags")
+    assert [i.id for i in resp.results] == [f"v{i}" for i in range(1, 5)]
+    assert resp.results[1].image == {"url": "u2"} and resp.results[1].title == "t2"
+    assert resp.more and resp.count == 5
+    assert set(planner.latencies) == {"id, title", "id, image.url", "id, tags.name"}
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import ClientPool, Node, Paginator, RateLimiter, ThrottledError, select
+
+
+@pytest.mark.asyncio
+async def test_pool() -> None:
+    async with FakeVNDB(latency=0.005) as server:
+        async with ClientPool(["a", "b", "c"], base_url=server.url) as pool:
+            query = select().frm("vn").where(Node("id") <= "v9")
+            await asyncio.gather(
+                *(pool.execute(query._derive(page=i)) for i in range(1, 10))
+            )
+            assert sorted(server.tokens.values()) == [3, 3, 3]
+
+            pages = await Paginator(pool, select().frm("vn"), 100, exit_after=4).flatten()  # type: ignore
+            assert len(pages) == 4
+            users = await pool.get_user("u1")
+            assert users[0].FOUND
+
+
+@pytest.mark.asyncio
+async def test_pool_throttled() -> None:
+    async with FakeVNDB() as server:
+        server.throttled.add("a")
+        async with ClientPool(
+            ["a", "b"], requests=100_000, window=1, base_url=server.url, cooldown=0.05
+        ) as pool:
+            for _ in range(4):
+                assert (await pool.execute(select().frm("vn"))).results
+            assert server.tokens == {"a": 1, "b": 4} and pool.available == 1
+
+            await asyncio.sleep(0.06)
+            assert pool.available == 2
+            server.throttled = {"b"}
+            await pool.execute(select().frm("vn"))
+            assert server.tokens == {"a": 2, "b": 5}
+            assert pool._strikes == [0, 1] and pool.available == 1
+
+            server.throttled = {"a", "b"}
+            with pytest.raises(ThrottledError):
+                await pool.execute(select().frm("vn"))
+
+    with pytest.raises(ValueError):
+        ClientPool([])
+    with pytest.raises(ValueError):
+        ClientPool(["a"], rate_limiter=RateLimiter())
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from azaka import FrozenQuery, Node, Paginator, select
+
+
+def test_frozen_query() -> None:
+    query = select("title").frm("vn").freeze()
+    english = query.where(Node("olang") == "en").sort("title")
+    assert english is not query and query._body["filters"] == []
+
+    with pytest.raises(AttributeError):
+        english._route = "release"  # type: ignore
+    with pytest.raises(TypeError):
+        english._body["page"] = 2  # type: ignore
+
+    same = select("title").frm("vn").where(Node("olang") == "en").sort("title")
+    assert english == same.freeze() and hash(english) == hash(same.freeze())
+    assert len({english, same.freeze(), query}) == 2
+
+    page = english.with_page(3, results=50)
+    assert isinstance(page, FrozenQuery) and english._body["page"] == 1
+    assert json.loads(page.parse_body)["page"] == 3
+    assert page.parse_body is page.parse_body
+    assert english.set_flags(count=True)._body["count"]
+
+
+def test_freeze_copies_filters() -> None:
+    filters = Node("id") > "v1"
+    query = select().frm("vn").where(filters)
+    frozen = query.freeze()
+    filters[2] = "v2"
+    assert frozen._body["filters"] == ["id", ">", "v1"]
+
+    key, body = frozen.key, frozen.parse_body
+    query._body["filters"].append(["olang", "=", "en"])
+    assert frozen._body["filters"] == ["id", ">", "v1"]
+    assert frozen.key == key and frozen.parse_body == body
+
+    page = frozen.with_page(2)
+    page._body["filters"][2] = "v2"
+    assert frozen._body["filters"] == ["id", ">", "v1"] and frozen.key == key
+
+
+def test_paginator_derives_queries() -> None:
+    query = select().frm("vn").freeze()
+    paginator = Paginator(None, query, 25)  # type: ignore
+    paginator._advance("v1")
+    assert query._body["results"] == 10 and query._body["page"] == 1
+    assert paginator.query._body["results"] == 25 and paginator.query._body["page"] == 2
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from azaka import RateLimiter
+
+
+class FakeResponse:
+    def __init__(self, status: int) -> None:
+        self.status = status
+        self.headers: dict[str, str] = {}
+
+    def release(self) -> None:
+        pass
+
+
+def sender(*statuses: int):
+    responses = iter(statuses)
+
+    async def send() -> FakeResponse:
+        await asyncio.sleep(0)
+        return FakeResponse(next(responses))
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_token_bucket() -> None:
+    limiter = RateLimiter(requests=2, window=0.1)
+    for _ in range(3):
+        await limiter.run(sender(200))  # type: ignore
+
+    assert limiter.tokens < 1
+    assert limiter.waiting == limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_backoff() -> None:
+    limiter = RateLimiter(requests=100, window=1, base_delay=0.001, max_retries=2)
+
+    resp = await limiter.run(sender(429, 502, 200))  # type: ignore
+    assert resp.status == 200
+    assert limiter.rate < 100
+
+    resp = await limiter.run(sender(429, 429, 429, 200))  # type: ignore
+    assert resp.status == 429
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency() -> None:
+    limiter = RateLimiter(requests=100, window=1, max_concurrency=2)
+    peak = 0
+
+    async def send() -> FakeResponse:
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.001)
+        return FakeResponse(200)
+
+    await asyncio.gather(*(limiter.run(send) for _ in range(6)))  # type: ignore
+    assert peak == 2
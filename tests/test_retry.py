@@ -0,0 +1,113 @@
+import asyncio
+
+import aiohttp
+import pytest
+from fakevndb import FakeVNDB
+
+from azaka import (
+    Client,
+    InvalidRequestBodyError,
+    RateLimiter,
+    RetryPolicy,
+    ServerDownError,
+    ServerError,
+    select,
+)
+
+
+@pytest.mark.asyncio
+async def test_retry() -> None:
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    errors = [ServerError("oops"), aiohttp.ServerDisconnectedError()]
+
+    async def flaky() -> str:
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert await policy.run(flaky) == "ok" and policy.retries == 2
+
+    calls = 0
+
+    async def invalid() -> str:
+        nonlocal calls
+        calls += 1
+        raise InvalidRequestBodyError("bad")
+
+    with pytest.raises(InvalidRequestBodyError):
+        await policy.run(invalid)
+    assert calls == 1
+
+    async def down() -> str:
+        nonlocal calls
+        calls += 1
+        raise ServerDownError("down")
+
+    calls = 0
+    with pytest.raises(ServerDownError):
+        await policy.run(down)
+    assert calls == 3
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_hedge() -> None:
+    policy = RetryPolicy(hedge=True, hedge_percentile=50, min_samples=4)
+    delays = [0.001, 0.001, 0.001, 0.001, 0.2, 0.001]
+    cancelled = 0
+
+    async def send() -> float:
+        nonlocal cancelled
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return delay
+
+    for _ in range(4):
+        await policy.run(send)
+    assert policy.threshold() is not None and policy.hedges == 0
+
+    assert await policy.run(send) == 0.001
+    await asyncio.sleep(0)
+    assert policy.hedges == 1 and cancelled == 1
+
+    delays[:] = [0.05]
+    assert await policy.run(send, idempotent=False) == 0.05
+    assert policy.hedges == 1
+
+
+@pytest.mark.asyncio
+async def test_client_retry() -> None:
+    async with FakeVNDB(error_rate=0.5, seed=3) as server:
+        policy = RetryPolicy(max_attempts=10, base_delay=0.001)
+        async with Client(base_url=server.url, retry=policy) as client:
+            for _ in range(5):
+                assert (await client.execute(select().frm("vn"))).results
+            assert (await client.get_stats()).vn == 1000
+        assert policy.retries == server.faults[502] > 0
+
+
+@pytest.mark.asyncio
+async def test_retry_layers() -> None:
+    async with FakeVNDB(error_rate=1) as server:
+        limiter = RateLimiter(100_000, 1, max_retries=3, base_delay=0.001)
+        policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+        async with Client(
+            base_url=server.url, rate_limiter=limiter, retry=policy
+        ) as client:
+            with pytest.raises(ServerDownError):
+                await client.get_stats()
+        assert server.faults[502] == 4 and policy.retries == 0
+
+        limiter = RateLimiter(100_000, 1, max_retries=0)
+        async with Client(
+            base_url=server.url, rate_limiter=limiter, retry=policy
+        ) as client:
+            with pytest.raises(ServerDownError):
+                await client.get_stats()
+        assert server.faults[502] == 7 and policy.retries == 2
@@ -0,0 +1,66 @@
+import pytest
+from fakevndb import TOKEN, FakeVNDB
+
+from azaka import (
+    Client,
+    InvalidAuthTokenError,
+    Node,
+    Paginator,
+    RateLimiter,
+    ServerDownError,
+    select,
+)
+
+
+@pytest.mark.asyncio
+async def test_endpoints() -> None:
+    async with FakeVNDB() as server:
+        async with Client(TOKEN, base_url=server.url, use_decoders=True) as client:
+            query = select("title", "image.url").frm("vn").where(Node("id") <= "v3")
+            query.set_flags(count=True, normalized_filters=True)
+            resp = await client.execute(query)
+            assert [i.id for i in resp.results] == ["v1", "v2", "v3"]
+            assert resp.results[0].image.url.endswith("/1.jpg")
+            assert resp.count == 3 and resp.normalized_filters == ["id", "<=", "v3"]
+
+            users = await client.get_user(
+                "u1", "USER2", "nobody", fields=["lengthvotes"]
+            )
+            assert [u.FOUND for u in users] == [True, True, False]
+            assert users[1].id == "u2" and users[0].lengthvotes == 1
+
+            assert (await client.get_stats()).vn == 1000
+            assert (await client.get_auth_info()).username == "user1"
+
+        async with Client("wrong", base_url=server.url) as client:
+            with pytest.raises(InvalidAuthTokenError):
+                await client.get_auth_info()
+
+
+@pytest.mark.asyncio
+async def test_paginator() -> None:
+    async with FakeVNDB(latency=0.001) as server:
+        async with Client(base_url=server.url) as client:
+            query = select().frm("vn").where(Node("id") > "v950")
+            pages = await Paginator(client, query, 20, prefetch=2).flatten()
+            assert [i.id for p in pages for i in p.results] == [
+                f"v{i}" for i in range(951, 1001)
+            ]
+
+
+@pytest.mark.asyncio
+async def test_faults() -> None:
+    async with FakeVNDB(throttle_rate=0.3, error_rate=0.2, seed=1) as server:
+        limiter = RateLimiter(
+            requests=100_000, window=1, max_retries=10, base_delay=0.001
+        )
+        async with Client(base_url=server.url, rate_limiter=limiter) as client:
+            for i in range(1, 11):
+                query = select().frm("vn").where(Node("id") == f"v{i}")
+                assert (await client.execute(query)).results[0].id == f"v{i}"
+        assert server.faults[429] and server.faults[502]
+
+    async with FakeVNDB(error_rate=1) as server:
+        async with Client(base_url=server.url) as client:
+            with pytest.raises(ServerDownError):
+                await client.get_stats()
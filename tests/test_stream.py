@@ -0,0 +1,96 @@
+import json
+import random
+
+import pytest
+
+from azaka import Client, CursorPaginator, Paginator, RowSplitter, select
+
+PAYLOAD = {
+    "more": True,
+    "results": [
+        {"id": f"v{i}", "title": 'a "quoted" ]}{[ \\' * (i % 3), "image": {"url": "}"}}
+        for i in range(1, 51)
+    ],
+    "count": 50,
+    "normalized_filters": ["and", ["id", ">", "v1"]],
+}
+
+
+def test_row_splitter() -> None:
+    body = json.dumps(PAYLOAD).encode()
+    rng = random.Random(0)
+
+    for _ in range(50):
+        splitter = RowSplitter()
+        rows = []
+        pos = 0
+        while pos < len(body):
+            size = rng.randint(1, 64)
+            rows += splitter.feed(body[pos : pos + size])
+            pos += size
+
+        assert [json.loads(i) for i in rows] == PAYLOAD["results"]
+        assert splitter.finish() == {**PAYLOAD, "results": []}
+
+    splitter = RowSplitter()
+    splitter.feed(body[:-10])
+    with pytest.raises(ValueError):
+        splitter.finish()
+
+
+class FakeContent:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def iter_any(self):  # type: ignore
+        for i in range(0, len(self.body), 100):
+            yield self.body[i : i + 100]
+
+
+class FakeResponse:
+    status = 200
+    content_type = "application/json"
+
+    def __init__(self, body: bytes) -> None:
+        self.content = FakeContent(body)
+
+    def release(self) -> None:
+        pass
+
+
+class StreamingClient(Client):
+    __slots__ = ("pages",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages = 0
+
+    async def _request(self, url, post=False, data=None, headers=None):  # type: ignore
+        body = json.loads(data)
+        self.pages += 1
+        rows = PAYLOAD["results"]
+        if body["filters"]:
+            after = int(body["filters"][2][1:])
+            rows = [r for r in rows if int(r["id"][1:]) > after]
+        rows = rows[(body["page"] - 1) * 20 :][:20]
+        return FakeResponse(
+            json.dumps({"results": rows, "more": len(rows) == 20}).encode()
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_rows() -> None:
+    client = StreamingClient()
+    stream = client.iter_rows(select("title", "image.url").frm("vn"))
+    rows = [i async for i in stream]
+
+    assert [i.id for i in rows] == [f"v{i}" for i in range(1, 21)]
+    assert rows[0].image == {"url": "}"}
+    assert stream.more
+
+    paginator = Paginator(client, query=select().frm("vn"), max_results_per_page=20)  # type: ignore
+    assert len([i async for i in paginator.rows()]) == 50
+
+    paginator = CursorPaginator(client, query=select().frm("vn"), max_results_per_page=20)  # type: ignore
+    assert [i.id async for i in paginator.rows()] == [f"v{i}" for i in range(1, 51)]
+    assert paginator.query._body["filters"] == ["id", ">", "v40"]
@@ -0,0 +1,29 @@
+from azaka.models import Response
+from azaka.utils import TypeCache, build_objects
+
+
+def test_type_cache() -> None:
+    cache = TypeCache(maxsize=2)
+
+    vn = cache.get("VN", ("id", "title"))
+    assert cache.get("VN", ("id", "title")) is vn
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.get("VN", ("title", "id")) is not vn
+    cache.get("RELEASE", ("id",))
+    assert len(cache) == 2
+    assert cache.get("VN", ("id", "title")) is not vn
+
+
+def test_build_objects() -> None:
+    json = {
+        "results": [{"id": "v1", "title": "a"}, {"id": "v2", "title": "b"}],
+        "more": False,
+        "count": 2,
+    }
+    resp = build_objects("vn", json)
+
+    assert isinstance(resp, Response)
+    assert type(resp.results[0]) is type(resp.results[1])
+    assert type(resp.results[0]).__name__ == "VN"
+    assert resp.results[1].title == "b"